@@ -0,0 +1,152 @@
+"""
+Shared API clients for the agents.
+
+Agents are created per session (they carry the session logger and rate
+limiter), but the underlying SDK clients are stateless and thread-safe, so
+one instance per API key is reused across sessions. This keeps the HTTP
+connection pools warm instead of rebuilding them for every stream.
+
+With LLM_CACHE enabled, both clients are wrapped so identical requests
+(same model, prompts, parameters / same search) are answered from disk.
+
+Callers check ANTHROPIC_AVAILABLE / TAVILY_AVAILABLE before calling these.
+"""
+
+import os
+import json
+import hashlib
+import logging
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional
+
+from config.settings import LLM_CACHE
+
+logger = logging.getLogger("debategraph.clients")
+
+
+@lru_cache(maxsize=4)
+def get_anthropic_client(api_key: str):
+    """Anthropic client shared by all agents using this key."""
+    import anthropic
+    client = anthropic.Anthropic(api_key=api_key)
+    cache_dir = _cache_dir()
+    return _CachedAnthropic(client, cache_dir) if cache_dir else client
+
+
+@lru_cache(maxsize=4)
+def get_tavily_client(api_key: str):
+    """Tavily search client shared by all researchers using this key."""
+    from tavily import TavilyClient
+    client = TavilyClient(api_key=api_key)
+    cache_dir = _cache_dir()
+    return _CachedTavily(client, cache_dir) if cache_dir else client
+
+
+def cached_prefix_content(instructions: str, data: str) -> list[dict]:
+    """
+    User message content for Anthropic prompt caching: the static
+    instructions are marked as the end of a cacheable prefix (system prompt +
+    instructions), followed by the per-call data. Prefixes below the model's
+    minimum cacheable length are simply sent uncached.
+    """
+    return [
+        {"type": "text", "text": instructions, "cache_control": {"type": "ephemeral"}},
+        {"type": "text", "text": data},
+    ]
+
+
+def usage_dict(message) -> Optional[dict]:
+    """Token usage of an Anthropic response, including prompt-cache reads/writes."""
+    usage = getattr(message, "usage", None)
+    if not usage:
+        return None
+    return {
+        "input_tokens": getattr(usage, "input_tokens", None),
+        "output_tokens": getattr(usage, "output_tokens", None),
+        "cache_read_input_tokens": getattr(usage, "cache_read_input_tokens", None),
+        "cache_creation_input_tokens": getattr(usage, "cache_creation_input_tokens", None),
+    }
+
+
+# ─── Response cache ──────────────────────────────────────────────────────────
+
+def _cache_dir() -> Optional[Path]:
+    if not LLM_CACHE or LLM_CACHE == "off":
+        return None
+    if LLM_CACHE == "default":
+        return Path.home() / ".debategraph" / "cache" / "llm"
+    return Path(LLM_CACHE)
+
+
+def _cache_path(cache_dir: Path, kind: str, request: dict) -> Path:
+    key = json.dumps(request, sort_keys=True, ensure_ascii=False, default=str)
+    digest = hashlib.blake2b(f"{kind}|{key}".encode("utf-8"), digest_size=20).hexdigest()
+    return cache_dir / kind / f"{digest}.json"
+
+
+def _write_atomic(path: Path, text: str) -> None:
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(text, encoding="utf-8")
+        os.replace(tmp, path)
+    except OSError as e:
+        logger.warning(f"Could not write LLM cache entry {path.name}: {e}")
+
+
+class _CachedMessages:
+    """messages.create() answered from disk for requests seen before."""
+
+    def __init__(self, messages, cache_dir: Path):
+        self._messages = messages
+        self._cache_dir = cache_dir
+
+    def create(self, **kwargs):
+        from anthropic.types import Message
+
+        path = _cache_path(self._cache_dir, "anthropic", kwargs)
+        if path.exists():
+            try:
+                return Message.model_validate_json(path.read_bytes())
+            except Exception as e:
+                logger.warning(f"Ignoring unreadable LLM cache entry {path.name}: {e}")
+        message = self._messages.create(**kwargs)
+        _write_atomic(path, message.model_dump_json())
+        return message
+
+    def __getattr__(self, name):
+        return getattr(self._messages, name)
+
+
+class _CachedAnthropic:
+    """Anthropic client whose messages.create() goes through the response cache."""
+
+    def __init__(self, client, cache_dir: Path):
+        self._client = client
+        self.messages = _CachedMessages(client.messages, cache_dir)
+
+    def __getattr__(self, name):
+        return getattr(self._client, name)
+
+
+class _CachedTavily:
+    """Tavily client whose search() goes through the response cache."""
+
+    def __init__(self, client, cache_dir: Path):
+        self._client = client
+        self._cache_dir = cache_dir
+
+    def search(self, **kwargs) -> dict:
+        path = _cache_path(self._cache_dir, "tavily", kwargs)
+        if path.exists():
+            try:
+                return json.loads(path.read_bytes())
+            except ValueError as e:
+                logger.warning(f"Ignoring unreadable search cache entry {path.name}: {e}")
+        response = self._client.search(**kwargs)
+        _write_atomic(path, json.dumps(response, ensure_ascii=False))
+        return response
+
+    def __getattr__(self, name):
+        return getattr(self._client, name)
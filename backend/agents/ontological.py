@@ -12,12 +12,13 @@ Falls back to rule-based extraction if the API is unavailable.
 """
 
 import os
+import sys
 import json
 import time
 import uuid
 import asyncio
 import logging
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, AsyncIterator, Callable, Optional
 
 from api.models.schemas import (
     Claim,
@@ -28,15 +29,18 @@ from api.models.schemas import (
     TranscriptionSegment,
 )
 from graph.store import DebateGraphStore
+from agents.clients import cached_prefix_content, get_anthropic_client, usage_dict
 from config.settings import (
     LLM_MODEL,
     LLM_MODEL_FALLBACK,
     LLM_MAX_TOKENS_EXTRACTION,
     LLM_TEMPERATURE,
     CHUNK_SIZE,
+    CHUNK_MAX_WORDS,
     MAX_CONCURRENT_LLM_CALLS,
     ONTOLOGICAL_SYSTEM_PROMPT,
     ONTOLOGICAL_EXTRACTION_PROMPT,
+    ONTOLOGICAL_EXTRACTION_INPUT,
 )
 
 if TYPE_CHECKING:
@@ -65,7 +69,7 @@ class OntologicalAgent:
         if ANTHROPIC_AVAILABLE:
             api_key = os.getenv("ANTHROPIC_API_KEY", "")
             if api_key:
-                self.client = anthropic.Anthropic(api_key=api_key)
+                self.client = get_anthropic_client(api_key)
                 logger.info(f"Ontological Agent initialized with model: {self.model}")
             else:
                 logger.warning("ANTHROPIC_API_KEY not set. Using rule-based extraction.")
@@ -74,20 +78,123 @@ class OntologicalAgent:
         self,
         transcription: TranscriptionResult,
         graph_store: DebateGraphStore,
+        on_claims: Optional[Callable[[list[Claim]], None]] = None,
     ) -> None:
         """
         Main entry point: extract claims from transcription and build the graph.
         Processes segments in chunks for parallel LLM calls.
+
+        on_claims, if given, is called with each chunk's new claims as soon
+        as that chunk is done, so later stages can start on them early.
         """
+        report = self._new_claims_reporter(graph_store, on_claims)
         if self.client:
-            await self._extract_with_llm_chunked(transcription, graph_store)
+            await self._extract_with_llm_chunked(transcription, graph_store, report)
         else:
             self._extract_rule_based(transcription, graph_store)
+            report()
 
         logger.info(
             f"Graph built: {graph_store.num_nodes} nodes, {graph_store.num_edges} edges"
         )
 
+    async def extract_and_build_streaming(
+        self,
+        segment_batches: AsyncIterator[list[TranscriptionSegment]],
+        graph_store: DebateGraphStore,
+        on_claims: Optional[Callable[[list[Claim]], None]] = None,
+    ) -> list[TranscriptionSegment]:
+        """
+        extract_and_build() fed by an async stream of segment batches (e.g.
+        iter_transcribe_audio()). Each CHUNK_SIZE group of segments is sent
+        for extraction as soon as it fills, while later audio is still being
+        transcribed. Returns every segment received, in order.
+
+        on_claims, if given, is called with the claims of each extraction
+        chunk as soon as that chunk is done (see extract_and_build).
+        """
+        all_segments: list[TranscriptionSegment] = []
+        pending: list[TranscriptionSegment] = []
+        tasks: list[asyncio.Task] = []
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_LLM_CALLS)
+
+        report = self._new_claims_reporter(graph_store, on_claims)
+
+        async def process_with_semaphore(chunk, idx):
+            async with semaphore:
+                await self._extract_chunk(chunk, graph_store, chunk_idx=idx)
+            report()
+
+        def dispatch(chunk):
+            tasks.append(asyncio.create_task(process_with_semaphore(chunk, len(tasks))))
+
+        try:
+            async for batch in segment_batches:
+                all_segments.extend(batch)
+                if not self.client:
+                    continue
+                pending.extend(self._filter_segments(batch))
+                while n := self._full_batch_len(pending):
+                    dispatch(pending[:n])
+                    del pending[:n]
+            if pending:
+                dispatch(pending)
+            await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+
+        if not self.client:
+            logger.info("Using rule-based claim extraction")
+            self._extract_rule_based_segments(all_segments, graph_store, 0)
+            report()
+        elif len(tasks) > 1:
+            # After all chunks, do a relation-linking pass across chunks
+            await self._link_cross_chunk_relations(graph_store)
+
+        logger.info(
+            f"Graph built: {graph_store.num_nodes} nodes, {graph_store.num_edges} edges"
+        )
+        return all_segments
+
+    def _new_claims_reporter(
+        self,
+        graph_store: DebateGraphStore,
+        on_claims: Optional[Callable[[list[Claim]], None]],
+    ) -> Callable[[], None]:
+        """
+        Returns a callback that passes the claims added to graph_store since
+        its previous call to on_claims (chunks finish in any order, so the
+        graph's insertion order is used rather than per-chunk bookkeeping).
+        """
+        seen = graph_store.num_claims
+
+        def report() -> None:
+            nonlocal seen
+            if on_claims is None:
+                return
+            new_claims = graph_store.claims_since(seen)
+            seen = graph_store.num_claims
+            if new_claims:
+                on_claims(new_claims)
+
+        return report
+
+    def _full_batch_len(self, segments: list) -> int:
+        """
+        Length of the first full extraction batch in segments: CHUNK_SIZE
+        segments or CHUNK_MAX_WORDS words, whichever comes first. 0 if the
+        segments don't fill a batch yet. Segments are whole speaker turns, so
+        a batch never splits one.
+        """
+        words = 0
+        for i, seg in enumerate(segments):
+            words += len(seg.text.split())
+            if i + 1 >= CHUNK_SIZE or words >= CHUNK_MAX_WORDS:
+                return i + 1
+        return 0
+
     def _filter_segments(self, segments: list) -> list:
         """Filter out noise segments (single words, fillers, very short fragments)."""
         FILLER_WORDS = {
@@ -116,30 +223,37 @@ class OntologicalAgent:
         self,
         transcription: TranscriptionResult,
         graph_store: DebateGraphStore,
+        report: Callable[[], None],
     ) -> None:
         """Extract claims using Claude API, processing in parallel chunks."""
         # Filter noise segments before processing
         segments = self._filter_segments(transcription.segments)
         
-        if len(segments) <= CHUNK_SIZE:
-            # Small enough to process in one call
-            await self._extract_chunk(segments, graph_store, chunk_idx=0)
-            return
-
         # Split into chunks
         chunks = []
-        for i in range(0, len(segments), CHUNK_SIZE):
-            chunks.append(segments[i:i + CHUNK_SIZE])
+        while n := self._full_batch_len(segments):
+            chunks.append(segments[:n])
+            segments = segments[n:]
+        if segments:
+            chunks.append(segments)
+
+        if len(chunks) <= 1:
+            # Small enough to process in one call
+            await self._extract_chunk(chunks[0] if chunks else [], graph_store, chunk_idx=0)
+            report()
+            return
         
-        logger.info(f"Processing {len(segments)} segments in {len(chunks)} chunks "
-                     f"(chunk_size={CHUNK_SIZE}, max_concurrent={MAX_CONCURRENT_LLM_CALLS})")
+        logger.info(f"Processing {sum(map(len, chunks))} segments in {len(chunks)} chunks "
+                     f"(chunk_size={CHUNK_SIZE}, max_words={CHUNK_MAX_WORDS}, "
+                     f"max_concurrent={MAX_CONCURRENT_LLM_CALLS})")
 
         # Process chunks with concurrency limit
         semaphore = asyncio.Semaphore(MAX_CONCURRENT_LLM_CALLS)
         
         async def process_with_semaphore(chunk, idx):
             async with semaphore:
-                return await self._extract_chunk(chunk, graph_store, chunk_idx=idx)
+                await self._extract_chunk(chunk, graph_store, chunk_idx=idx)
+            report()
         
         tasks = [
             process_with_semaphore(chunk, idx)
@@ -165,6 +279,7 @@ class OntologicalAgent:
         logger.debug(f"[Chunk {chunk_idx}] Transcript:\n{transcript_text[:500]}...")
 
         source_tag = f"ontological_chunk_{chunk_idx}"
+        user_input = ONTOLOGICAL_EXTRACTION_INPUT.format(transcription=transcript_text)
         try:
             t0 = time.perf_counter()
             message = await asyncio.to_thread(
@@ -176,9 +291,7 @@ class OntologicalAgent:
                 messages=[
                     {
                         "role": "user",
-                        "content": ONTOLOGICAL_EXTRACTION_PROMPT.format(
-                            transcription=transcript_text
-                        ),
+                        "content": cached_prefix_content(ONTOLOGICAL_EXTRACTION_PROMPT, user_input),
                     }
                 ],
             )
@@ -187,17 +300,14 @@ class OntologicalAgent:
             logger.debug(f"[Chunk {chunk_idx}] Raw LLM response:\n{response_text[:1000]}...")
 
             if self._session_logger:
-                usage = None
-                if getattr(message, "usage", None):
-                    usage = {"input_tokens": getattr(message.usage, "input_tokens", None), "output_tokens": getattr(message.usage, "output_tokens", None)}
                 self._session_logger.log_llm_call(
                     provider="anthropic",
                     model=self.model,
                     role="ontological_extraction",
                     system_prompt=ONTOLOGICAL_SYSTEM_PROMPT,
-                    user_content=ONTOLOGICAL_EXTRACTION_PROMPT.format(transcription=transcript_text),
+                    user_content=f"{ONTOLOGICAL_EXTRACTION_PROMPT}\n\n{user_input}",
                     response_text=response_text,
-                    usage=usage,
+                    usage=usage_dict(message),
                     duration_seconds=round(duration, 3),
                     extra={"chunk_idx": chunk_idx},
                 )
@@ -215,9 +325,14 @@ class OntologicalAgent:
                     if chunk_idx > 0:
                         claim_id = f"ch{chunk_idx}_{claim_id}"
                     
+                    # json.loads gives each claim its own copy of the label; share one
+                    speaker = claim_data["speaker"]
+                    if isinstance(speaker, str):
+                        speaker = sys.intern(speaker)
+
                     claim = Claim(
                         id=claim_id,
-                        speaker=claim_data["speaker"],
+                        speaker=speaker,
                         text=claim_data["text"],
                         claim_type=ClaimType(claim_data["claim_type"]),
                         timestamp_start=claim_data.get("timestamp_start", 0.0),
@@ -263,8 +378,9 @@ class OntologicalAgent:
                 except (ValueError, KeyError) as e:
                     logger.warning(f"[Chunk {chunk_idx}] Skipping invalid relation: {e}")
 
+            cache_read = getattr(getattr(message, "usage", None), "cache_read_input_tokens", None)
             logger.info(f"[Chunk {chunk_idx}] Extracted {claims_added} claims, "
-                        f"{relations_added} relations")
+                        f"{relations_added} relations (prompt cache read: {cache_read or 0} tokens)")
 
         except anthropic.APIError as e:
             logger.error(f"[Chunk {chunk_idx}] Claude API error: {e}")
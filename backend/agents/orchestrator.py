@@ -6,15 +6,20 @@ Pipeline flow:
 1. Ontological Agent: Extract claims + build graph
 2. Skeptic Agent: Detect fallacies
 3. Researcher Agent: Fact-check factual claims (parallel)
+   (steps 2 and 3 only read the claims from step 1 and run concurrently;
+   fact-checks of each extraction chunk's claims already start during step 1)
 4. Compute rigor scores
 5. Return graph snapshot
 """
 
 import time
+import asyncio
 import logging
+from typing import AsyncIterator
 
 from api.models.schemas import (
     TranscriptionResult,
+    TranscriptionSegment,
     GraphSnapshot,
 )
 from graph.store import DebateGraphStore
@@ -47,38 +52,112 @@ async def run_analysis_pipeline(
     session_dir = setup_session_logging(session_id)
     session_logger = SessionLogger(session_dir)
 
-    pipeline_start = time.time()
-
-    logger.info("=" * 60)
-    logger.info("STARTING ANALYSIS PIPELINE")
-    logger.info(f"Session: {session_dir}")
-    logger.info(f"Segments: {len(transcription.segments)}, "
-                f"Speakers: {transcription.num_speakers}, "
-                f"Language: {transcription.language}")
-    logger.info("=" * 60)
+    try:
+        pipeline_start = time.time()
+
+        logger.info("=" * 60)
+        logger.info("STARTING ANALYSIS PIPELINE")
+        logger.info(f"Session: {session_dir}")
+        logger.info(f"Segments: {len(transcription.segments)}, "
+                    f"Speakers: {transcription.num_speakers}, "
+                    f"Language: {transcription.language}")
+        logger.info("=" * 60)
+
+        # ─── Step 1: Ontological Agent — Claim Extraction & Graph Building ───
+        logger.info("[Step 1/4] Ontological Agent: Extracting claims...")
+        ontological = OntologicalAgent(session_logger=session_logger)
+        # Fact-checks of each chunk's factual claims start as soon as that chunk is extracted
+        researcher = ResearcherAgent(session_logger=session_logger)
+        await ontological.extract_and_build(
+            transcription, graph_store, on_claims=researcher.prefetch
+        )
+        t1 = time.time()
+        logger.info(f"  → Graph: {graph_store.num_nodes} nodes, {graph_store.num_edges} edges "
+                    f"({t1 - pipeline_start:.1f}s)")
+
+        return await _annotate_and_snapshot(
+            graph_store, researcher, session_logger, session_dir, pipeline_start, t1
+        )
+    finally:
+        session_logger.close()
+
+
+async def run_streaming_analysis_pipeline(
+    segment_batches: AsyncIterator[list[TranscriptionSegment]],
+    graph_store: DebateGraphStore,
+    session_id: str = None,
+    language: str = "en",
+) -> tuple[TranscriptionResult, GraphSnapshot]:
+    """
+    run_analysis_pipeline() fed by a stream of segment batches
+    (pipeline.transcription.iter_transcribe_audio). Claim extraction starts
+    on the first batches while the rest of the audio is still transcribing.
 
-    # ─── Step 1: Ontological Agent — Claim Extraction & Graph Building ───
-    t0 = time.time()
-    logger.info("[Step 1/4] Ontological Agent: Extracting claims...")
-    ontological = OntologicalAgent(session_logger=session_logger)
-    await ontological.extract_and_build(transcription, graph_store)
-    t1 = time.time()
-    logger.info(f"  → Graph: {graph_store.num_nodes} nodes, {graph_store.num_edges} edges "
-                f"({t1 - t0:.1f}s)")
+    Returns:
+        (TranscriptionResult assembled from the stream, GraphSnapshot)
+    """
+    session_dir = setup_session_logging(session_id)
+    session_logger = SessionLogger(session_dir)
 
-    # ─── Step 2: Skeptic Agent — Fallacy Detection ──────────────────────
+    try:
+        pipeline_start = time.time()
+
+        logger.info("=" * 60)
+        logger.info("STARTING STREAMING ANALYSIS PIPELINE")
+        logger.info(f"Session: {session_dir}")
+        logger.info("=" * 60)
+
+        # ─── Step 1: transcription batches → claim extraction, overlapped ───
+        logger.info("[Step 1/4] Ontological Agent: Extracting claims as segments arrive...")
+        ontological = OntologicalAgent(session_logger=session_logger)
+        researcher = ResearcherAgent(session_logger=session_logger)
+        segments = await ontological.extract_and_build_streaming(
+            segment_batches, graph_store, on_claims=researcher.prefetch
+        )
+        transcription = TranscriptionResult.model_construct(
+            segments=segments,
+            num_speakers=len({seg.speaker for seg in segments}),
+            language=language,
+        )
+        t1 = time.time()
+        logger.info(f"  → Segments: {len(segments)}, Speakers: {transcription.num_speakers}")
+        logger.info(f"  → Graph: {graph_store.num_nodes} nodes, {graph_store.num_edges} edges "
+                    f"({t1 - pipeline_start:.1f}s incl. transcription)")
+
+        snapshot = await _annotate_and_snapshot(
+            graph_store, researcher, session_logger, session_dir, pipeline_start, t1
+        )
+        return transcription, snapshot
+    finally:
+        session_logger.close()
+
+
+async def _annotate_and_snapshot(
+    graph_store: DebateGraphStore,
+    researcher: ResearcherAgent,
+    session_logger: SessionLogger,
+    session_dir,
+    pipeline_start: float,
+    t1: float,
+) -> GraphSnapshot:
+    """Steps 2-4 and the snapshot, shared by both pipeline entry points."""
+    # ─── Steps 2+3: Skeptic (fallacies) and Researcher (fact-checks) ────
+    # Independent annotations of the same claims: their API calls overlap.
+    # Most fact-checks were already started (researcher.prefetch) during step 1
     logger.info("[Step 2/4] Skeptic Agent: Detecting fallacies...")
+    logger.info("[Step 3/4] Researcher Agent: Fact-checking claims...")
     skeptic = SkepticAgent(session_logger=session_logger)
-    fallacies = await skeptic.analyze(graph_store)
-    t2 = time.time()
-    logger.info(f"  → Detected {len(fallacies)} fallacies ({t2 - t1:.1f}s)")
 
-    # ─── Step 3: Researcher Agent — Fact-Checking ───────────────────────
-    logger.info("[Step 3/4] Researcher Agent: Fact-checking claims...")
-    researcher = ResearcherAgent(session_logger=session_logger)
-    factchecks = await researcher.check_all_factual_claims(graph_store)
-    t3 = time.time()
-    logger.info(f"  → Fact-checked {len(factchecks)} claims ({t3 - t2:.1f}s)")
+    async def timed(coro):
+        result = await coro
+        return result, time.time() - t1
+
+    (fallacies, t_skeptic), (factchecks, t_researcher) = await asyncio.gather(
+        timed(skeptic.analyze(graph_store)),
+        timed(researcher.check_all_factual_claims(graph_store)),
+    )
+    logger.info(f"  → Detected {len(fallacies)} fallacies ({t_skeptic:.1f}s)")
+    logger.info(f"  → Fact-checked {len(factchecks)} claims ({t_researcher:.1f}s)")
 
     # ─── Step 4: Compute Rigor Scores ───────────────────────────────────
     logger.info("[Step 4/4] Computing rigor scores...")
@@ -98,8 +177,8 @@ async def run_analysis_pipeline(
     logger.info("ANALYSIS PIPELINE COMPLETE")
     logger.info(f"Total time: {total_time:.1f}s")
     logger.info(f"Nodes: {len(snapshot.nodes)}, Edges: {len(snapshot.edges)}, "
-                f"Fallacies: {sum(len(n.fallacies) for n in snapshot.nodes)}, "
-                f"Fact-checks: {len([n for n in snapshot.nodes if n.factcheck])}, "
+                f"Fallacies: {graph_store.num_fallacies}, "
+                f"Completed fact-checks: {graph_store.num_factchecks}, "
                 f"Cycles: {len(snapshot.cycles_detected)}")
     session_logger.set_ended_at()
     logger.info(f"Logs saved to: {session_dir}")
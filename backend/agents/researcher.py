@@ -5,10 +5,12 @@ then uses Claude to synthesize a verdict from search results.
 """
 
 import os
+import re
 import json
 import time
 import asyncio
 import logging
+from collections import OrderedDict
 from typing import TYPE_CHECKING, Optional
 
 from api.models.schemas import (
@@ -17,11 +19,15 @@ from api.models.schemas import (
     Claim,
 )
 from graph.store import DebateGraphStore
+from agents.clients import get_anthropic_client, get_tavily_client, usage_dict
+from utils.rate_limit import AsyncRateLimiter, call_with_backoff
 from config.settings import (
     LLM_MODEL,
     LLM_MAX_TOKENS_FACTCHECK,
     LLM_TEMPERATURE,
+    FACTCHECK_MEMO_SIZE,
     MAX_CONCURRENT_LLM_CALLS,
+    RATE_LIMIT_RETRIES,
     TAVILY_SEARCH_DEPTH,
     TAVILY_MAX_RESULTS,
     RESEARCHER_SYSTEM_PROMPT,
@@ -47,6 +53,11 @@ except ImportError:
     ANTHROPIC_AVAILABLE = False
 
 
+def _claim_key(text: str) -> str:
+    """Claim text normalized for duplicate detection (case, punctuation, spacing)."""
+    return " ".join(re.findall(r"\w+", text.lower()))
+
+
 class ResearcherAgent:
     """
     Asynchronous fact-checking agent.
@@ -55,15 +66,26 @@ class ResearcherAgent:
     2. Uses Claude to synthesize a verdict from search results
     """
 
-    def __init__(self, session_logger: Optional["SessionLogger"] = None):
+    def __init__(
+        self,
+        session_logger: Optional["SessionLogger"] = None,
+        rate_limiter: Optional[AsyncRateLimiter] = None,
+    ):
         self.tavily_client = None
         self.llm_client = None
         self._session_logger = session_logger
+        self._rate_limiter = rate_limiter
+        # Normalized claim text → fact-check task, least recently used first
+        # and capped at FACTCHECK_MEMO_SIZE (see check_claim)
+        self._checks: OrderedDict[str, asyncio.Future] = OrderedDict()
+        # Shared by check_all_factual_claims() and prefetch()
+        self._semaphore = asyncio.Semaphore(MAX_CONCURRENT_LLM_CALLS)
+        self._prefetching: set[asyncio.Future] = set()
 
         if TAVILY_AVAILABLE:
             api_key = os.getenv("TAVILY_API_KEY", "")
             if api_key:
-                self.tavily_client = TavilyClient(api_key=api_key)
+                self.tavily_client = get_tavily_client(api_key)
                 logger.info("Researcher Agent: Tavily API configured")
             else:
                 logger.info("TAVILY_API_KEY not set. Using mock fact-checking.")
@@ -71,7 +93,7 @@ class ResearcherAgent:
         if ANTHROPIC_AVAILABLE:
             api_key = os.getenv("ANTHROPIC_API_KEY", "")
             if api_key:
-                self.llm_client = anthropic.Anthropic(api_key=api_key)
+                self.llm_client = get_anthropic_client(api_key)
                 logger.info("Researcher Agent: Claude API configured for verdict synthesis")
 
     async def check_all_factual_claims(
@@ -85,13 +107,13 @@ class ResearcherAgent:
             logger.info("No factual claims to check")
             return []
 
-        logger.info(f"Fact-checking {len(factual_claims)} factual claims...")
+        n_unique = len({_claim_key(c.text) for c in factual_claims})
+        logger.info(f"Fact-checking {len(factual_claims)} factual claims "
+                    f"({n_unique} distinct)...")
 
         # Process with concurrency limit
-        semaphore = asyncio.Semaphore(MAX_CONCURRENT_LLM_CALLS)
-        
         async def check_with_semaphore(claim):
-            async with semaphore:
+            async with self._semaphore:
                 return await self.check_claim(claim)
         
         results = await asyncio.gather(
@@ -124,8 +146,56 @@ class ResearcherAgent:
 
         return valid_results
 
+    def prefetch(self, claims: list[Claim]) -> None:
+        """
+        Start fact-checking the factual claims among `claims` in the
+        background (e.g. as soon as their extraction chunk is done).
+        check_all_factual_claims() later reuses these checks via check_claim;
+        a prefetch that fails is simply redone there.
+        """
+        for claim in claims:
+            if claim.is_factual and _claim_key(claim.text) not in self._checks:
+                task = asyncio.ensure_future(self._prefetch_one(claim))
+                # The loop only keeps weak references to tasks
+                self._prefetching.add(task)
+                task.add_done_callback(self._prefetching.discard)
+
+    async def _prefetch_one(self, claim: Claim) -> None:
+        async with self._semaphore:
+            try:
+                await self.check_claim(claim)
+            except Exception as e:
+                logger.debug(f"Prefetch fact-check failed for {claim.id}: {e}")
+
     async def check_claim(self, claim: Claim) -> FactCheckResult:
-        """Fact-check a single claim."""
+        """
+        Fact-check a single claim. Claims with the same normalized text
+        (repeated talking points) share one search + verdict per session,
+        including checks that are still in flight. Only the FACTCHECK_MEMO_SIZE
+        most recently used texts are remembered.
+        """
+        key = _claim_key(claim.text)
+        task = self._checks.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._check_uncached(claim))
+            self._checks[key] = task
+            # Evicted checks still complete for whoever awaits them
+            while len(self._checks) > max(1, FACTCHECK_MEMO_SIZE):
+                self._checks.popitem(last=False)
+        else:
+            self._checks.move_to_end(key)
+            logger.debug(f"Reusing fact-check for duplicate claim {claim.id}")
+        try:
+            result = await task
+        except BaseException:
+            if self._checks.get(key) is task:
+                del self._checks[key]
+            raise
+        if result.claim_id != claim.id:
+            result = result.model_copy(update={"claim_id": claim.id})
+        return result
+
+    async def _check_uncached(self, claim: Claim) -> FactCheckResult:
         if self.tavily_client:
             return await self._check_with_tavily(claim)
         else:
@@ -188,8 +258,11 @@ class ResearcherAgent:
         """Use Claude to synthesize a verdict from search results."""
         try:
             t0 = time.perf_counter()
-            message = await asyncio.to_thread(
+            message = await call_with_backoff(
+                self._rate_limiter,
+                asyncio.to_thread,
                 self.llm_client.messages.create,
+                attempts=RATE_LIMIT_RETRIES,
                 model=LLM_MODEL,
                 max_tokens=LLM_MAX_TOKENS_FACTCHECK,
                 temperature=LLM_TEMPERATURE,
@@ -208,9 +281,6 @@ class ResearcherAgent:
             duration = time.perf_counter() - t0
             response_text = message.content[0].text
             if self._session_logger:
-                usage = None
-                if getattr(message, "usage", None):
-                    usage = {"input_tokens": getattr(message.usage, "input_tokens", None), "output_tokens": getattr(message.usage, "output_tokens", None)}
                 self._session_logger.log_llm_call(
                     provider="anthropic",
                     model=LLM_MODEL,
@@ -222,7 +292,7 @@ class ResearcherAgent:
                         search_results=search_results,
                     ),
                     response_text=response_text,
-                    usage=usage,
+                    usage=usage_dict(message),
                     duration_seconds=round(duration, 3),
                     extra={"claim_id": claim.id},
                 )
@@ -5,6 +5,7 @@ Uses configurable prompts from config/settings.py.
 """
 
 import os
+import re
 import json
 import time
 import asyncio
@@ -18,7 +19,9 @@ from api.models.schemas import (
     ClaimType,
 )
 from graph.store import DebateGraphStore
+from agents.clients import cached_prefix_content, get_anthropic_client, usage_dict
 from graph.algorithms import detect_cycles, detect_strawman_candidates, detect_goalpost_moving
+from utils.rate_limit import AsyncRateLimiter, call_with_backoff
 from config.settings import (
     LLM_MODEL,
     LLM_MODEL_FALLBACK,
@@ -26,8 +29,10 @@ from config.settings import (
     LLM_TEMPERATURE,
     CHUNK_SIZE,
     MAX_CONCURRENT_LLM_CALLS,
+    RATE_LIMIT_RETRIES,
     SKEPTIC_SYSTEM_PROMPT,
     SKEPTIC_DETECTION_PROMPT,
+    SKEPTIC_DETECTION_INPUT,
 )
 
 if TYPE_CHECKING:
@@ -42,20 +47,73 @@ except ImportError:
     ANTHROPIC_AVAILABLE = False
 
 
+def _markers(*phrases: str) -> re.Pattern:
+    """One compiled alternation per fallacy type: a single scan per claim text."""
+    return re.compile("|".join(map(re.escape, phrases)))
+
+
+# Rule-based fallback: (marker pattern, type, severity, explanation, socratic question)
+_RULE_MARKERS = (
+    (
+        _markers(
+            "you always", "you never", "people like you",
+            "you're just", "you don't understand",
+            "you're not qualified", "what do you know about",
+        ),
+        FallacyType.AD_HOMINEM, 0.6,
+        "This statement appears to attack the person rather than their argument.",
+        "Is this criticism directed at the argument itself, or at the person making it?",
+    ),
+    (
+        _markers(
+            "either we", "either you", "it's either",
+            "the only option", "there are only two",
+            "you're either with", "it's all or nothing",
+        ),
+        FallacyType.FALSE_DILEMMA, 0.6,
+        "This presents a binary choice where more options may exist.",
+        "Are these really the only two options?",
+    ),
+    (
+        _markers(
+            "will lead to", "will inevitably", "will end up",
+            "next thing you know", "before you know it",
+        ),
+        FallacyType.SLIPPERY_SLOPE, 0.5,
+        "This suggests an inevitable chain of consequences without justification.",
+        "Is each step in this chain actually inevitable?",
+    ),
+    (
+        _markers(
+            "so you're saying", "what you're really saying",
+            "you're suggesting that", "you want to",
+        ),
+        FallacyType.STRAWMAN, 0.6,
+        "This may be mischaracterizing the opponent's actual position.",
+        "Is this an accurate representation of what the other speaker argued?",
+    ),
+)
+
+
 class SkepticAgent:
     """
     Detects logical fallacies in the argument graph using a combination
     of structural analysis and LLM-based detection.
     """
 
-    def __init__(self, session_logger: Optional["SessionLogger"] = None):
+    def __init__(
+        self,
+        session_logger: Optional["SessionLogger"] = None,
+        rate_limiter: Optional[AsyncRateLimiter] = None,
+    ):
         self.client = None
         self.model = LLM_MODEL
         self._session_logger = session_logger
+        self._rate_limiter = rate_limiter
         if ANTHROPIC_AVAILABLE:
             api_key = os.getenv("ANTHROPIC_API_KEY", "")
             if api_key:
-                self.client = anthropic.Anthropic(api_key=api_key)
+                self.client = get_anthropic_client(api_key)
                 logger.info(f"Skeptic Agent initialized with model: {self.model}")
 
     async def analyze(self, graph_store: DebateGraphStore) -> list[FallacyAnnotation]:
@@ -111,12 +169,18 @@ class SkepticAgent:
         return all_fallacies
 
     def _detect_structural_fallacies(
-        self, graph_store: DebateGraphStore
+        self,
+        graph_store: DebateGraphStore,
+        dirty_ids: Optional[set[str]] = None,
     ) -> list[FallacyAnnotation]:
-        """Detect fallacies from graph structure (no LLM needed)."""
+        """
+        Detect fallacies from graph structure (no LLM needed).
+        With dirty_ids (claims added since the last scan), only structures
+        touching those claims are re-examined.
+        """
         fallacies = []
 
-        cycles = detect_cycles(graph_store.graph)
+        cycles = detect_cycles(graph_store.graph, nodes=dirty_ids)
         for cycle in cycles:
             if len(cycle) >= 2:
                 fallacies.append(FallacyAnnotation(
@@ -128,7 +192,7 @@ class SkepticAgent:
                     related_claim_ids=cycle[1:],
                 ))
 
-        strawman_candidates = detect_strawman_candidates(graph_store.graph)
+        strawman_candidates = detect_strawman_candidates(graph_store.graph, nodes=dirty_ids)
         for candidate in strawman_candidates:
             fallacies.append(FallacyAnnotation(
                 claim_id=candidate["attacking_claim_id"],
@@ -142,7 +206,7 @@ class SkepticAgent:
                 related_claim_ids=[candidate["original_claim_id"]],
             ))
 
-        goalpost_shifts = detect_goalpost_moving(graph_store.graph)
+        goalpost_shifts = detect_goalpost_moving(graph_store.graph, nodes=dirty_ids)
         for shift in goalpost_shifts:
             fallacies.append(FallacyAnnotation(
                 claim_id=shift["original_claim_id"],
@@ -207,11 +271,15 @@ class SkepticAgent:
             )
 
         claims_context = "\n".join(context_parts)
+        user_input = SKEPTIC_DETECTION_INPUT.format(claims_context=claims_context)
 
         try:
             t0 = time.perf_counter()
-            message = await asyncio.to_thread(
+            message = await call_with_backoff(
+                self._rate_limiter,
+                asyncio.to_thread,
                 self.client.messages.create,
+                attempts=RATE_LIMIT_RETRIES,
                 model=self.model,
                 max_tokens=LLM_MAX_TOKENS_FALLACY,
                 temperature=LLM_TEMPERATURE,
@@ -219,9 +287,7 @@ class SkepticAgent:
                 messages=[
                     {
                         "role": "user",
-                        "content": SKEPTIC_DETECTION_PROMPT.format(
-                            claims_context=claims_context
-                        ),
+                        "content": cached_prefix_content(SKEPTIC_DETECTION_PROMPT, user_input),
                     }
                 ],
             )
@@ -230,17 +296,14 @@ class SkepticAgent:
             logger.debug(f"Skeptic LLM response:\n{response_text[:1000]}...")
 
             if self._session_logger:
-                usage = None
-                if getattr(message, "usage", None):
-                    usage = {"input_tokens": getattr(message.usage, "input_tokens", None), "output_tokens": getattr(message.usage, "output_tokens", None)}
                 self._session_logger.log_llm_call(
                     provider="anthropic",
                     model=self.model,
                     role="skeptic_fallacy_detection",
                     system_prompt=SKEPTIC_SYSTEM_PROMPT,
-                    user_content=SKEPTIC_DETECTION_PROMPT.format(claims_context=claims_context),
+                    user_content=f"{SKEPTIC_DETECTION_PROMPT}\n\n{user_input}",
                     response_text=response_text,
-                    usage=usage,
+                    usage=usage_dict(message),
                     duration_seconds=round(duration, 3),
                 )
 
@@ -307,68 +370,17 @@ class SkepticAgent:
     ) -> list[FallacyAnnotation]:
         """Rule-based fallacy detection fallback."""
         fallacies = []
-        claims = graph_store.get_all_claims()
-
-        for claim in claims:
+        for claim in graph_store.get_all_claims():
             text_lower = claim.text.lower()
-
-            # Ad Hominem
-            ad_hominem_markers = [
-                "you always", "you never", "people like you",
-                "you're just", "you don't understand",
-                "you're not qualified", "what do you know about",
-            ]
-            if any(m in text_lower for m in ad_hominem_markers):
-                fallacies.append(FallacyAnnotation(
-                    claim_id=claim.id,
-                    fallacy_type=FallacyType.AD_HOMINEM,
-                    severity=0.6,
-                    explanation="This statement appears to attack the person rather than their argument.",
-                    socratic_question="Is this criticism directed at the argument itself, or at the person making it?",
-                ))
-
-            # False Dilemma
-            false_dilemma_markers = [
-                "either we", "either you", "it's either",
-                "the only option", "there are only two",
-                "you're either with", "it's all or nothing",
-            ]
-            if any(m in text_lower for m in false_dilemma_markers):
-                fallacies.append(FallacyAnnotation(
-                    claim_id=claim.id,
-                    fallacy_type=FallacyType.FALSE_DILEMMA,
-                    severity=0.6,
-                    explanation="This presents a binary choice where more options may exist.",
-                    socratic_question="Are these really the only two options?",
-                ))
-
-            # Slippery Slope
-            slippery_markers = [
-                "will lead to", "will inevitably", "will end up",
-                "next thing you know", "before you know it",
-            ]
-            if any(m in text_lower for m in slippery_markers):
-                fallacies.append(FallacyAnnotation(
-                    claim_id=claim.id,
-                    fallacy_type=FallacyType.SLIPPERY_SLOPE,
-                    severity=0.5,
-                    explanation="This suggests an inevitable chain of consequences without justification.",
-                    socratic_question="Is each step in this chain actually inevitable?",
-                ))
-
-            # Strawman (text-based)
-            strawman_markers = [
-                "so you're saying", "what you're really saying",
-                "you're suggesting that", "you want to",
-            ]
-            if any(m in text_lower for m in strawman_markers):
-                fallacies.append(FallacyAnnotation(
-                    claim_id=claim.id,
-                    fallacy_type=FallacyType.STRAWMAN,
-                    severity=0.6,
-                    explanation="This may be mischaracterizing the opponent's actual position.",
-                    socratic_question="Is this an accurate representation of what the other speaker argued?",
-                ))
+            for pattern, fallacy_type, severity, explanation, question in _RULE_MARKERS:
+                if pattern.search(text_lower):
+                    fallacies.append(FallacyAnnotation(
+                        claim_id=claim.id,
+                        fallacy_type=fallacy_type,
+                        severity=severity,
+                        explanation=explanation,
+                        socratic_question=question,
+                    ))
 
         return fallacies
 
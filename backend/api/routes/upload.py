@@ -24,7 +24,7 @@ from api.models.schemas import (
     GraphSnapshot,
     TranscriptionResult,
 )
-from pipeline.transcription import transcribe_audio
+from pipeline.transcription import transcribe_audio_async
 from agents.orchestrator import run_analysis_pipeline
 from graph.store import DebateGraphStore
 from db.database import (
@@ -34,6 +34,7 @@ from db.database import (
     list_jobs as db_list_jobs,
     delete_job as db_delete_job,
     save_snapshot,
+    snapshot_stats,
     get_snapshot,
 )
 
@@ -198,7 +199,7 @@ async def process_file(
         wav_path = await convert_to_wav(file_path)
 
         update_job_status(job_id, "transcribing", progress=0.2)
-        transcription = await asyncio.to_thread(transcribe_audio, wav_path)
+        transcription = await transcribe_audio_async(wav_path)
         update_job_status(job_id, "transcribing", progress=0.5)
         logger.info(f"[{job_id}] Transcription complete: {len(transcription.segments)} segments")
 
@@ -211,9 +212,13 @@ async def process_file(
         )
 
         # Persist snapshot to DB
-        snapshot_dict = graph_snapshot.model_dump(mode="json")
-        transcription_dict = transcription.model_dump(mode="json")
-        save_snapshot(job_id, snapshot_dict, transcription_dict)
+        # JSON text straight from pydantic, bound as jsonb (no intermediate dicts)
+        save_snapshot(
+            job_id,
+            graph_snapshot.model_dump_json(),
+            transcription.model_dump_json(),
+            stats=snapshot_stats(graph_snapshot),
+        )
 
         # Clean up temp WAV (original stays in UPLOAD_DIR for media serving)
         wav_p = Path(wav_path)
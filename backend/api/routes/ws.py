@@ -11,6 +11,8 @@ import logging
 
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
 
+from utils.json_utils import encode_message
+
 logger = logging.getLogger(__name__)
 
 router = APIRouter(tags=["websocket"])
@@ -140,7 +142,13 @@ async def stream_live(websocket: WebSocket):
       {"type": "stream_started", "session_id": "..."}
       {"type": "chunk_received", "chunk_index": N, "size_bytes": N, "time_offset": N}
       {"type": "transcription_update", "chunk_index": N, "new_segments": [...], "total_segments": N}
-      {"type": "graph_update", "chunk_index": N, "graph": {...}, "transcription": {...}, "stats": {...}}
+      {"type": "node_added", "node": {...}}
+      {"type": "edge_added", "edge": {...}}
+      {"type": "fallacy_added", "claim_id": "...", "fallacy": {...}}
+      {"type": "factcheck_added", "claim_id": "...", "factcheck": {...}}
+      {"type": "stats", "chunk_index": N, "stats": {...}, "rigor_scores": [...], "cycles_detected": [...]}
+        (one stats tick closes each batch of object events)
+      {"type": "chunk_processed", "chunk_index": N}   (chunk left the graph unchanged)
       {"type": "finalizing", "message": "..."}
       {"type": "stream_complete", "session_id": "...", "graph": {...}, "transcription": {...}}
       {"type": "error", "stage": "...", "message": "..."}
@@ -162,7 +170,8 @@ async def stream_live(websocket: WebSocket):
         async def send_update(message: dict):
             """Callback to send updates to the frontend."""
             try:
-                await websocket.send_json(message)
+                # *_json values are pre-serialized and spliced in without re-encoding
+                await websocket.send_text(encode_message(message))
             except Exception as e:
                 logger.warning(f"[{session_id}] Failed to send update: {e}")
 
@@ -278,6 +287,9 @@ async def stream_live(websocket: WebSocket):
             })
         except Exception:
             pass
+    finally:
+        if pipeline:
+            pipeline.close()
 
 
 async def _persist_stream_to_db(
@@ -292,11 +304,11 @@ async def _persist_stream_to_db(
         job_id = f"live_{session_id}"
         create_job(job_id, audio_filename=f"live_stream_{session_id}")
 
-        snapshot_dict = snapshot.model_dump(mode="json")
+        snapshot_dict = pipeline.graph_store.snapshot_dump()
         transcription_dict = {
-            "segments": [s.model_dump() for s in pipeline.all_segments],
+            "segments": pipeline._segment_dumps,
             "language": "en",
-            "num_speakers": len(set(s.speaker for s in pipeline.all_segments)),
+            "num_speakers": len(pipeline._speakers),
         }
 
         save_snapshot(job_id, snapshot_dict, transcription_dict)
@@ -21,12 +21,61 @@ Structure:
 """
 
 import os
+import sys
+import time
 import logging
+import logging.handlers
 from datetime import datetime
 from pathlib import Path
 from config.settings import LOG_DIR
 
 
+class CachedTimeFormatter(logging.Formatter):
+    """
+    Formatter that runs strftime for %(asctime)s at most once per second;
+    records logged within the same second reuse the formatted time.
+    """
+
+    _time_cache: tuple[int, str] = (-1, "")
+
+    def formatTime(self, record, datefmt=None):
+        second = int(record.created)
+        cached = self._time_cache
+        if cached[0] != second:
+            cached = (second, time.strftime(datefmt or self.default_time_format, self.converter(second)))
+            self._time_cache = cached
+        if datefmt:
+            return cached[1]
+        return self.default_msec_format % (cached[1], record.msecs)
+
+
+def setup_script_logging(
+    log_file: str,
+    fmt: str = "%(asctime)s [%(levelname)s] %(name)s: %(message)s",
+    datefmt: str = "%H:%M:%S",
+    mode: str = "a",
+) -> None:
+    """
+    Console + file logging for the standalone test scripts.
+    File writes are batched (256 records, or immediately on ERROR) through a
+    MemoryHandler, and the per-record thread/process lookups are switched off.
+    """
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+
+    formatter = CachedTimeFormatter(fmt, datefmt=datefmt)
+    console = logging.StreamHandler(sys.stdout)
+    console.setFormatter(formatter)
+    file_handler = logging.FileHandler(log_file, mode=mode, encoding="utf-8")
+    file_handler.setFormatter(formatter)
+    # Flushed on close by logging.shutdown() at exit
+    buffered = logging.handlers.MemoryHandler(
+        capacity=256, flushLevel=logging.ERROR, target=file_handler,
+    )
+    logging.basicConfig(level=logging.INFO, handlers=[console, buffered])
+
+
 def setup_session_logging(session_id: str = None) -> str:
     """
     Set up structured logging for a new analysis session.
@@ -24,14 +24,38 @@ LLM_MAX_TOKENS_FACTCHECK = int(os.getenv("LLM_MAX_TOKENS_FACTCHECK", "1500"))
 # Temperature (lower = more deterministic)
 LLM_TEMPERATURE = float(os.getenv("LLM_TEMPERATURE", "0.1"))
 
+# On-disk cache of Claude responses and Tavily searches, keyed by the full request.
+# "off" (default) disables it, "default" = ~/.debategraph/cache/llm, anything else
+# is used as the cache directory. Meant for repeat test runs over the same audio.
+LLM_CACHE = os.getenv("LLM_CACHE", "off")
+
 # ─── Pipeline Configuration ─────────────────────────────────────────────────
 
 # Number of transcript segments to process per LLM batch
 CHUNK_SIZE = int(os.getenv("CHUNK_SIZE", "10"))
 
+# A batch is also closed once its segments reach this many words (~2k tokens),
+# so long monologues don't produce oversized extraction prompts
+CHUNK_MAX_WORDS = int(os.getenv("CHUNK_MAX_WORDS", "1500"))
+
 # Max concurrent LLM calls
 MAX_CONCURRENT_LLM_CALLS = int(os.getenv("MAX_CONCURRENT_LLM_CALLS", "3"))
 
+# Client-side rate limits for the live stream (requests per minute) and retry
+# attempts when a provider answers 429 / rate limit / overloaded
+OPENAI_MAX_RPM = float(os.getenv("OPENAI_MAX_RPM", "50"))
+OPENAI_MAX_CONCURRENT = int(os.getenv("OPENAI_MAX_CONCURRENT", "4"))
+LLM_MAX_RPM = float(os.getenv("LLM_MAX_RPM", "50"))
+RATE_LIMIT_RETRIES = int(os.getenv("RATE_LIMIT_RETRIES", "3"))
+
+# Fact-check results reused for repeated claims: most recently used normalized
+# claim texts kept per researcher (bounds memory in long live sessions)
+FACTCHECK_MEMO_SIZE = int(os.getenv("FACTCHECK_MEMO_SIZE", "512"))
+
+# Live streaming: transcript segments kept in memory; older ones are spilled to an
+# append-only JSONL file in the temp dir and read back when the stream finalizes
+LIVE_MAX_MEM_SEGMENTS = int(os.getenv("LIVE_MAX_MEM_SEGMENTS", "2000"))
+
 # Strawman similarity threshold
 STRAWMAN_SIMILARITY_THRESHOLD = float(os.getenv("STRAWMAN_SIMILARITY_THRESHOLD", "0.75"))
 
@@ -45,6 +69,28 @@ STT_MODEL = os.getenv("STT_MODEL", "gpt-4o-transcribe-diarize")
 # Optional prompt to improve transcription quality (context about the audio)
 STT_PROMPT = os.getenv("STT_PROMPT", "This is a political debate between two candidates discussing policy issues including the economy, healthcare, education, foreign policy, and energy.")
 
+# Live streaming: race diarized + plain transcription per chunk. If the plain model
+# answers first, wait this long (seconds) for the diarized result before using it.
+# Off by default: it sends two transcription requests per chunk (twice the cost and
+# rate-limit use); set STT_RACE_FALLBACK=true to trade that for lower latency.
+STT_RACE_FALLBACK = os.getenv("STT_RACE_FALLBACK", "false").lower() in ("1", "true", "yes")
+STT_DIARIZE_GRACE_SECONDS = float(os.getenv("STT_DIARIZE_GRACE_SECONDS", "1.5"))
+
+# File uploads: play audio this much faster before upload (ffmpeg atempo, 0.5-2.0)
+# to cut billed audio time and latency; timestamps are mapped back. 1.0 = off.
+STT_SPEEDUP = float(os.getenv("STT_SPEEDUP", "1.0"))
+
+# File uploads: content-addressed transcription cache. "off" (default, or empty)
+# disables it, "default" = ~/.debategraph/cache, anything else is used as the
+# cache directory. Meant for repeat test runs over the same audio.
+STT_CACHE = os.getenv("STT_CACHE", "off")
+
+# Live streaming: decode chunks larger than STT_NORMALIZE_MIN_BYTES to WAV 16kHz mono
+# once, locally, and upload that to every transcription attempt (off by default:
+# PCM is larger on the wire than Opus/WebM)
+STT_NORMALIZE_AUDIO = os.getenv("STT_NORMALIZE_AUDIO", "false").lower() in ("1", "true", "yes")
+STT_NORMALIZE_MIN_BYTES = int(os.getenv("STT_NORMALIZE_MIN_BYTES", str(128 * 1024)))
+
 # Legacy Whisper config (kept for local WhisperX fallback if needed)
 WHISPER_MODEL = os.getenv("WHISPER_MODEL", "medium")
 WHISPER_DEVICE = os.getenv("WHISPER_DEVICE", "auto")
@@ -78,19 +124,19 @@ You must be precise, thorough, and identify every distinct argumentative unit. E
 
 In political debates, speakers frequently rebut each other and occasionally concede points. Be attentive to these dynamics — a response that contradicts or challenges the previous speaker is a REBUTTAL, and any acknowledgment of validity in the opponent's position is a CONCESSION."""
 
-ONTOLOGICAL_EXTRACTION_PROMPT = """Analyze this debate transcription and extract all claims and their relationships.
-
-TRANSCRIPTION:
-{transcription}
+# Extraction/detection instructions are static so that, together with the system
+# prompt, they form a cacheable prefix (Anthropic prompt caching); the per-call
+# transcript / claims follow in a separate *_INPUT block.
+ONTOLOGICAL_EXTRACTION_PROMPT = """Analyze the debate transcription that follows these instructions and extract all claims and their relationships.
 
 Extract every distinct claim and identify relationships between them.
 
 IMPORTANT: Skip any segment that is just a single word, filler ("uh", "um", "okay", "yeah", "oh"), or incomplete fragment with no argumentative content.
 
 Respond with ONLY valid JSON (no markdown, no explanation) in this exact format:
-{{
+{
   "claims": [
-    {{
+    {
       "id": "c1",
       "speaker": "SPEAKER_00",
       "text": "the exact claim text as spoken",
@@ -99,17 +145,17 @@ Respond with ONLY valid JSON (no markdown, no explanation) in this exact format:
       "segment_index": 0,
       "timestamp_start": 0.0,
       "timestamp_end": 12.5
-    }}
+    }
   ],
   "relations": [
-    {{
+    {
       "source_id": "c2",
       "target_id": "c1",
       "relation_type": "attack",
       "confidence": 0.85
-    }}
+    }
   ]
-}}
+}
 
 CLAIM TYPES (use EXACTLY one of these values):
 - "premise": provides evidence, data, or reasoning to support another claim
@@ -144,16 +190,16 @@ CRITICAL RULES:
 - Do NOT extract single-word utterances, filler words, or incomplete fragments as claims
 - When two speakers are debating, link rebuttals to the claims they are responding to with "attack" relations"""
 
+ONTOLOGICAL_EXTRACTION_INPUT = """TRANSCRIPTION:
+{transcription}"""
+
 SKEPTIC_SYSTEM_PROMPT = """You are an expert in informal logic, critical thinking, and argumentation theory. Your role is to identify logical fallacies in debate arguments with precision and fairness.
 
 CRITICAL: You must be HIGHLY SELECTIVE. Only flag genuine, clear-cut logical fallacies — NOT normal rhetorical techniques, strong opinions, or persuasive language. In political debates, speakers routinely use generalizations, emotional appeals, and authority references as standard rhetoric. These are NORMAL debate techniques, not fallacies, unless they involve a clear logical error.
 
 A fallacy must involve a genuine logical error, not just a debatable point or rhetorical style."""
 
-SKEPTIC_DETECTION_PROMPT = """Analyze these debate claims and identify any logical fallacies.
-
-CLAIMS AND RELATIONS:
-{claims_context}
+SKEPTIC_DETECTION_PROMPT = """Analyze the debate claims that follow these instructions and identify any logical fallacies.
 
 Check for these fallacy types:
 - "strawman": Misrepresenting someone's argument to attack a distorted version. REQUIRES: The speaker must demonstrably distort what the opponent actually said. Simply disagreeing or paraphrasing is NOT a strawman.
@@ -170,18 +216,18 @@ Check for these fallacy types:
 - "equivocation": Using a word with multiple meanings ambiguously in the same argument.
 
 Respond with ONLY valid JSON (no markdown, no explanation):
-{{
+{
   "fallacies": [
-    {{
+    {
       "claim_id": "c1",
       "fallacy_type": "strawman",
       "severity": 0.8,
       "explanation": "Clear explanation of why this is a fallacy",
       "socratic_question": "A question that helps the listener think critically about this",
       "related_claim_ids": ["c2"]
-    }}
+    }
   ]
-}}
+}
 
 RULES:
 - severity: 0.0-1.0 (0.3=minor, 0.5=moderate, 0.7=significant, 0.9=severe)
@@ -190,9 +236,12 @@ RULES:
 - Standard political rhetoric (citing economic data, referencing opponent's record, making policy predictions) are NOT fallacies
 - Provide specific, actionable explanations
 - Socratic questions should guide critical thinking, not be accusatory
-- If no fallacies found, return {{"fallacies": []}}
+- If no fallacies found, return {"fallacies": []}
 - When in doubt, DO NOT flag it — err on the side of fewer, higher-quality detections"""
 
+SKEPTIC_DETECTION_INPUT = """CLAIMS AND RELATIONS:
+{claims_context}"""
+
 RESEARCHER_SYSTEM_PROMPT = """You are a fact-checking research assistant. Given a factual claim and web search results, determine whether the claim is supported, refuted, partially true, or unverifiable.
 
 Be precise and cite specific sources. Distinguish between exact claims and approximate ones."""
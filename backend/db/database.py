@@ -262,14 +262,45 @@ def delete_job(job_id: str) -> bool:
 
 # ─── Snapshot CRUD ───────────────────────────────────────────────────────────
 
+def snapshot_stats(snapshot) -> dict:
+    """
+    Metadata columns (num_nodes, num_edges, num_fallacies, num_factchecks,
+    speakers) for a snapshot dict or a GraphSnapshot model.
+    """
+    if isinstance(snapshot, dict):
+        nodes = snapshot.get("nodes", [])
+        edges = snapshot.get("edges", [])
+        fallacies = [len(n.get("fallacies", [])) for n in nodes]
+        verdicts = [n.get("factcheck_verdict") for n in nodes]
+        node_speakers = [n.get("speaker", "") for n in nodes]
+    else:
+        nodes = snapshot.nodes
+        edges = snapshot.edges
+        fallacies = [len(n.fallacies) for n in nodes]
+        verdicts = [getattr(n.factcheck_verdict, "value", n.factcheck_verdict) for n in nodes]
+        node_speakers = [n.speaker for n in nodes]
+    return {
+        "num_nodes": len(nodes),
+        "num_edges": len(edges),
+        "num_fallacies": sum(fallacies),
+        "num_factchecks": sum(1 for v in verdicts if v not in (None, "pending")),
+        "speakers": list(set(s for s in node_speakers if s)),
+    }
+
+
 def save_snapshot(
     job_id: str,
-    snapshot: dict,
-    transcription: dict = None,
+    snapshot: "dict | str",
+    transcription: "dict | str | None" = None,
+    stats: Optional[dict] = None,
 ) -> str:
     """
     Persist a graph snapshot to the database.
-    Computes metadata (num_nodes, num_edges, etc.) from the snapshot dict.
+
+    snapshot / transcription may be dicts or JSON text (e.g. from pydantic's
+    model_dump_json()); text is bound as ::jsonb without re-encoding. Pass
+    stats=snapshot_stats(model) alongside JSON text, otherwise the metadata
+    (num_nodes, num_edges, etc.) is computed from the snapshot itself.
     Returns the snapshot ID.
     """
     import uuid
@@ -277,16 +308,19 @@ def save_snapshot(
     snapshot_id = str(uuid.uuid4())
 
     # Extract metadata
-    nodes = snapshot.get("nodes", [])
-    edges = snapshot.get("edges", [])
-    num_nodes = len(nodes)
-    num_edges = len(edges)
-    num_fallacies = sum(len(n.get("fallacies", [])) for n in nodes)
-    num_factchecks = sum(
-        1 for n in nodes
-        if n.get("factcheck_verdict") not in (None, "pending")
-    )
-    speakers = list(set(n.get("speaker", "") for n in nodes if n.get("speaker")))
+    if stats is None:
+        stats = snapshot_stats(json.loads(snapshot) if isinstance(snapshot, str) else snapshot)
+    num_nodes = stats["num_nodes"]
+    num_edges = stats["num_edges"]
+    num_fallacies = stats["num_fallacies"]
+    num_factchecks = stats["num_factchecks"]
+    speakers = stats["speakers"]
+
+    snapshot_text = snapshot if isinstance(snapshot, str) else json.dumps(snapshot)
+    if isinstance(transcription, str):
+        transcription_text = transcription
+    else:
+        transcription_text = json.dumps(transcription) if transcription else None
 
     if not db_available:
         logger.debug("DB unavailable: skipping save_snapshot")
@@ -301,13 +335,13 @@ def save_snapshot(
                     INSERT INTO graph_snapshots
                         (id, job_id, snapshot_json, transcription_json,
                          num_nodes, num_edges, num_fallacies, num_factchecks, speakers)
-                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
+                    VALUES (%s, %s, %s::jsonb, %s::jsonb, %s, %s, %s, %s, %s)
                     """,
                     (
                         snapshot_id,
                         job_id,
-                        json.dumps(snapshot),
-                        json.dumps(transcription) if transcription else None,
+                        snapshot_text,
+                        transcription_text,
                         num_nodes,
                         num_edges,
                         num_fallacies,
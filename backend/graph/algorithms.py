@@ -14,18 +14,35 @@ logger = logging.getLogger(__name__)
 
 # ─── Cycle Detection (Circular Reasoning) ───────────────────
 
-def detect_cycles(graph: nx.DiGraph) -> list[list[str]]:
+def detect_cycles(
+    graph: nx.DiGraph,
+    nodes: Optional[set[str]] = None,
+) -> list[list[str]]:
     """
     Detect all simple cycles in the argument graph using DFS.
     Circular reasoning manifests as cycles: A supports B supports C supports A.
 
     Complexity: O(V+E) for cycle detection.
 
+    Args:
+        graph: The argument graph
+        nodes: If given, only return cycles through at least one of these nodes
+               (only their strongly connected components are searched)
+
     Returns:
         List of cycles, where each cycle is a list of node IDs.
     """
     try:
-        cycles = list(nx.simple_cycles(graph))
+        if nodes is None:
+            cycles = list(nx.simple_cycles(graph))
+        else:
+            cycles = []
+            for component in nx.strongly_connected_components(graph):
+                if len(component) > 1 and not component.isdisjoint(nodes):
+                    cycles.extend(
+                        c for c in nx.simple_cycles(graph.subgraph(component))
+                        if not nodes.isdisjoint(c)
+                    )
         if cycles:
             logger.info(f"Detected {len(cycles)} cycle(s) in argument graph")
         return cycles
@@ -71,6 +88,7 @@ def explain_cycle(graph: nx.DiGraph, cycle: list[str]) -> str:
 def detect_strawman_candidates(
     graph: nx.DiGraph,
     similarity_threshold: float = 0.75,
+    nodes: Optional[set[str]] = None,
 ) -> list[dict]:
     """
     Detect potential strawman arguments by finding attack edges
@@ -84,12 +102,28 @@ def detect_strawman_candidates(
     This function identifies structural candidates; semantic verification
     requires embeddings (done in the Skeptic Agent).
 
+    If nodes is given, only edges touching those nodes are examined.
+
     Returns:
         List of candidate dicts with original_claim_id, attacking_claim_id, speaker info
     """
     candidates = []
 
-    for src, tgt, data in graph.edges(data=True):
+    if nodes is None:
+        edges = graph.edges(data=True)
+    else:
+        present = [n for n in nodes if n in graph]
+        # Dedup edges running between two of the given nodes
+        incident = {
+            (src, tgt): data
+            for src, tgt, data in (
+                *graph.out_edges(present, data=True),
+                *graph.in_edges(present, data=True),
+            )
+        }
+        edges = [(src, tgt, data) for (src, tgt), data in incident.items()]
+
+    for src, tgt, data in edges:
         if data.get("relation_type") != "attack":
             continue
 
@@ -115,6 +149,7 @@ def detect_strawman_candidates(
 
 def detect_goalpost_moving(
     graph: nx.DiGraph,
+    nodes: Optional[set[str]] = None,
 ) -> list[dict]:
     """
     Detect potential goal-post moving by tracking how a speaker's
@@ -125,15 +160,30 @@ def detect_goalpost_moving(
     2. Opponent refutes X with evidence
     3. Speaker A shifts to claim Y without conceding X
 
+    If nodes is given, only speakers whose claims could be affected by
+    those nodes (their own speakers and the speakers they attack) are checked.
+
     Returns:
         List of potential goal-post shifts with claim chains
     """
     shifts = []
 
+    affected: Optional[set[str]] = None
+    if nodes is not None:
+        affected = set()
+        for n in nodes:
+            if n not in graph:
+                continue
+            affected.add(graph.nodes[n].get("speaker", "unknown"))
+            for tgt in graph.successors(n):
+                affected.add(graph.nodes[tgt].get("speaker", "unknown"))
+
     # Group claims by speaker
     speakers: dict[str, list[str]] = {}
     for node_id, data in graph.nodes(data=True):
         speaker = data.get("speaker", "unknown")
+        if affected is not None and speaker not in affected:
+            continue
         if speaker not in speakers:
             speakers[speaker] = []
         speakers[speaker].append(node_id)
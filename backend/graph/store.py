@@ -8,12 +8,15 @@ from typing import Optional
 
 import networkx as nx
 
+from utils.json_utils import json_array
+
 from api.models.schemas import (
     Claim,
     ClaimRelation,
     ClaimType,
     EdgeType,
     FallacyAnnotation,
+    FallacyType,
     FactCheckResult,
     FactCheckVerdict,
     SpeakerRigorScore,
@@ -32,16 +35,35 @@ class DebateGraphStore:
     Annotations (fallacies, fact-checks) are stored as node/edge attributes.
     """
 
-    def __init__(self):
+    def __init__(self, track_changes: bool = False):
         self.graph = nx.DiGraph()
         self._claims: dict[str, Claim] = {}
         self._fallacies: dict[str, list[FallacyAnnotation]] = {}
         self._factchecks: dict[str, FactCheckResult] = {}
+        # Claim IDs in insertion order (for "claims added since N" queries)
+        self._claim_order: list[str] = []
+        # Bumped on every mutation; keys the serialized-snapshot cache
+        self._revision: int = 0
+        self._snapshot_cache: Optional[tuple[int, dict]] = None
+        self._snapshot_json_cache: Optional[tuple[int, str]] = None
+        # Changes since the last pop_events(), in order: ("node", claim_id),
+        # ("edge", (src, tgt)), ("fallacy", FallacyAnnotation), ("factcheck", claim_id).
+        # Only recorded when track_changes is set (live streaming); batch runs
+        # never drain the log, so it would just grow
+        self._track_changes = track_changes
+        self._changes: list[tuple[str, object]] = []
+        # O(1) counters for stats/logs (avoid walking every node)
+        self._fallacy_count: int = 0
+        # (claim_id, fallacy_type) of every annotation, for O(1) dedup
+        self._fallacy_keys: set[tuple[str, FallacyType]] = set()
+        self._factcheck_done_count: int = 0
 
     # ─── Node Operations ────────────────────────────────────
 
     def add_claim(self, claim: Claim) -> None:
         """Add a claim as a node in the graph."""
+        if claim.id not in self._claims:
+            self._claim_order.append(claim.id)
         self._claims[claim.id] = claim
         self.graph.add_node(
             claim.id,
@@ -53,6 +75,9 @@ class DebateGraphStore:
             confidence=claim.confidence,
             is_factual=claim.is_factual,
         )
+        if self._track_changes:
+            self._changes.append(("node", claim.id))
+        self._revision += 1
         logger.debug(f"Added claim node: {claim.id} ({claim.claim_type})")
 
     def get_claim(self, claim_id: str) -> Optional[Claim]:
@@ -63,6 +88,10 @@ class DebateGraphStore:
         """Get all claims in the graph."""
         return list(self._claims.values())
 
+    def claims_since(self, start: int) -> list[Claim]:
+        """Claims added after the first `start` ones (pair with num_claims)."""
+        return [self._claims[cid] for cid in self._claim_order[start:]]
+
     def get_claims_by_speaker(self, speaker: str) -> list[Claim]:
         """Get all claims made by a specific speaker."""
         return [c for c in self._claims.values() if c.speaker == speaker]
@@ -88,6 +117,9 @@ class DebateGraphStore:
             relation_type=relation.relation_type.value,
             confidence=relation.confidence,
         )
+        if self._track_changes:
+            self._changes.append(("edge", (relation.source_id, relation.target_id)))
+        self._revision += 1
         logger.debug(
             f"Added edge: {relation.source_id} --[{relation.relation_type}]--> {relation.target_id}"
         )
@@ -111,8 +143,17 @@ class DebateGraphStore:
         if annotation.claim_id not in self._fallacies:
             self._fallacies[annotation.claim_id] = []
         self._fallacies[annotation.claim_id].append(annotation)
+        self._fallacy_count += 1
+        self._fallacy_keys.add((annotation.claim_id, annotation.fallacy_type))
+        if self._track_changes:
+            self._changes.append(("fallacy", annotation))
+        self._revision += 1
         logger.debug(f"Added fallacy {annotation.fallacy_type} to claim {annotation.claim_id}")
 
+    def has_fallacy(self, claim_id: str, fallacy_type: FallacyType) -> bool:
+        """Whether claim_id already carries a fallacy of this type."""
+        return (claim_id, fallacy_type) in self._fallacy_keys
+
     def get_fallacies(self, claim_id: str) -> list[FallacyAnnotation]:
         """Get all fallacy annotations for a claim."""
         return self._fallacies.get(claim_id, [])
@@ -126,7 +167,15 @@ class DebateGraphStore:
 
     def add_factcheck(self, result: FactCheckResult) -> None:
         """Add a fact-check result to a claim."""
+        previous = self._factchecks.get(result.claim_id)
+        if previous is not None and previous.verdict != FactCheckVerdict.PENDING:
+            self._factcheck_done_count -= 1
+        if result.verdict != FactCheckVerdict.PENDING:
+            self._factcheck_done_count += 1
         self._factchecks[result.claim_id] = result
+        if self._track_changes:
+            self._changes.append(("factcheck", result.claim_id))
+        self._revision += 1
         logger.debug(f"Added fact-check {result.verdict} to claim {result.claim_id}")
 
     def get_factcheck(self, claim_id: str) -> Optional[FactCheckResult]:
@@ -143,6 +192,24 @@ class DebateGraphStore:
     def num_edges(self) -> int:
         return self.graph.number_of_edges()
 
+    @property
+    def num_claims(self) -> int:
+        return len(self._claim_order)
+
+    @property
+    def num_fallacies(self) -> int:
+        return self._fallacy_count
+
+    @property
+    def num_factchecks(self) -> int:
+        """Claims with a non-pending fact-check verdict."""
+        return self._factcheck_done_count
+
+    @property
+    def revision(self) -> int:
+        """Monotonic counter incremented on every claim/edge/annotation change."""
+        return self._revision
+
     # ─── Rigor Score Computation ────────────────────────────
 
     def compute_rigor_scores(self) -> list[SpeakerRigorScore]:
@@ -151,64 +218,66 @@ class DebateGraphStore:
         Based on: supported ratio, fallacy count, fact-check rate,
         internal consistency, and direct response rate.
         """
-        speakers = self.get_speakers()
-        scores = []
-
-        for speaker in speakers:
-            claims = self.get_claims_by_speaker(speaker)
-            if not claims:
-                continue
+        # One pass over claims and one over edges, instead of nested
+        # per-speaker scans of every claim pair
+        total: dict[str, int] = {}
+        fallacy_counts: dict[str, int] = {}
+        factual: dict[str, int] = {}
+        factual_supported: dict[str, int] = {}
+        for c in self._claims.values():
+            spk = c.speaker
+            total[spk] = total.get(spk, 0) + 1
+            fallacy_counts[spk] = fallacy_counts.get(spk, 0) + len(self._fallacies.get(c.id, ()))
+            if c.is_factual:
+                factual[spk] = factual.get(spk, 0) + 1
+                fc = self._factchecks.get(c.id)
+                if fc is not None and fc.verdict == FactCheckVerdict.SUPPORTED:
+                    factual_supported[spk] = factual_supported.get(spk, 0) + 1
+
+        supported_ids: set[str] = set()   # claims with at least one incoming support edge
+        responding_ids: set[str] = set()  # claims linked (either way) to another speaker's claim
+        contradictions: dict[str, int] = {}
+        for src, tgt, relation_type in self.graph.edges(data="relation_type"):
+            if relation_type == "support":
+                supported_ids.add(tgt)
+            src_speaker = self._claims[src].speaker
+            if src_speaker != self._claims[tgt].speaker:
+                responding_ids.add(src)
+                responding_ids.add(tgt)
+            elif relation_type == "attack" and src != tgt:
+                # Internal consistency: self-contradictions
+                contradictions[src_speaker] = contradictions.get(src_speaker, 0) + 1
+
+        supported: dict[str, int] = {}
+        for cid in supported_ids:
+            spk = self._claims[cid].speaker
+            supported[spk] = supported.get(spk, 0) + 1
+        direct_responses: dict[str, int] = {}
+        for cid in responding_ids:
+            spk = self._claims[cid].speaker
+            direct_responses[spk] = direct_responses.get(spk, 0) + 1
 
-            total_claims = len(claims)
+        scores = []
+        for speaker in self.get_speakers():
+            total_claims = total[speaker]
 
             # Supported ratio: claims that have at least one support edge
-            supported = sum(
-                1 for c in claims
-                if any(
-                    self.graph.has_edge(other, c.id)
-                    and self.graph[other][c.id].get("relation_type") == "support"
-                    for other in self.graph.predecessors(c.id)
-                )
-            )
-            supported_ratio = supported / total_claims if total_claims > 0 else 0.0
+            supported_ratio = supported.get(speaker, 0) / total_claims
 
             # Fallacy count and penalty
-            fallacy_count = sum(len(self.get_fallacies(c.id)) for c in claims)
+            fallacy_count = fallacy_counts[speaker]
             fallacy_penalty = min(fallacy_count * 0.1, 0.5)  # max 50% penalty
 
             # Fact-check positive rate
-            factual_claims = [c for c in claims if c.is_factual]
-            if factual_claims:
-                checked = [
-                    c for c in factual_claims
-                    if c.id in self._factchecks
-                    and self._factchecks[c.id].verdict == FactCheckVerdict.SUPPORTED
-                ]
-                factcheck_rate = len(checked) / len(factual_claims)
+            if factual.get(speaker):
+                factcheck_rate = factual_supported.get(speaker, 0) / factual[speaker]
             else:
                 factcheck_rate = 0.5  # neutral if no factual claims
 
-            # Internal consistency: check for self-contradictions
-            contradictions = 0
-            for c1 in claims:
-                for c2 in claims:
-                    if c1.id != c2.id and self.graph.has_edge(c1.id, c2.id):
-                        edge_data = self.graph[c1.id][c2.id]
-                        if edge_data.get("relation_type") == "attack":
-                            contradictions += 1
-            consistency = max(0.0, 1.0 - (contradictions * 0.15))
+            consistency = max(0.0, 1.0 - (contradictions.get(speaker, 0) * 0.15))
 
             # Direct response rate: how often this speaker responds to opponent claims
-            other_speakers_claims = [
-                c for c in self._claims.values() if c.speaker != speaker
-            ]
-            direct_responses = 0
-            for c in claims:
-                for other_c in other_speakers_claims:
-                    if self.graph.has_edge(c.id, other_c.id) or self.graph.has_edge(other_c.id, c.id):
-                        direct_responses += 1
-                        break
-            response_rate = direct_responses / total_claims if total_claims > 0 else 0.0
+            response_rate = direct_responses.get(speaker, 0) / total_claims
 
             # Composite score
             overall = (
@@ -234,36 +303,41 @@ class DebateGraphStore:
 
     # ─── Snapshot for Frontend ──────────────────────────────
 
+    def _build_node(self, claim_id: str) -> GraphNode:
+        claim = self._claims[claim_id]
+        fc = self._factchecks.get(claim_id)
+        return GraphNode(
+            id=claim.id,
+            label=claim.text[:80] + ("..." if len(claim.text) > 80 else ""),
+            full_text=claim.text,
+            speaker=claim.speaker,
+            claim_type=claim.claim_type,
+            timestamp_start=claim.timestamp_start,
+            timestamp_end=claim.timestamp_end,
+            confidence=claim.confidence,
+            is_factual=claim.is_factual,
+            factcheck_verdict=fc.verdict if fc else FactCheckVerdict.PENDING,
+            factcheck=fc,
+            fallacies=self.get_fallacies(claim_id),
+        )
+
+    def _build_edge(self, src: str, tgt: str, data: dict) -> GraphEdge:
+        return GraphEdge(
+            source=src,
+            target=tgt,
+            relation_type=EdgeType(data.get("relation_type", "support")),
+            confidence=data.get("confidence", 0.7),
+        )
+
     def to_snapshot(self) -> GraphSnapshot:
         """
         Export the current graph state as a GraphSnapshot for the frontend.
         """
-        nodes = []
-        for claim_id, claim in self._claims.items():
-            fc = self._factchecks.get(claim_id)
-            nodes.append(GraphNode(
-                id=claim.id,
-                label=claim.text[:80] + ("..." if len(claim.text) > 80 else ""),
-                full_text=claim.text,
-                speaker=claim.speaker,
-                claim_type=claim.claim_type,
-                timestamp_start=claim.timestamp_start,
-                timestamp_end=claim.timestamp_end,
-                confidence=claim.confidence,
-                is_factual=claim.is_factual,
-                factcheck_verdict=fc.verdict if fc else FactCheckVerdict.PENDING,
-                factcheck=fc,
-                fallacies=self.get_fallacies(claim_id),
-            ))
-
-        edges = []
-        for src, tgt, data in self.graph.edges(data=True):
-            edges.append(GraphEdge(
-                source=src,
-                target=tgt,
-                relation_type=EdgeType(data.get("relation_type", "support")),
-                confidence=data.get("confidence", 0.7),
-            ))
+        nodes = [self._build_node(claim_id) for claim_id in self._claims]
+        edges = [
+            self._build_edge(src, tgt, data)
+            for src, tgt, data in self.graph.edges(data=True)
+        ]
 
         from graph.algorithms import detect_cycles
         cycles = detect_cycles(self.graph)
@@ -274,3 +348,87 @@ class DebateGraphStore:
             rigor_scores=self.compute_rigor_scores(),
             cycles_detected=cycles,
         )
+
+    def pop_events(self) -> list[dict]:
+        """
+        Per-object change events since the previous call, in order, then
+        reset the change log:
+
+          {"type": "node_added", "node_json": ...}
+          {"type": "edge_added", "edge_json": ...}
+          {"type": "fallacy_added", "claim_id": ..., "fallacy_json": ...}
+          {"type": "factcheck_added", "claim_id": ..., "factcheck_json": ...}
+
+        A node added in the same batch is sent in its current state, so its
+        own fallacy/fact-check events are folded into node_added. The *_json
+        values are pre-serialized by pydantic's Rust encoder (see
+        utils.json_utils.encode_message). Always empty unless the store was
+        created with track_changes=True.
+        """
+        changes, self._changes = self._changes, []
+        new_nodes = {ref for kind, ref in changes if kind == "node"}
+        events = []
+        for kind, ref in changes:
+            if kind == "node":
+                if ref in self._claims:
+                    events.append({
+                        "type": "node_added",
+                        "node_json": self._build_node(ref).model_dump_json(),
+                    })
+            elif kind == "edge":
+                src, tgt = ref
+                if self.graph.has_edge(src, tgt):
+                    events.append({
+                        "type": "edge_added",
+                        "edge_json": self._build_edge(src, tgt, self.graph[src][tgt]).model_dump_json(),
+                    })
+            elif kind == "fallacy":
+                if ref.claim_id not in new_nodes:
+                    events.append({
+                        "type": "fallacy_added",
+                        "claim_id": ref.claim_id,
+                        "fallacy_json": ref.model_dump_json(),
+                    })
+            elif kind == "factcheck":
+                fc = self._factchecks.get(ref)
+                if ref not in new_nodes and fc is not None:
+                    events.append({
+                        "type": "factcheck_added",
+                        "claim_id": ref,
+                        "factcheck_json": fc.model_dump_json(),
+                    })
+        return events
+
+    def graph_summary(self) -> dict:
+        """Graph-wide derived data (rigor scores, cycles) for the per-chunk stats tick."""
+        from graph.algorithms import detect_cycles
+        return {
+            "rigor_scores_json": json_array(
+                [s.model_dump_json() for s in self.compute_rigor_scores()]
+            ),
+            "cycles_detected": detect_cycles(self.graph),
+        }
+
+    def snapshot_dump(self) -> dict:
+        """
+        JSON-ready dict of to_snapshot(), memoized per revision.
+        Repeated emits of an unchanged graph reuse the same dict instead of
+        re-walking the pydantic tree. Callers must treat it as read-only.
+        """
+        cache = self._snapshot_cache
+        if cache is None or cache[0] != self._revision:
+            cache = (self._revision, self.to_snapshot().model_dump(mode="json"))
+            self._snapshot_cache = cache
+        return cache[1]
+
+    def snapshot_json(self) -> str:
+        """
+        JSON text of to_snapshot(), memoized per revision.
+        Serialized straight from the models by pydantic's Rust encoder,
+        without building the intermediate dict.
+        """
+        cache = self._snapshot_json_cache
+        if cache is None or cache[0] != self._revision:
+            cache = (self._revision, self.to_snapshot().model_dump_json())
+            self._snapshot_json_cache = cache
+        return cache[1]
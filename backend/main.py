@@ -109,7 +109,8 @@ async def run_demo():
 
     logger.info("Running demo analysis...")
 
-    transcription = _transcribe_demo("demo")
+    # The pipeline only reads the transcript, so the shared demo result is safe
+    transcription = _transcribe_demo("demo", copy=False)
     graph_store = DebateGraphStore()
     snapshot = await run_analysis_pipeline(transcription, graph_store)
 
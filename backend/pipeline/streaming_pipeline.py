@@ -9,7 +9,7 @@ Designed for real-time audio input:
 - Runs LLM fallacy detection on new claims (async)
 - Runs fact-checking in background (non-blocking)
 - Merges results into a shared DebateGraphStore
-- Emits graph_update events via callback
+- Emits per-object events (node_added, edge_added, ...) + a stats tick via callback
 
 Architecture:
   AudioChunk (bytes) -> transcribe -> new segments
@@ -17,35 +17,95 @@ Architecture:
                      -> SkepticAgent (structural, instant)
                      -> [async] SkepticAgent LLM
                      -> [async] ResearcherAgent
-                     -> callback(snapshot_delta)
+                     -> callback(node_added / edge_added / ... / stats)
 """
 
 import os
 import io
+import json
+import sys
 import time
+import tempfile
 import asyncio
 import logging
-import tempfile
+from collections import deque
+from functools import lru_cache
+from itertools import islice
 from typing import Callable, Awaitable, Optional
-from pathlib import Path
 
 from api.models.schemas import (
-    TranscriptionResult,
     TranscriptionSegment,
     GraphSnapshot,
 )
 from graph.store import DebateGraphStore
+from pipeline.transcription import _normalize_speaker
 from agents.ontological import OntologicalAgent
 from agents.skeptic import SkepticAgent
 from agents.researcher import ResearcherAgent
 from config.logging_config import setup_session_logging
+from config.settings import (
+    STT_RACE_FALLBACK,
+    STT_DIARIZE_GRACE_SECONDS,
+    STT_NORMALIZE_AUDIO,
+    STT_NORMALIZE_MIN_BYTES,
+    OPENAI_MAX_RPM,
+    OPENAI_MAX_CONCURRENT,
+    LLM_MAX_RPM,
+    MAX_CONCURRENT_LLM_CALLS,
+    RATE_LIMIT_RETRIES,
+    LIVE_MAX_MEM_SEGMENTS,
+)
 from session_log.session_structured_logger import SessionLogger
+from utils.audio import decode_to_wav_bytes
+from utils.json_utils import dumps
+from utils.rate_limit import AsyncRateLimiter, call_with_backoff
 
 logger = logging.getLogger("debategraph.streaming")
 
+# Max chunks waiting per background worker before the oldest is dropped
+_BG_QUEUE_SIZE = 8
+
+# LLM fallacy detection: claims queued since the last tick are analysed together,
+# at most _FALLACY_BATCH_MAX per request (same batch size as SkepticAgent.analyze)
+_FALLACY_BATCH_SECONDS = 2.0
+_FALLACY_BATCH_MAX = 15
+
+# File extension -> MIME type sent with the chunk upload (unknown -> WebM, the
+# MediaRecorder default)
+_FORMAT_TABLE: dict[str, str] = {
+    "webm": "audio/webm",
+    "mp3": "audio/mpeg",
+    "wav": "audio/wav",
+    "m4a": "audio/mp4",
+    "mp4": "audio/mp4",
+    "ogg": "audio/ogg",
+    "flac": "audio/flac",
+}
+_DEFAULT_MIME = "audio/webm"
+
+# Seconds finalize() gives each background worker to drain before cancelling it
+_FINALIZE_WORKER_TIMEOUT = 60.0
+
+# Max background LLM/search work units (fallacy batches + fact-checks) in flight
+_BG_CONCURRENCY = 4
+
+# Window (seconds) in which background graph changes are coalesced into one emit
+_EMIT_DEBOUNCE_SECONDS = 0.25
+
 
 # ─── Speaker tracking ────────────────────────────────────────────────────────
 
+@lru_cache(maxsize=None)
+def _canonical_id(idx: int) -> str:
+    """Interned canonical speaker ID for position idx (SPEAKER_00, SPEAKER_01, ...)."""
+    return sys.intern(f"SPEAKER_{idx:02d}")
+
+
+def _segment_out(seg: TranscriptionSegment) -> dict:
+    """Plain wire dict for a segment (skips pydantic's model_dump machinery)."""
+    return {"speaker": seg.speaker, "text": seg.text, "start": seg.start, "end": seg.end}
+
+
 class SpeakerReconciler:
     """
     Reconciles speaker IDs across chunks.
@@ -61,10 +121,8 @@ class SpeakerReconciler:
     def __init__(self):
         # Map from raw per-chunk speaker IDs to canonical IDs
         self._canonical_map: dict[str, str] = {}
-        # Canonical speakers in order of first appearance
-        self._canonical_speakers: list[str] = []
-        # Track which raw IDs appear in each chunk for ordering
-        self._chunk_raw_order: list[str] = []
+        # Canonical speakers in order of first appearance (dict = ordered set)
+        self._canonical_speakers: dict[str, None] = {}
         self._last_canonical: str | None = None
 
     def reconcile(self, raw_speaker: str) -> str:
@@ -77,58 +135,56 @@ class SpeakerReconciler:
         # New raw speaker — assign canonical ID
         if not self._canonical_speakers:
             # First speaker ever
-            canonical = "SPEAKER_00"
+            canonical = _canonical_id(0)
         elif self._last_canonical and len(self._canonical_speakers) == 1:
             # Second speaker appears — they're definitely different
-            canonical = "SPEAKER_01"
+            canonical = _canonical_id(1)
         else:
             # Additional speaker — assign next canonical ID
-            idx = len(self._canonical_speakers)
-            canonical = f"SPEAKER_{idx:02d}"
+            canonical = _canonical_id(len(self._canonical_speakers))
 
         self._canonical_map[raw_speaker] = canonical
-        if canonical not in self._canonical_speakers:
-            self._canonical_speakers.append(canonical)
+        self._canonical_speakers.setdefault(canonical, None)
         self._last_canonical = canonical
         return canonical
 
-    def start_new_chunk(self, chunk_speakers: list[str]) -> None:
+    def reconcile_with_order(
+        self,
+        raw_speaker: str,
+        first_seen_idx: int,
+        chunk_first_raw: str | None = None,
+    ) -> str:
         """
-        Called at the start of each new chunk with the raw speaker IDs
-        found in that chunk (in order of appearance).
+        Reconcile a raw speaker while walking a chunk's segments in order.
 
-        For chunks after the first, we try to map speakers based on
-        the assumption that chunks with 2 speakers usually have the same
-        2 canonical speakers, just with different raw IDs.
-        """
-        if not chunk_speakers:
-            return
+        first_seen_idx is the position of raw_speaker among the chunk's
+        distinct raw IDs (0 = first voice heard in the chunk) and
+        chunk_first_raw is the raw ID at position 0.
 
-        # If we have 2 canonical speakers and 2 chunk speakers,
-        # map based on speaking order continuity
-        if len(self._canonical_speakers) >= 2 and len(chunk_speakers) >= 2:
-            # The first speaker in a new chunk is likely continuing from
-            # where the last chunk left off (or the other speaker responding)
-            first_raw = chunk_speakers[0]
-            second_raw = chunk_speakers[1] if len(chunk_speakers) > 1 else None
-
-            if first_raw not in self._canonical_map:
-                # Assign first speaker based on who spoke last
-                if self._last_canonical == self._canonical_speakers[0]:
-                    # Last chunk ended with SPEAKER_00, this chunk probably
-                    # starts with SPEAKER_01 (new turn) or SPEAKER_00 (continuation)
-                    # Default: treat new chunk first speaker as SPEAKER_00
-                    self._canonical_map[first_raw] = self._canonical_speakers[0]
+        Once two canonical speakers exist, an unseen first speaker in a new
+        chunk is assumed to continue from where the last chunk left off, and
+        an unseen second speaker is assumed to be the other canonical one.
+        """
+        if (
+            raw_speaker not in self._canonical_map
+            and len(self._canonical_speakers) >= 2
+            and first_seen_idx < 2
+        ):
+            if first_seen_idx == 0:
+                # Last chunk ended with SPEAKER_00 -> treat this chunk's first
+                # speaker as SPEAKER_00 (continuation), otherwise SPEAKER_01
+                if self._last_canonical == _canonical_id(0):
+                    self._canonical_map[raw_speaker] = _canonical_id(0)
                 else:
-                    self._canonical_map[first_raw] = self._canonical_speakers[1] if len(self._canonical_speakers) > 1 else self._canonical_speakers[0]
-
-            if second_raw and second_raw not in self._canonical_map:
+                    self._canonical_map[raw_speaker] = _canonical_id(1)
+            else:
                 # Second speaker is the other one
-                first_canonical = self._canonical_map.get(first_raw)
-                if first_canonical == self._canonical_speakers[0]:
-                    self._canonical_map[second_raw] = self._canonical_speakers[1]
+                first_canonical = self._canonical_map.get(chunk_first_raw)
+                if first_canonical == _canonical_id(0):
+                    self._canonical_map[raw_speaker] = _canonical_id(1)
                 else:
-                    self._canonical_map[second_raw] = self._canonical_speakers[0]
+                    self._canonical_map[raw_speaker] = _canonical_id(0)
+        return self.reconcile(raw_speaker)
 
     @property
     def num_speakers(self) -> int:
@@ -161,8 +217,28 @@ class LiveStreamingPipeline:
         self.enable_llm_fallacy = enable_llm_fallacy
 
         # Shared state
-        self.graph_store = DebateGraphStore()
+        self.graph_store = DebateGraphStore(track_changes=True)
         self.all_segments: list[TranscriptionSegment] = []
+        # Wire dict of each segment (_segment_out), built once when it is appended
+        self._segment_dumps: list[dict] = []
+        # Segments older than the last LIVE_MAX_MEM_SEGMENTS live in a JSONL spill file
+        self._spilled_segments = 0
+        self._segment_spill_path = os.path.join(
+            tempfile.gettempdir(), f"debategraph_{self.session_id}_segments.jsonl"
+        )
+        # Distinct speakers seen in all_segments
+        self._speakers: set[str] = set()
+        # Speaker of the most recent segment (fallback for non-diarized STT)
+        self._last_speaker: str = "SPEAKER_00"
+        # Graph revision last sent to the client (skip re-sending an unchanged graph)
+        self._last_emitted_rev: int = -1
+        # Claims added since the last structural fallacy scan
+        self._dirty_claims: set[str] = set()
+        # Factual claim ids waiting for a fact-check, in extraction order
+        self._factcheck_pending: deque[str] = deque()
+        # Debounced emit from background workers (see _schedule_emit)
+        self._pending_emit: Optional[asyncio.Task] = None
+        self._pending_emit_chunk: int = 0
         self.processed_segment_count = 0
         self.chunk_count = 0
         self.start_time = 0.0
@@ -180,11 +256,27 @@ class LiveStreamingPipeline:
         self._skeptic: Optional[SkepticAgent] = None
         self._researcher: Optional[ResearcherAgent] = None
 
-        # Background tasks
-        self._bg_tasks: list[asyncio.Task] = []
-
-        # OpenAI client
+        # Background workers (created in start()). Fact-checks are fed by a bounded
+        # queue so a long stream never accumulates hundreds of pending jobs; LLM
+        # fallacy detection batches the claim IDs queued here on a timer.
+        self._pending_fallacy_claims: dict[str, None] = {}
+        self._closing: Optional[asyncio.Event] = None
+        self._factcheck_q: Optional[asyncio.Queue] = None
+        self._fallacy_worker_task: Optional[asyncio.Task] = None
+        self._factcheck_worker_task: Optional[asyncio.Task] = None
+        # Every background task, removed again by a done-callback when it finishes
+        self._bg_tasks: set[asyncio.Task] = set()
+        # Shared cap on concurrent background work units
+        self._bg_sem = asyncio.Semaphore(_BG_CONCURRENCY)
+
+        # OpenAI client (+ pooled HTTP client reused across all chunks)
         self._openai_client = None
+        self._http_client = None
+
+        # Client-side rate limits: OpenAI transcription, and the Anthropic calls
+        # made by the background skeptic/researcher agents (created in start())
+        self._openai_limiter: Optional[AsyncRateLimiter] = None
+        self._llm_limiter: Optional[AsyncRateLimiter] = None
 
         # Structured session logger (set in start() when session_dir exists)
         self._session_logger: Optional[SessionLogger] = None
@@ -196,18 +288,53 @@ class LiveStreamingPipeline:
         self._session_logger = SessionLogger(session_dir)
         logger.info(f"[{self.session_id}] Live streaming pipeline started (logs: {session_dir})")
 
+        self._openai_limiter = AsyncRateLimiter(OPENAI_MAX_RPM, 60.0, OPENAI_MAX_CONCURRENT)
+        self._llm_limiter = AsyncRateLimiter(LLM_MAX_RPM, 60.0, MAX_CONCURRENT_LLM_CALLS)
+
         # Initialize agents with session logger for structured LLM/node/edge logs
         self._ontological = OntologicalAgent(session_logger=self._session_logger)
-        self._skeptic = SkepticAgent(session_logger=self._session_logger)
+        self._skeptic = SkepticAgent(
+            session_logger=self._session_logger, rate_limiter=self._llm_limiter
+        )
         if self.enable_factcheck:
-            self._researcher = ResearcherAgent(session_logger=self._session_logger)
+            self._researcher = ResearcherAgent(
+                session_logger=self._session_logger, rate_limiter=self._llm_limiter
+            )
+
+        # Start background workers
+        self._closing = asyncio.Event()
+        self._factcheck_q = asyncio.Queue(maxsize=_BG_QUEUE_SIZE)
+        self._fallacy_worker_task = self._spawn_bg(self._fallacy_batch_worker())
+        self._factcheck_worker_task = self._spawn_bg(
+            self._bg_worker(self._factcheck_q, self._run_factcheck_bg)
+        )
 
         # Initialize OpenAI client
         api_key = os.getenv("OPENAI_API_KEY", "")
         if api_key:
+            import httpx
             from openai import AsyncOpenAI
-            self._openai_client = AsyncOpenAI(api_key=api_key)
-            logger.info(f"[{self.session_id}] OpenAI async client initialized")
+            try:
+                import h2  # noqa: F401 — required by httpx for HTTP/2
+                http2 = True
+            except ImportError:
+                http2 = False
+            # Keep connections alive between chunks so each request skips the TLS handshake
+            # (limits/http2 live on the transport: httpx ignores them on the client when one is given)
+            self._http_client = httpx.AsyncClient(
+                transport=httpx.AsyncHTTPTransport(
+                    http2=http2,
+                    retries=2,
+                    limits=httpx.Limits(
+                        max_keepalive_connections=32,
+                        max_connections=64,
+                        keepalive_expiry=300,
+                    ),
+                ),
+                timeout=httpx.Timeout(120.0, connect=10.0),
+            )
+            self._openai_client = AsyncOpenAI(api_key=api_key, http_client=self._http_client)
+            logger.info(f"[{self.session_id}] OpenAI async client initialized (http2={http2})")
         else:
             logger.warning(f"[{self.session_id}] No OPENAI_API_KEY — transcription unavailable")
 
@@ -260,11 +387,22 @@ class LiveStreamingPipeline:
             "time_offset": time_offset,
         })
 
-        # Step 1: Transcribe
+        # Step 1: Transcribe (MIME type resolved once from the filename extension)
+        mime = _FORMAT_TABLE.get(filename.rpartition(".")[2].lower(), _DEFAULT_MIME)
+        if STT_NORMALIZE_AUDIO and len(audio_bytes) > STT_NORMALIZE_MIN_BYTES:
+            # Decode once here so every transcription attempt gets the same WAV
+            try:
+                audio_bytes = await asyncio.to_thread(decode_to_wav_bytes, audio_bytes)
+                filename, mime = "chunk.wav", "audio/wav"
+            except Exception as e:
+                logger.warning(f"[{self.session_id}] Chunk {chunk_index} decode failed, sending raw: {e}")
+        transcribe_task = asyncio.create_task(
+            self._transcribe_chunk(audio_bytes, time_offset, filename, mime)
+        )
+        # While the chunk uploads, push out results background work left pending
+        await self._flush_pending_emits()
         try:
-            new_segments = await self._transcribe_chunk(
-                audio_bytes, time_offset, filename
-            )
+            new_segments = await transcribe_task
         except Exception as e:
             logger.error(f"[{self.session_id}] Transcription failed for chunk {chunk_index}: {e}")
             await self.on_update({
@@ -279,24 +417,34 @@ class LiveStreamingPipeline:
             logger.info(f"[{self.session_id}] Chunk {chunk_index}: no segments transcribed")
             return
 
+        # Dump each new segment once; the log, the websocket and the transcript reuse it
+        new_dumps = [_segment_out(s) for s in new_segments]
+        new_segments_json = dumps(new_dumps)
+
         transcribe_duration = time.time() - chunk_start
         if self._session_logger:
             self._session_logger.log_transcription_chunk(
                 chunk_index=chunk_index,
                 time_offset=time_offset,
-                segments=[s.model_dump() for s in new_segments],
+                segments=new_dumps,
                 duration_seconds=round(transcribe_duration, 3),
+                segments_json=new_segments_json,
             )
 
         # Add to full transcript
         self.all_segments.extend(new_segments)
+        self._segment_dumps.extend(new_dumps)
+        self._speakers.update(s.speaker for s in new_segments)
+        self._last_speaker = new_segments[-1].speaker
+        if len(self._segment_dumps) > LIVE_MAX_MEM_SEGMENTS:
+            await self._spill_old_segments()
 
         # Notify: transcription done
         await self.on_update({
             "type": "transcription_update",
             "chunk_index": chunk_index,
-            "new_segments": [s.model_dump() for s in new_segments],
-            "total_segments": len(self.all_segments),
+            "new_segments_json": new_segments_json.decode("utf-8"),
+            "total_segments": self._spilled_segments + len(self.all_segments),
         })
 
         logger.info(
@@ -305,10 +453,13 @@ class LiveStreamingPipeline:
         )
 
         # Step 2: Extract claims from new segments only
+        claims_before = self.graph_store.num_claims
         try:
             await self._extract_claims(new_segments, chunk_index)
         except Exception as e:
             logger.error(f"[{self.session_id}] Claim extraction failed: {e}", exc_info=True)
+        new_claims = self.graph_store.claims_since(claims_before)
+        self._dirty_claims.update(c.id for c in new_claims)
 
         # Step 3: Structural fallacy detection (instant, no LLM)
         try:
@@ -316,21 +467,22 @@ class LiveStreamingPipeline:
         except Exception as e:
             logger.error(f"[{self.session_id}] Structural fallacy detection failed: {e}")
 
-        # Step 4: Emit graph update
-        await self._emit_graph_update(chunk_index)
+        # Step 4: Emit graph update (transcript already went out via transcription_update,
+        # so a chunk that added nothing to the graph only needs a lightweight ack)
+        if self.graph_store.revision != self._last_emitted_rev:
+            await self._emit_graph_update(chunk_index)
+        else:
+            await self.on_update({"type": "chunk_processed", "chunk_index": chunk_index})
 
-        # Step 5: Background tasks (LLM fallacy + fact-check)
+        # Step 5: Background work (LLM fallacy + fact-check), handed to the workers
         if self.enable_llm_fallacy and self._skeptic and self._skeptic.client:
-            task = asyncio.create_task(
-                self._run_llm_fallacy_bg(chunk_index)
-            )
-            self._bg_tasks.append(task)
+            for claim in new_claims:
+                self._pending_fallacy_claims[claim.id] = None
 
         if self.enable_factcheck and self._researcher:
-            task = asyncio.create_task(
-                self._run_factcheck_bg(chunk_index)
-            )
-            self._bg_tasks.append(task)
+            self._factcheck_pending.extend(c.id for c in new_claims if c.is_factual)
+            if self._factcheck_pending:
+                self._enqueue_bg(self._factcheck_q, chunk_index)
 
         logger.info(
             f"[{self.session_id}] Chunk {chunk_index} processed in "
@@ -352,18 +504,67 @@ class LiveStreamingPipeline:
             "message": "Computing final analysis...",
         })
 
-        # Wait for all background tasks (with timeout)
-        if self._bg_tasks:
-            pending = [t for t in self._bg_tasks if not t.done()]
-            if pending:
-                logger.info(f"[{self.session_id}] Waiting for {len(pending)} background tasks...")
+        # Drain background workers (each with its own timeout)
+        workers = {
+            name: t for name, t in (
+                ("fallacy", self._fallacy_worker_task),
+                ("fact-check", self._factcheck_worker_task),
+            )
+            if t is not None and not t.done()
+        }
+        if workers:
+            logger.info(
+                f"[{self.session_id}] Waiting for background workers "
+                f"({len(self._pending_fallacy_claims)} claims awaiting fallacy check, "
+                f"{self._factcheck_q.qsize()} fact-check jobs queued)..."
+            )
+            # Both workers exit once their pending work is drained
+            self._closing.set()
+            if "fact-check" in workers:
                 try:
-                    await asyncio.wait_for(
-                        asyncio.gather(*pending, return_exceptions=True),
-                        timeout=60.0
+                    self._factcheck_q.put_nowait(None)
+                except asyncio.QueueFull:
+                    # Backlogged worker: the sentinel goes in once a slot frees up,
+                    # so a stuck worker is left to the timeout below
+                    self._spawn_bg(self._factcheck_q.put(None))
+            # shield() keeps wait_for from cancelling a worker; timed-out ones are
+            # cancelled below, one at a time, without affecting the other
+            results = await asyncio.gather(
+                *[
+                    asyncio.wait_for(asyncio.shield(t), timeout=_FINALIZE_WORKER_TIMEOUT)
+                    for t in workers.values()
+                ],
+                return_exceptions=True,
+            )
+            timed_out = []
+            for (name, t), result in zip(workers.items(), results):
+                if isinstance(result, asyncio.TimeoutError):
+                    logger.warning(
+                        f"[{self.session_id}] Background {name} worker timed out — cancelling"
                     )
-                except asyncio.TimeoutError:
-                    logger.warning(f"[{self.session_id}] Background tasks timed out")
+                    t.cancel()
+                    timed_out.append(t)
+                elif isinstance(result, BaseException):
+                    logger.error(f"[{self.session_id}] Background {name} worker failed: {result}")
+            if timed_out:
+                await asyncio.wait(timed_out, timeout=2.0)
+        self._fallacy_worker_task = None
+        self._factcheck_worker_task = None
+        # Anything still registered (e.g. a debounced delta) is superseded
+        # by the final snapshot
+        for t in list(self._bg_tasks):
+            t.cancel()
+        self._pending_emit = None
+
+        # Stitch the spilled head of the transcript back on for the closing snapshot
+        if self._spilled_segments:
+            try:
+                spilled = await asyncio.to_thread(self._read_spilled_segments)
+                self._segment_dumps = spilled + self._segment_dumps
+                self._spilled_segments = 0
+                os.remove(self._segment_spill_path)
+            except Exception as e:
+                logger.error(f"[{self.session_id}] Failed to reload spilled segments: {e}")
 
         # Compute rigor scores
         rigor_scores = self.graph_store.compute_rigor_scores()
@@ -374,9 +575,9 @@ class LiveStreamingPipeline:
         total_time = time.time() - self.start_time
         logger.info(
             f"[{self.session_id}] Stream finalized: "
-            f"{len(snapshot.nodes)} nodes, {len(snapshot.edges)} edges, "
-            f"{sum(len(n.fallacies) for n in snapshot.nodes)} fallacies, "
-            f"{len([n for n in snapshot.nodes if n.factcheck_verdict.value != 'pending'])} factchecks "
+            f"{self.graph_store.num_nodes} nodes, {self.graph_store.num_edges} edges, "
+            f"{self.graph_store.num_fallacies} fallacies, "
+            f"{self.graph_store.num_factchecks} factchecks "
             f"in {total_time:.1f}s"
         )
 
@@ -386,16 +587,35 @@ class LiveStreamingPipeline:
             "type": "stream_complete",
             "session_id": self.session_id,
             "total_time": total_time,
-            "graph": snapshot.model_dump(mode="json"),
+            "graph_json": self.graph_store.snapshot_json(),
             "transcription": {
-                "segments": [s.model_dump() for s in self.all_segments],
+                "segments": self._segment_dumps,
                 "language": "en",
-                "num_speakers": len(set(s.speaker for s in self.all_segments)),
+                "num_speakers": len(self._speakers),
             },
         })
 
+        if self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
+            self._openai_client = None
+
         return snapshot
 
+    def close(self) -> None:
+        """
+        Close the session logger and delete the segment spill file. Safe after
+        finalize() and on error/disconnect paths where it never ran.
+        """
+        if self._session_logger:
+            self._session_logger.close()
+        try:
+            os.remove(self._segment_spill_path)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning(f"[{self.session_id}] Could not remove segment spill file: {e}")
+
     # ─── Private helpers ─────────────────────────────────────────────────────
 
     async def _transcribe_chunk(
@@ -403,76 +623,142 @@ class LiveStreamingPipeline:
         audio_bytes: bytes,
         time_offset: float,
         filename: str,
+        mime: str = _DEFAULT_MIME,
     ) -> list[TranscriptionSegment]:
         """Transcribe a chunk using OpenAI gpt-4o-transcribe-diarize."""
         if not self._openai_client:
             raise RuntimeError("OpenAI client not initialized")
 
-        # Write to temp file (OpenAI API requires a file-like object with name)
-        suffix = Path(filename).suffix or ".webm"
-        with tempfile.NamedTemporaryFile(suffix=suffix, delete=False) as tmp:
-            tmp.write(audio_bytes)
-            tmp_path = tmp.name
+        if not STT_RACE_FALLBACK:
+            return await self._transcribe_sequential(audio_bytes, time_offset, filename, mime)
 
+        # Fire both models at once so a diarized failure costs no extra round trip.
+        # Each request gets its own in-memory file object (the SDK reads it).
+        t_diar = asyncio.create_task(
+            self._request_transcript(audio_bytes, filename, mime, diarized=True)
+        )
+        t_plain = asyncio.create_task(
+            self._request_transcript(audio_bytes, filename, mime, diarized=False)
+        )
         try:
-            with open(tmp_path, "rb") as f:
-                # Try diarized first for speaker attribution
-                try:
-                    transcript = await self._openai_client.audio.transcriptions.create(
-                        model="gpt-4o-transcribe-diarize",
-                        file=(filename, f, "audio/webm"),
-                        response_format="diarized_json",
-                        chunking_strategy="auto",
-                    )
-                    segments = self._parse_diarized_response(transcript, time_offset)
+            done, _ = await asyncio.wait(
+                {t_diar, t_plain}, return_when=asyncio.FIRST_COMPLETED
+            )
+            if t_diar not in done:
+                if t_plain.exception() is not None:
+                    # Plain model failed: diarized is the only result left
+                    await asyncio.wait({t_diar})
+                else:
+                    # Plain model won: give diarized a short grace for speaker labels
+                    await asyncio.wait({t_diar}, timeout=STT_DIARIZE_GRACE_SECONDS)
+
+            if t_diar.done() and not t_diar.cancelled():
+                if t_diar.exception() is None:
+                    segments = self._parse_diarized_response(t_diar.result(), time_offset)
                     if segments:
                         return segments
-                except Exception as e:
-                    logger.warning(f"Diarized transcription failed, falling back: {e}")
-                    f.seek(0)
-
-                # Fallback: standard transcription with timestamps
-                transcript = await self._openai_client.audio.transcriptions.create(
-                    model="gpt-4o-transcribe",
-                    file=(filename, f, "audio/webm"),
-                    response_format="verbose_json",
-                    timestamp_granularities=["segment"],
-                )
-                return self._parse_verbose_response(transcript, time_offset)
+                else:
+                    logger.warning(f"Diarized transcription failed, falling back: {t_diar.exception()}")
+
+            transcript = await t_plain
+            return self._parse_verbose_response(transcript, time_offset)
         finally:
-            try:
-                os.unlink(tmp_path)
-            except OSError:
-                pass
+            for t in (t_diar, t_plain):
+                if not t.done():
+                    t.cancel()
+
+    async def _transcribe_sequential(
+        self,
+        audio_bytes: bytes,
+        time_offset: float,
+        filename: str,
+        mime: str = _DEFAULT_MIME,
+    ) -> list[TranscriptionSegment]:
+        """Diarized transcription, then plain transcription only if it fails."""
+        try:
+            transcript = await self._request_transcript(audio_bytes, filename, mime, diarized=True)
+            segments = self._parse_diarized_response(transcript, time_offset)
+            if segments:
+                return segments
+        except Exception as e:
+            logger.warning(f"Diarized transcription failed, falling back: {e}")
+
+        transcript = await self._request_transcript(audio_bytes, filename, mime, diarized=False)
+        return self._parse_verbose_response(transcript, time_offset)
+
+    async def _request_transcript(
+        self, audio_bytes: bytes, filename: str, mime: str, diarized: bool
+    ):
+        """Single rate-limited OpenAI transcription request (retried on 429)."""
+        return await call_with_backoff(
+            self._openai_limiter,
+            self._create_transcript,
+            audio_bytes,
+            filename,
+            mime,
+            diarized,
+            attempts=RATE_LIMIT_RETRIES,
+        )
+
+    async def _create_transcript(
+        self, audio_bytes: bytes, filename: str, mime: str, diarized: bool
+    ):
+        # The SDK accepts a (name, fileobj, mime) tuple — no temp file needed.
+        # A fresh buffer per attempt, since the SDK consumes it.
+        buf = io.BytesIO(audio_bytes)
+        buf.name = filename
+        if diarized:
+            return await self._openai_client.audio.transcriptions.create(
+                model="gpt-4o-transcribe-diarize",
+                file=(filename, buf, mime),
+                response_format="diarized_json",
+                chunking_strategy="auto",
+            )
+        # Standard transcription with timestamps (no speaker labels)
+        return await self._openai_client.audio.transcriptions.create(
+            model="gpt-4o-transcribe",
+            file=(filename, buf, mime),
+            response_format="verbose_json",
+            timestamp_granularities=["segment"],
+        )
 
     def _parse_diarized_response(
         self, transcript, time_offset: float
     ) -> list[TranscriptionSegment]:
         """Parse diarized_json response with speaker reconciliation."""
-        from pipeline.transcription import _normalize_speaker
         segments = []
 
-        if hasattr(transcript, "segments") and transcript.segments:
-            # Collect raw speaker IDs in order of first appearance
-            raw_speakers_order = []
-            for seg in transcript.segments:
-                raw_sp = _normalize_speaker(getattr(seg, "speaker", "SPEAKER_00") or "SPEAKER_00")
-                if raw_sp not in raw_speakers_order:
-                    raw_speakers_order.append(raw_sp)
-
-            # Inform reconciler about this chunk's speakers
-            self._speaker_reconciler.start_new_chunk(raw_speakers_order)
-
-            for seg in transcript.segments:
-                text = getattr(seg, "text", "").strip()
+        raw_segments = getattr(transcript, "segments", None)
+        if raw_segments:
+            # Raw speaker ID -> position of first appearance in this chunk
+            first_seen: dict[str, int] = {}
+            chunk_first_raw = None
+            reconcile = self._speaker_reconciler.reconcile_with_order
+            for seg in raw_segments:
+                # SDK segment objects always carry these attributes; getattr
+                # defaults are only needed for unexpected shapes
+                try:
+                    text, seg_speaker, seg_start, seg_end = seg.text, seg.speaker, seg.start, seg.end
+                except AttributeError:
+                    text = getattr(seg, "text", "")
+                    seg_speaker = getattr(seg, "speaker", None)
+                    seg_start = getattr(seg, "start", 0.0)
+                    seg_end = getattr(seg, "end", 0.0)
+                # Cheap word-count filter first: most dropped segments never
+                # reach speaker normalization or model construction
+                text = (text or "").strip()
                 if not text or len(text.split()) < 3:
                     continue
-                raw_speaker = _normalize_speaker(getattr(seg, "speaker", "SPEAKER_00") or "SPEAKER_00")
+                raw_speaker = _normalize_speaker(seg_speaker or "SPEAKER_00")
+                first_seen_idx = first_seen.setdefault(raw_speaker, len(first_seen))
+                if chunk_first_raw is None:
+                    chunk_first_raw = raw_speaker
                 # Reconcile to canonical speaker ID
-                speaker = self._speaker_reconciler.reconcile(raw_speaker)
-                start = float(getattr(seg, "start", 0.0)) + time_offset
-                end = float(getattr(seg, "end", 0.0)) + time_offset
-                segments.append(TranscriptionSegment(
+                speaker = reconcile(raw_speaker, first_seen_idx, chunk_first_raw)
+                start = float(seg_start) + time_offset
+                end = float(seg_end) + time_offset
+                # Fields are already the right types — skip pydantic validation
+                segments.append(TranscriptionSegment.model_construct(
                     speaker=speaker,
                     text=text,
                     start=round(start, 2),
@@ -485,29 +771,34 @@ class LiveStreamingPipeline:
     ) -> list[TranscriptionSegment]:
         """Parse verbose_json response (no diarization — single speaker)."""
         segments = []
-        # Determine speaker from context (use last known or SPEAKER_00)
-        speaker = "SPEAKER_00"
-        if self.all_segments:
-            speaker = self.all_segments[-1].speaker
-
-        if hasattr(transcript, "segments") and transcript.segments:
-            for seg in transcript.segments:
-                text = getattr(seg, "text", "").strip()
+        # No diarization on this path: continue with the last known speaker
+        speaker = self._last_speaker
+
+        raw_segments = getattr(transcript, "segments", None)
+        if raw_segments:
+            for seg in raw_segments:
+                try:
+                    text, seg_start, seg_end = seg.text, seg.start, seg.end
+                except AttributeError:
+                    text = getattr(seg, "text", "")
+                    seg_start = getattr(seg, "start", 0.0)
+                    seg_end = getattr(seg, "end", 0.0)
+                text = (text or "").strip()
                 if not text or len(text.split()) < 3:
                     continue
-                start = float(getattr(seg, "start", 0.0)) + time_offset
-                end = float(getattr(seg, "end", 0.0)) + time_offset
-                segments.append(TranscriptionSegment(
+                start = float(seg_start) + time_offset
+                end = float(seg_end) + time_offset
+                segments.append(TranscriptionSegment.model_construct(
                     speaker=speaker,
                     text=text,
                     start=round(start, 2),
                     end=round(end, 2),
                 ))
-        elif hasattr(transcript, "text") and transcript.text:
+        elif getattr(transcript, "text", None):
             # No segment timestamps — create one segment for the whole chunk
             text = transcript.text.strip()
             if text:
-                segments.append(TranscriptionSegment(
+                segments.append(TranscriptionSegment.model_construct(
                     speaker=speaker,
                     text=text,
                     start=round(time_offset, 2),
@@ -524,13 +815,6 @@ class LiveStreamingPipeline:
         if not new_segments or not self._ontological:
             return
 
-        # Build a mini-transcription from new segments only
-        mini_transcription = TranscriptionResult(
-            segments=new_segments,
-            language="en",
-            num_speakers=len(set(s.speaker for s in new_segments)),
-        )
-
         # Use chunk_index as prefix to avoid ID collisions
         # Temporarily override the chunk_idx in the agent
         prev_count = self.graph_store.num_nodes
@@ -546,89 +830,190 @@ class LiveStreamingPipeline:
         )
 
     async def _detect_structural_fallacies(self) -> None:
-        """Run structural fallacy detection (no LLM, instant)."""
-        if not self._skeptic:
+        """Run structural fallacy detection on claims added since the last scan."""
+        if not self._skeptic or not self._dirty_claims:
             return
-        structural = self._skeptic._detect_structural_fallacies(self.graph_store)
+        structural = self._skeptic._detect_structural_fallacies(
+            self.graph_store, dirty_ids=self._dirty_claims
+        )
+        self._dirty_claims = set()
         # Only add new ones (avoid duplicates)
-        existing = {
-            (f.claim_id, f.fallacy_type)
-            for f in self.graph_store.get_all_fallacies()
-        }
         for f in structural:
-            if (f.claim_id, f.fallacy_type) not in existing:
+            if not self.graph_store.has_fallacy(f.claim_id, f.fallacy_type):
                 self.graph_store.add_fallacy(f)
 
     async def _emit_graph_update(self, chunk_index: int) -> None:
-        """Emit current graph state to frontend."""
-        snapshot = self.graph_store.to_snapshot()
+        """
+        Stream graph changes since the previous emit to the frontend as
+        per-object events, then one stats tick with counters and graph-wide
+        data. New segments already went out with transcription_update; the
+        full graph is only sent once, in stream_complete.
+        """
+        store = self.graph_store
+        self._last_emitted_rev = store.revision
+        for event in store.pop_events():
+            await self.on_update(event)
         await self.on_update({
-            "type": "graph_update",
+            "type": "stats",
             "chunk_index": chunk_index,
-            "graph": snapshot.model_dump(mode="json"),
-            "transcription": {
-                "segments": [s.model_dump() for s in self.all_segments],
-                "language": "en",
-                "num_speakers": len(set(s.speaker for s in self.all_segments)),
-            },
             "stats": {
-                "nodes": len(snapshot.nodes),
-                "edges": len(snapshot.edges),
-                "fallacies": sum(len(n.fallacies) for n in snapshot.nodes),
-                "factchecks": len([n for n in snapshot.nodes if n.factcheck_verdict.value != "pending"]),
+                "nodes": store.num_nodes,
+                "edges": store.num_edges,
+                "fallacies": store.num_fallacies,
+                "factchecks": store.num_factchecks,
             },
+            **store.graph_summary(),
         })
 
-    async def _run_llm_fallacy_bg(self, chunk_index: int) -> None:
-        """Background: run LLM fallacy detection on recent claims."""
+    def _spawn_bg(self, coro) -> asyncio.Task:
+        """Start a background task tracked in _bg_tasks until it completes."""
+        task = asyncio.create_task(coro)
+        self._bg_tasks.add(task)
+        task.add_done_callback(self._bg_tasks.discard)
+        return task
+
+    def _schedule_emit(self, chunk_index: int) -> None:
+        """
+        Request a graph emit from background work. Calls arriving within
+        _EMIT_DEBOUNCE_SECONDS of each other are coalesced into a single emit.
+        """
+        self._pending_emit_chunk = chunk_index
+        if self._pending_emit is None or self._pending_emit.done():
+            self._pending_emit = self._spawn_bg(self._delayed_emit())
+
+    async def _delayed_emit(self) -> None:
+        await asyncio.sleep(_EMIT_DEBOUNCE_SECONDS)
+        # Clear first so changes made while sending schedule a fresh emit
+        self._pending_emit = None
+        if self.graph_store.revision != self._last_emitted_rev:
+            await self._emit_graph_update(self._pending_emit_chunk)
+
+    async def _spill_old_segments(self) -> None:
+        """Move all but the last LIVE_MAX_MEM_SEGMENTS segments to the spill file."""
+        cut = len(self._segment_dumps) - LIVE_MAX_MEM_SEGMENTS
+        old_dumps = self._segment_dumps[:cut]
+        try:
+            await asyncio.to_thread(self._append_spilled_segments, old_dumps)
+        except Exception as e:
+            logger.warning(f"[{self.session_id}] Segment spill failed, keeping in memory: {e}")
+            return
+        del self._segment_dumps[:cut]
+        del self.all_segments[:cut]
+        self._spilled_segments += cut
+
+    def _append_spilled_segments(self, dumps_list: list[dict]) -> None:
+        # First spill truncates any stale file left under the same session id
+        mode = "ab" if self._spilled_segments else "wb"
+        with open(self._segment_spill_path, mode) as f:
+            f.write(b"".join(dumps(d) + b"\n" for d in dumps_list))
+
+    def _read_spilled_segments(self) -> list[dict]:
+        with open(self._segment_spill_path, "rb") as f:
+            return [json.loads(line) for line in f if line.strip()]
+
+    async def _flush_pending_emits(self) -> None:
+        """Send a debounced emit now instead of waiting out its delay."""
+        pending = self._pending_emit
+        if pending is not None and not pending.done():
+            # Still sleeping (_delayed_emit clears the slot before sending)
+            pending.cancel()
+            self._pending_emit = None
+        if self.graph_store.revision != self._last_emitted_rev:
+            await self._emit_graph_update(self._pending_emit_chunk)
+
+    def _enqueue_bg(self, queue: asyncio.Queue, chunk_index: int) -> None:
+        """Queue a chunk for a background worker, dropping the oldest job when full."""
+        try:
+            queue.put_nowait(chunk_index)
+        except asyncio.QueueFull:
+            dropped = queue.get_nowait()
+            queue.task_done()
+            queue.put_nowait(chunk_index)
+            logger.warning(
+                f"[{self.session_id}] Background queue full, dropped chunk {dropped}"
+            )
+
+    async def _bg_worker(
+        self,
+        queue: asyncio.Queue,
+        handler: Callable[[int], Awaitable[None]],
+    ) -> None:
+        """Process queued chunk indices one at a time until the None sentinel."""
+        while True:
+            chunk_index = await queue.get()
+            try:
+                if chunk_index is None:
+                    return
+                await handler(chunk_index)
+            finally:
+                queue.task_done()
+
+    async def _fallacy_batch_worker(self) -> None:
+        """
+        Every _FALLACY_BATCH_SECONDS, run LLM fallacy detection over the claims
+        queued since the previous tick. Drains what is left once closing is set.
+        """
+        closing = self._closing
+        while not closing.is_set():
+            try:
+                await asyncio.wait_for(closing.wait(), timeout=_FALLACY_BATCH_SECONDS)
+            except asyncio.TimeoutError:
+                pass
+            while self._pending_fallacy_claims:
+                await self._run_llm_fallacy_bg()
+
+    async def _run_llm_fallacy_bg(self) -> None:
+        """Background: run LLM fallacy detection on one batch of queued claims."""
+        pending = self._pending_fallacy_claims
+        batch_ids = list(islice(pending, _FALLACY_BATCH_MAX))
+        for claim_id in batch_ids:
+            del pending[claim_id]
         try:
-            # Get claims added in this chunk (last N claims)
-            all_claims = self.graph_store.get_all_claims()
-            # Process only the last 15 claims (most recent chunk)
-            recent_claims = all_claims[-15:] if len(all_claims) > 15 else all_claims
-            if not recent_claims:
+            claims = [
+                c for c in map(self.graph_store.get_claim, batch_ids) if c is not None
+            ]
+            if not claims:
                 return
 
-            llm_fallacies = await self._skeptic._detect_chunk(recent_claims, self.graph_store)
-            existing = {
-                (f.claim_id, f.fallacy_type)
-                for f in self.graph_store.get_all_fallacies()
-            }
+            async with self._bg_sem:
+                llm_fallacies = await self._skeptic._detect_chunk(claims, self.graph_store)
             new_count = 0
             for f in llm_fallacies:
-                if (f.claim_id, f.fallacy_type) not in existing:
+                if not self.graph_store.has_fallacy(f.claim_id, f.fallacy_type):
                     self.graph_store.add_fallacy(f)
                     new_count += 1
 
             if new_count > 0:
                 logger.info(
-                    f"[{self.session_id}] BG fallacy: +{new_count} LLM fallacies"
+                    f"[{self.session_id}] BG fallacy: +{new_count} LLM fallacies "
+                    f"({len(claims)} claims analysed)"
                 )
-                await self._emit_graph_update(chunk_index)
+                self._schedule_emit(self.chunk_count - 1)
         except Exception as e:
             logger.error(f"[{self.session_id}] BG LLM fallacy failed: {e}")
 
     async def _run_factcheck_bg(self, chunk_index: int) -> None:
         """Background: fact-check new factual claims."""
         try:
-            all_claims = self.graph_store.get_all_claims()
-            # Only check claims not yet fact-checked
-            unchecked = [
-                c for c in all_claims
-                if c.is_factual and c.id not in self.graph_store._factchecks
-            ]
-            if not unchecked:
+            # Take up to 5 queued claims per chunk to avoid rate limits
+            to_check = []
+            pending = self._factcheck_pending
+            while pending and len(to_check) < 5:
+                claim_id = pending.popleft()
+                if claim_id in self.graph_store._factchecks:
+                    continue
+                claim = self.graph_store.get_claim(claim_id)
+                if claim is not None:
+                    to_check.append(claim)
+            if not to_check:
                 return
 
-            # Limit to 5 per chunk to avoid rate limits
-            to_check = unchecked[:5]
             logger.info(
                 f"[{self.session_id}] BG fact-check: {len(to_check)} claims"
             )
 
-            semaphore = asyncio.Semaphore(3)
             async def check_one(claim):
-                async with semaphore:
+                async with self._bg_sem:
                     return await self._researcher.check_claim(claim)
 
             results = await asyncio.gather(
@@ -647,6 +1032,6 @@ class LiveStreamingPipeline:
                 logger.info(
                     f"[{self.session_id}] BG fact-check: +{new_count} verdicts"
                 )
-                await self._emit_graph_update(chunk_index)
+                self._schedule_emit(chunk_index)
         except Exception as e:
             logger.error(f"[{self.session_id}] BG fact-check failed: {e}")
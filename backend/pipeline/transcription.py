@@ -15,29 +15,53 @@ https://platform.openai.com/docs/guides/realtime-transcription
 """
 
 import os
+import re
+import mmap
+import hashlib
+import importlib.util
 import asyncio
+import tempfile
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import AsyncIterator, Optional
+
+import numpy as np
 
 from api.models.schemas import TranscriptionResult, TranscriptionSegment
-from config.settings import STT_MODEL, STT_PROMPT
+from config.settings import (
+    STT_MODEL,
+    STT_PROMPT,
+    STT_SPEEDUP,
+    STT_CACHE,
+    OPENAI_MAX_CONCURRENT,
+)
 
 logger = logging.getLogger("debategraph.transcription")
 
-# Try to import OpenAI
-try:
-    from openai import OpenAI
-    OPENAI_AVAILABLE = True
-except ImportError:
-    OPENAI_AVAILABLE = False
-    logger.warning("openai package not installed. pip install openai")
+_NUM_RE = re.compile(r'(\d+)')
+_SENT_RE = re.compile(r'(?<=[.!?])\s+')
+
+
+@lru_cache(maxsize=1)
+def _have_openai() -> bool:
+    """
+    True if the openai package is installed. Checked on first use rather than
+    importing the SDK at module load (the demo and live paths import this module too).
+    """
+    if importlib.util.find_spec("openai") is None:
+        logger.warning("openai package not installed. pip install openai")
+        return False
+    return True
 
 
 def transcribe_audio(
     audio_path: str,
     num_speakers: Optional[int] = None,
     language: Optional[str] = None,
+    speedup: Optional[float] = None,
+    cache: Optional[str] = STT_CACHE,
 ) -> TranscriptionResult:
     """
     Transcribe an audio file with speaker diarization using OpenAI API.
@@ -49,78 +73,380 @@ def transcribe_audio(
         audio_path: Path to audio file (mp3, wav, mp4, webm, etc.)
         num_speakers: Expected number of speakers (not used by OpenAI API, kept for interface compat)
         language: Language code (optional, auto-detected if not provided)
+        speedup: Tempo factor applied before upload (default STT_SPEEDUP; 1.0 = off).
+            Forces the chunked path, which re-encodes through ffmpeg.
+        cache: "default" (~/.debategraph/cache), a directory path, or None/"off".
+            Results are keyed by audio content + model/language/speakers/speedup.
 
     Returns:
         TranscriptionResult with timestamped, speaker-attributed segments
     """
+    file_path = _checked_audio_file(audio_path)
+    speedup = _clamp_speedup(speedup)
+
+    # One read-only mapping serves the size check, the cache key and the upload
+    with open(file_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        # Content-addressed cache: identical re-uploads skip the API entirely
+        cache_file = _cache_file(mm, cache, language, num_speakers, speedup)
+        cached = _read_cache(cache_file)
+        if cached is not None:
+            return cached
+
+        api_key = _require_api_key()
+
+        file_size_mb = len(mm) / (1024 * 1024)
+        logger.info(f"Transcribing: {file_path.name} ({file_size_mb:.1f} MB)")
+
+        result = _transcribe_file(
+            audio_path, (file_path.name, mm), api_key, file_size_mb, language, speedup
+        )
+
+    _write_cache(cache_file, result)
+    return result
+
+
+async def transcribe_audio_async(
+    audio_path: str,
+    num_speakers: Optional[int] = None,
+    language: Optional[str] = None,
+    speedup: Optional[float] = None,
+    cache: Optional[str] = STT_CACHE,
+) -> TranscriptionResult:
+    """
+    transcribe_audio() for callers already running an event loop.
+
+    Files that need chunking are transcribed on the caller's loop: chunk
+    uploads go out concurrently through AsyncOpenAI instead of blocking a
+    worker thread. Single-request files have nothing to overlap and run
+    transcribe_audio() in a thread. Same arguments and result.
+    """
+    file_path = _checked_audio_file(audio_path)
+    speedup = _clamp_speedup(speedup)
+    file_size_mb = file_path.stat().st_size / (1024 * 1024)
+
+    if not _needs_chunking(file_size_mb, speedup):
+        return await asyncio.to_thread(
+            transcribe_audio, audio_path, num_speakers, language, speedup, cache
+        )
+
+    cache_file = await asyncio.to_thread(
+        _cache_file_for_path, file_path, cache, language, num_speakers, speedup
+    )
+    cached = _read_cache(cache_file)
+    if cached is not None:
+        return cached
+
+    api_key = _require_api_key()
+    logger.info(
+        f"Transcribing: {file_path.name} ({file_size_mb:.1f} MB, speedup {speedup}x). "
+        f"Using chunked transcription."
+    )
+    result = await _atranscribe_chunked(audio_path, api_key, language, speedup)
+
+    _write_cache(cache_file, result)
+    return result
+
+
+async def iter_transcribe_audio(
+    audio_path: str,
+    num_speakers: Optional[int] = None,
+    language: Optional[str] = None,
+    speedup: Optional[float] = None,
+    cache: Optional[str] = STT_CACHE,
+) -> AsyncIterator[list[TranscriptionSegment]]:
+    """
+    Streaming transcribe_audio_async(): yields batches of segments (file
+    timeline, in order) so analysis can start before the whole file is done.
+
+    Chunked files yield one batch per ~2 min audio chunk as soon as it is
+    transcribed; single-request files and cache hits yield one batch. The
+    complete result is cached once the stream has been fully consumed.
+    """
+    file_path = _checked_audio_file(audio_path)
+    speedup = _clamp_speedup(speedup)
+    file_size_mb = file_path.stat().st_size / (1024 * 1024)
+
+    if not _needs_chunking(file_size_mb, speedup):
+        result = await transcribe_audio_async(audio_path, num_speakers, language, speedup, cache)
+        yield result.segments
+        return
+
+    cache_file = await asyncio.to_thread(
+        _cache_file_for_path, file_path, cache, language, num_speakers, speedup
+    )
+    cached = _read_cache(cache_file)
+    if cached is not None:
+        yield cached.segments
+        return
+
+    api_key = _require_api_key()
+    logger.info(
+        f"Transcribing: {file_path.name} ({file_size_mb:.1f} MB, speedup {speedup}x). "
+        f"Streaming chunked transcription."
+    )
+    all_segments = []
+    async for chunk_segments in _iter_transcribed_chunks(audio_path, api_key, language, speedup):
+        all_segments.extend(chunk_segments)
+        yield chunk_segments
+
+    _write_cache(cache_file, TranscriptionResult.model_construct(
+        segments=all_segments,
+        language=language or "en",
+        num_speakers=len({seg.speaker for seg in all_segments}),
+    ))
+
+
+def _checked_audio_file(audio_path: str) -> Path:
+    """Validate that the audio file exists and is non-empty."""
+    file_path = Path(audio_path)
+    if not file_path.exists():
+        raise FileNotFoundError(f"Audio file not found: {audio_path}")
+    if file_path.stat().st_size == 0:
+        raise RuntimeError(f"Audio file is empty: {audio_path}")
+    return file_path
+
+
+def _clamp_speedup(speedup: Optional[float]) -> float:
+    speedup = STT_SPEEDUP if speedup is None else speedup
+    # atempo accepts 0.5-2.0 per filter instance
+    return min(max(speedup, 0.5), 2.0)
+
+
+def _require_api_key() -> str:
+    """Return OPENAI_API_KEY, raising if the SDK or the key is missing."""
     api_key = os.getenv("OPENAI_API_KEY", "")
 
-    if not OPENAI_AVAILABLE:
+    if not _have_openai():
         logger.error("OpenAI package not installed. Cannot transcribe.")
         raise RuntimeError("OpenAI package not installed. Run: pip install openai")
 
     if not api_key:
         logger.error("OPENAI_API_KEY not set in environment. Cannot transcribe.")
         raise RuntimeError("OPENAI_API_KEY not set. Add it to your .env file.")
+    return api_key
 
-    # Validate file exists and size
-    file_path = Path(audio_path)
-    if not file_path.exists():
-        raise FileNotFoundError(f"Audio file not found: {audio_path}")
-
-    file_size_mb = file_path.stat().st_size / (1024 * 1024)
-    logger.info(f"Transcribing: {file_path.name} ({file_size_mb:.1f} MB)")
 
+def _needs_chunking(file_size_mb: float, speedup: float) -> bool:
     # OpenAI requires chunking for gpt-4o-transcribe-diarize when audio > 30s; large single requests often 500.
     # Use chunked transcription for: size > 25 MB OR estimated duration > 2 min (safe threshold).
     CHUNK_SIZE_MB = 25
     CHUNK_DURATION_ESTIMATE_MIN = 2  # assume ~1 MB per min for WAV; use chunked if we might exceed safe length
     use_chunked = file_size_mb > CHUNK_SIZE_MB or file_size_mb > (CHUNK_DURATION_ESTIMATE_MIN * 1.5)
-    if use_chunked:
+    # Tempo changes re-encode through ffmpeg, which only the chunked path does
+    return use_chunked or speedup != 1.0
+
+
+def _transcribe_file(
+    audio_path: str,
+    file_like: tuple[str, mmap.mmap],
+    api_key: str,
+    file_size_mb: float,
+    language: Optional[str],
+    speedup: float,
+) -> TranscriptionResult:
+    """
+    Pick single-request or chunked transcription for the file. Single requests
+    upload the contents of the already-mapped file_like as bytes (the mmap
+    object itself is not a file type the OpenAI client accepts); chunking
+    re-encodes audio_path with ffmpeg.
+    """
+    if _needs_chunking(file_size_mb, speedup):
         logger.info(
-            f"File {file_size_mb:.1f} MB exceeds safe single-request size/duration. Using chunked transcription."
+            f"File {file_size_mb:.1f} MB, speedup {speedup}x. Using chunked transcription."
         )
-        return _transcribe_chunked(audio_path, api_key, language)
+        return _transcribe_chunked(audio_path, api_key, language, speedup)
+
+    filename, mm = file_like
+    upload = (filename, mm[:])
 
     # Try diarized transcription first (single request)
     try:
-        return _transcribe_diarized(audio_path, api_key, language)
+        return _transcribe_diarized(audio_path, api_key, language, upload)
     except Exception as e:
         logger.warning(f"Diarized transcription failed: {e}. Falling back to standard transcription.")
-        return _transcribe_standard(audio_path, api_key, language)
+        return _transcribe_standard(audio_path, api_key, language, upload)
+
+
+def _cache_file(
+    audio: "bytes | mmap.mmap",
+    cache: Optional[str],
+    language: Optional[str],
+    num_speakers: Optional[int],
+    speedup: float,
+) -> Optional[Path]:
+    """Cache entry path for this audio + settings, or None when caching is off."""
+    if not cache or cache == "off":
+        return None
+    cache_dir = Path.home() / ".debategraph" / "cache" if cache == "default" else Path(cache)
+
+    # hashlib reads the buffer directly (no copy of a mapped file)
+    digest = hashlib.blake2b(audio, digest_size=20)
+    # Settings that change the output are part of the key
+    digest.update(f"|{STT_MODEL}|{language}|{num_speakers}|{speedup}".encode())
+    return cache_dir / f"{digest.hexdigest()}.json"
+
+
+def _cache_file_for_path(
+    file_path: Path,
+    cache: Optional[str],
+    language: Optional[str],
+    num_speakers: Optional[int],
+    speedup: float,
+) -> Optional[Path]:
+    """_cache_file() for a file on disk (hashed through a read-only mapping)."""
+    if not cache or cache == "off":
+        return None
+    with open(file_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        return _cache_file(mm, cache, language, num_speakers, speedup)
+
+
+def _read_cache(cache_file: Optional[Path]) -> Optional[TranscriptionResult]:
+    """Cached result for this entry, or None on a miss or unreadable entry."""
+    if cache_file is None or not cache_file.exists():
+        return None
+    try:
+        result = TranscriptionResult.model_validate_json(cache_file.read_bytes())
+        logger.info(f"Transcription cache hit: {cache_file.name}")
+        return result
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable transcription cache entry {cache_file}: {e}")
+        return None
+
+
+def _write_cache(cache_file: Optional[Path], result: TranscriptionResult) -> None:
+    """Store result atomically (write to .tmp, then rename)."""
+    if cache_file is None or not result.segments:
+        return
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp = cache_file.with_suffix(".tmp")
+        tmp.write_text(result.model_dump_json(), encoding="utf-8")
+        os.replace(tmp, cache_file)
+    except OSError as e:
+        logger.warning(f"Could not write transcription cache: {e}")
 
 
 def _transcribe_diarized(
     audio_path: str,
     api_key: str,
     language: Optional[str] = None,
+    file_like: Optional[tuple] = None,
 ) -> TranscriptionResult:
     """
     Transcribe with speaker diarization using gpt-4o-transcribe-diarize.
-    Returns segments with speaker labels.
+    Returns segments with speaker labels. file_like, if given, is a
+    (filename, bytes) upload used instead of reopening audio_path.
     """
-    client = OpenAI(api_key=api_key)
+    client = _get_client(api_key)
     model = STT_MODEL  # "gpt-4o-transcribe-diarize"
 
     logger.info(f"Using model: {model} (diarized mode)")
 
-    with open(audio_path, "rb") as audio_file:
-        # Build API call kwargs
-        kwargs = {
-            "model": model,
-            "file": audio_file,
-            "response_format": "diarized_json",
-            "chunking_strategy": "auto",
-        }
+    if file_like is not None:
+        logger.info("Sending audio to OpenAI API (diarized)...")
+        transcript = client.audio.transcriptions.create(
+            **_diarized_kwargs(model, file_like, language)
+        )
+    else:
+        with open(audio_path, "rb") as audio_file:
+            logger.info("Sending audio to OpenAI API (diarized)...")
+            transcript = client.audio.transcriptions.create(
+                **_diarized_kwargs(model, audio_file, language)
+            )
 
-        # Language hint if provided
-        if language:
-            kwargs["language"] = language
+    return _parse_diarized_transcript(transcript, language)
 
-        logger.info("Sending audio to OpenAI API (diarized)...")
-        transcript = client.audio.transcriptions.create(**kwargs)
 
-    # Parse diarized response
+async def _atranscribe_diarized(
+    client,
+    audio: tuple[str, bytes],
+    language: Optional[str] = None,
+) -> TranscriptionResult:
+    """
+    Async variant of _transcribe_diarized on a shared AsyncOpenAI client.
+    audio is an in-memory (filename, bytes) upload; the filename sets the format.
+    """
+    transcript = await client.audio.transcriptions.create(
+        **_diarized_kwargs(STT_MODEL, audio, language)
+    )
+    return _parse_diarized_transcript(transcript, language)
+
+
+@lru_cache(maxsize=4)
+def _get_client(api_key: str):
+    """
+    OpenAI client shared by every file transcription using this key, so the
+    keep-alive pool (HTTP/2 when h2 is installed) survives between requests.
+    """
+    import httpx
+    from openai import OpenAI
+    try:
+        import h2  # noqa: F401 — required by httpx for HTTP/2
+        http2 = True
+    except ImportError:
+        http2 = False
+    # (limits/http2 live on the transport: httpx ignores them on the client when one is given)
+    http_client = httpx.Client(
+        transport=httpx.HTTPTransport(
+            http2=http2,
+            retries=2,
+            limits=httpx.Limits(max_keepalive_connections=16),
+        ),
+        timeout=httpx.Timeout(600.0, connect=10.0),
+    )
+    return OpenAI(api_key=api_key, http_client=http_client)
+
+
+def _new_async_client(api_key: str, max_connections: int):
+    """
+    AsyncOpenAI client for one chunked transcription, pooled to its worker
+    count: every chunk upload reuses the same few keep-alive connections
+    (HTTP/2 when h2 is installed). Closing the client closes the pool.
+    """
+    import httpx
+    from openai import AsyncOpenAI
+    try:
+        import h2  # noqa: F401 — required by httpx for HTTP/2
+        http2 = True
+    except ImportError:
+        http2 = False
+    http_client = httpx.AsyncClient(
+        transport=httpx.AsyncHTTPTransport(
+            http2=http2,
+            retries=2,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+            ),
+        ),
+        timeout=httpx.Timeout(600.0, connect=10.0),
+    )
+    return AsyncOpenAI(api_key=api_key, http_client=http_client)
+
+
+def _diarized_kwargs(model: str, audio_file, language: Optional[str]) -> dict:
+    """
+    Build the transcriptions.create kwargs for a diarized request.
+    audio_file is an open file or a (filename, bytes) tuple.
+    """
+    kwargs = {
+        "model": model,
+        "file": audio_file,
+        "response_format": "diarized_json",
+        "chunking_strategy": "auto",
+    }
+
+    # Language hint if provided
+    if language:
+        kwargs["language"] = language
+    return kwargs
+
+
+def _parse_diarized_transcript(
+    transcript,
+    language: Optional[str] = None,
+) -> TranscriptionResult:
+    """Parse a diarized_json response into a TranscriptionResult."""
     segments = []
     speakers_seen = set()
 
@@ -141,7 +467,7 @@ def _transcribe_diarized(
             speaker_normalized = _normalize_speaker(speaker)
             speakers_seen.add(speaker_normalized)
 
-            segments.append(TranscriptionSegment(
+            segments.append(TranscriptionSegment.model_construct(
                 speaker=speaker_normalized,
                 text=text,
                 start=round(float(start), 2),
@@ -154,7 +480,7 @@ def _transcribe_diarized(
         text = getattr(transcript, 'text', '')
         if text:
             logger.warning("No diarized segments found, using plain text")
-            segments.append(TranscriptionSegment(
+            segments.append(TranscriptionSegment.model_construct(
                 speaker="SPEAKER_00",
                 text=text.strip(),
                 start=0.0,
@@ -188,32 +514,35 @@ def _transcribe_standard(
     audio_path: str,
     api_key: str,
     language: Optional[str] = None,
+    file_like: Optional[tuple] = None,
 ) -> TranscriptionResult:
     """
     Fallback: transcribe without diarization using gpt-4o-transcribe.
     All text attributed to SPEAKER_00.
     """
-    client = OpenAI(api_key=api_key)
+    client = _get_client(api_key)
     model = "gpt-4o-transcribe"
 
     logger.info(f"Using model: {model} (standard mode, no diarization)")
 
-    with open(audio_path, "rb") as audio_file:
-        kwargs = {
-            "model": model,
-            "file": audio_file,
-            "response_format": "json",
-        }
+    kwargs = {
+        "model": model,
+        "response_format": "json",
+    }
 
-        if language:
-            kwargs["language"] = language
+    if language:
+        kwargs["language"] = language
 
-        # Add prompt for debate context
-        if STT_PROMPT:
-            kwargs["prompt"] = STT_PROMPT
+    # Add prompt for debate context
+    if STT_PROMPT:
+        kwargs["prompt"] = STT_PROMPT
 
-        logger.info("Sending audio to OpenAI API (standard)...")
-        transcript = client.audio.transcriptions.create(**kwargs)
+    logger.info("Sending audio to OpenAI API (standard)...")
+    if file_like is not None:
+        transcript = client.audio.transcriptions.create(file=file_like, **kwargs)
+    else:
+        with open(audio_path, "rb") as audio_file:
+            transcript = client.audio.transcriptions.create(file=audio_file, **kwargs)
 
     text = transcript.text.strip() if hasattr(transcript, 'text') else ""
 
@@ -236,68 +565,198 @@ def _transcribe_chunked(
     audio_path: str,
     api_key: str,
     language: Optional[str] = None,
+    speedup: float = 1.0,
 ) -> TranscriptionResult:
     """
     Split audio into short chunks (2 min), transcribe each with diarization, then merge.
     Avoids 500 errors and timeouts from sending long audio in one request.
     OpenAI recommends chunking for gpt-4o-transcribe-diarize when input > 30 seconds.
+    Runs the async pipeline on its own event loop; if the caller's thread already
+    runs a loop, that loop goes to a worker thread (asyncio.run can't nest).
     """
+    coro = _atranscribe_chunked(audio_path, api_key, language, speedup)
     try:
-        from pydub import AudioSegment
-    except ImportError:
-        raise RuntimeError("pydub required for chunked transcription. pip install pydub")
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        return pool.submit(asyncio.run, coro).result()
+
 
-    # pydub looks for ffmpeg in PATH; we inject our path (imageio-ffmpeg or system) so export() works
-    from utils.audio import get_ffmpeg_path
-    AudioSegment.converter = get_ffmpeg_path()
+async def _atranscribe_chunked(
+    audio_path: str,
+    api_key: str,
+    language: Optional[str] = None,
+    speedup: float = 1.0,
+) -> TranscriptionResult:
+    """Async body of _transcribe_chunked, for callers already on an event loop."""
+    all_segments = []
+    async for chunk_segments in _iter_transcribed_chunks(audio_path, api_key, language, speedup):
+        all_segments.extend(chunk_segments)
+
+    # Segments were built with model_construct already; skip re-validation
+    return TranscriptionResult.model_construct(
+        segments=all_segments,
+        language=language or "en",
+        num_speakers=len({seg.speaker for seg in all_segments}),
+    )
+
+
+async def _iter_transcribed_chunks(
+    audio_path: str,
+    api_key: str,
+    language: Optional[str] = None,
+    speedup: float = 1.0,
+) -> AsyncIterator[list[TranscriptionSegment]]:
+    """
+    Chunked transcription as a stream: yields each audio chunk's segments on
+    the file timeline as soon as that chunk and all
+    earlier ones are transcribed. Failed chunks yield nothing.
+    """
+    from utils.audio import find_silence_cut_points
 
     logger.info("Splitting audio into chunks for safe API requests...")
 
-    audio = AudioSegment.from_file(audio_path)
-    # 2 minutes per chunk: keeps each request well under limits and avoids 500/timeouts
-    chunk_duration_ms = 2 * 60 * 1000
-    chunks = []
+    # ~2 minutes per chunk: keeps each request well under limits and avoids 500/timeouts
+    chunk_seconds = 120.0
 
-    for i in range(0, len(audio), chunk_duration_ms):
-        chunk = audio[i:i + chunk_duration_ms]
-        chunk_idx = i // chunk_duration_ms
-        chunk_path = f"{audio_path}.chunk_{chunk_idx}.mp3"
-        chunk.export(chunk_path, format="mp3")
-        chunks.append((chunk_path, i / 1000.0))  # (path, offset_seconds)
+    # Snap boundaries to silence when webrtcvad is available (no mid-word cuts)
+    try:
+        cut_points = await asyncio.to_thread(
+            find_silence_cut_points, audio_path, target_seconds=chunk_seconds
+        )
+    except Exception as e:
+        logger.warning(f"VAD cut point detection failed, using fixed chunks: {e}")
+        cut_points = None
+
+    offsets = [0.0, *cut_points] if cut_points is not None else None
+    n_chunks = 0
+
+    with tempfile.TemporaryDirectory(prefix="debategraph_chunks_") as chunk_dir:
+        # Encoding and uploading overlap; results come back in chunk order
+        async for result in _iter_chunks_pipelined(
+            audio_path, chunk_dir, chunk_seconds, cut_points, speedup, api_key, language,
+        ):
+            idx = n_chunks
+            n_chunks += 1
+            if isinstance(result, Exception):
+                logger.error(f"Chunk transcription failed: {result}")
+                continue
+            offset = offsets[idx] if offsets is not None else idx * chunk_seconds
+            # Chunk-relative times are in sped-up seconds
+            chunk_segments = _shift_segments(result.segments, offset, speedup)
+            if chunk_segments:
+                yield chunk_segments
 
-    logger.info(f"Split into {len(chunks)} chunks (~2 min each)")
+    logger.info(f"Transcribed {n_chunks} chunks (~2 min each)")
 
-    all_segments = []
-    speakers_seen = set()
 
-    for chunk_path, offset in chunks:
+def _shift_segments(
+    segments: list[TranscriptionSegment],
+    offset: float,
+    scale: float = 1.0,
+) -> list[TranscriptionSegment]:
+    """
+    Map chunk-relative segment times onto the file timeline (t * scale + offset,
+    rounded to 10 ms) in one vectorized pass, rebuilding the segments.
+    """
+    if not segments:
+        return []
+    times = np.fromiter(
+        (t for seg in segments for t in (seg.start, seg.end)),
+        dtype=np.float64,
+        count=2 * len(segments),
+    )
+    times = np.round(times * scale + offset, 2).reshape(-1, 2)
+    return [
+        TranscriptionSegment.model_construct(
+            speaker=seg.speaker, text=seg.text, start=start, end=end,
+        )
+        for seg, (start, end) in zip(segments, times.tolist())
+    ]
+
+
+async def _iter_chunks_pipelined(
+    audio_path: str,
+    chunk_dir: str,
+    chunk_seconds: float,
+    cut_points: Optional[list[float]],
+    speedup: float,
+    api_key: str,
+    language: Optional[str] = None,
+) -> AsyncIterator[object]:
+    """
+    Producer/consumer: ffmpeg writes chunks one after another, and each finished
+    chunk is read into memory and queued for OPENAI_MAX_CONCURRENT upload
+    workers sharing one AsyncOpenAI connection pool. The first upload starts
+    as soon as the first chunk is encoded. Yields one TranscriptionResult (or
+    the exception that chunk failed with) per chunk, in chunk order, as soon as
+    it and every earlier chunk are done, while later chunks are still
+    encoding/uploading.
+    """
+    from utils.audio import iter_split_audio
+
+    n_workers = max(1, OPENAI_MAX_CONCURRENT)
+    queue: asyncio.Queue = asyncio.Queue(maxsize=4)
+    results: dict[int, object] = {}
+    # Chunk count, known once ffmpeg has finished (or failed)
+    total: Optional[int] = None
+    ready = asyncio.Condition()
+
+    async with _new_async_client(api_key, n_workers) as client:
+        async def produce():
+            nonlocal total
+            idx = 0
+            try:
+                async for path in iter_split_audio(
+                    audio_path, chunk_dir, chunk_seconds, cut_points, speedup
+                ):
+                    data = await asyncio.to_thread(Path(path).read_bytes)
+                    await queue.put((idx, (os.path.basename(path), data)))
+                    idx += 1
+            finally:
+                total = idx
+                async with ready:
+                    ready.notify_all()
+                # One stop sentinel per worker, also when ffmpeg fails
+                for _ in range(n_workers):
+                    await queue.put(None)
+
+        async def consume():
+            while (item := await queue.get()) is not None:
+                idx, audio = item
+                try:
+                    results[idx] = await _atranscribe_diarized(client, audio, language)
+                except Exception as e:
+                    results[idx] = e
+                async with ready:
+                    ready.notify_all()
+
+        workers = asyncio.gather(produce(), *[consume() for _ in range(n_workers)])
         try:
-            result = _transcribe_diarized(chunk_path, api_key, language)
-            for seg in result.segments:
-                seg.start += offset
-                seg.end += offset
-                all_segments.append(seg)
-                speakers_seen.add(seg.speaker)
-        except Exception as e:
-            logger.error(f"Chunk transcription failed: {e}")
+            next_idx = 0
+            while True:
+                async with ready:
+                    await ready.wait_for(
+                        lambda: next_idx in results or (total is not None and next_idx >= total)
+                    )
+                if next_idx not in results:
+                    break
+                yield results.pop(next_idx)
+                next_idx += 1
+            # Surfaces a failed ffmpeg split (iter_split_audio raises)
+            await workers
         finally:
-            # Clean up chunk file
-            try:
-                os.remove(chunk_path)
-            except OSError:
-                pass
-
-    return TranscriptionResult(
-        segments=all_segments,
-        language=language or "en",
-        num_speakers=len(speakers_seen),
-    )
+            if not workers.done():
+                workers.cancel()
 
 
+@lru_cache(maxsize=256)
 def _normalize_speaker(speaker: str) -> str:
     """
     Normalize speaker labels to SPEAKER_XX format.
     OpenAI may return labels like 'speaker_0', 'Speaker 1', 'SPEAKER_00', etc.
+    Cached: the same few labels repeat on every segment.
     """
     if not speaker:
         return "SPEAKER_00"
@@ -307,23 +766,29 @@ def _normalize_speaker(speaker: str) -> str:
         return speaker
 
     # Extract number from various formats
-    import re
-    match = re.search(r'(\d+)', speaker)
+    match = _NUM_RE.search(speaker)
     if match:
         num = int(match.group(1))
         return f"SPEAKER_{num:02d}"
 
-    # Hash-based fallback for named speakers
-    return f"SPEAKER_{abs(hash(speaker)) % 100:02d}"
+    # Hash-based fallback for named speakers (stable across processes)
+    return f"SPEAKER_{_stable_speaker_id(speaker):02d}"
 
 
-def _transcribe_demo(demo_id: str = "demo") -> TranscriptionResult:
+def _stable_speaker_id(speaker: str) -> int:
     """
-    Return a small hardcoded transcription for demo/testing purposes.
-    Allows the frontend to work without any API keys or audio files.
+    FNV-1a (32-bit) of the label, mod 100. Unlike hash(), this does not depend
+    on PYTHONHASHSEED, so named speakers map to the same ID on every run.
     """
-    logger.info(f"Generating demo transcription (id={demo_id})")
-    segments = [
+    h = 0x811c9dc5
+    for b in speaker.encode("utf-8"):
+        h = ((h ^ b) * 0x01000193) & 0xFFFFFFFF
+    return h % 100
+
+
+# Static demo transcript, validated once at import
+_DEMO_RESULT = TranscriptionResult(
+    segments=[
         TranscriptionSegment(speaker="SPEAKER_00", text="I believe we need to invest more in education to ensure every child has access to quality schools.", start=0.0, end=6.5),
         TranscriptionSegment(speaker="SPEAKER_01", text="While education is important, we can't just throw money at the problem. We need accountability and results.", start=7.0, end=13.0),
         TranscriptionSegment(speaker="SPEAKER_00", text="Studies show that increased funding directly correlates with better student outcomes.", start=13.5, end=19.0),
@@ -334,12 +799,22 @@ def _transcribe_demo(demo_id: str = "demo") -> TranscriptionResult:
         TranscriptionSegment(speaker="SPEAKER_01", text="That's an ad hominem attack. I care deeply, I just disagree on the approach.", start=39.5, end=45.0),
         TranscriptionSegment(speaker="SPEAKER_00", text="The National Education Association supports our plan.", start=45.5, end=50.0),
         TranscriptionSegment(speaker="SPEAKER_01", text="Appeal to authority doesn't make the plan effective. Let's look at the evidence.", start=50.5, end=56.0),
-    ]
-    return TranscriptionResult(
-        segments=segments,
-        language="en",
-        num_speakers=2,
-    )
+    ],
+    language="en",
+    num_speakers=2,
+)
+
+
+def _transcribe_demo(demo_id: str = "demo", copy: bool = True) -> TranscriptionResult:
+    """
+    Return a small hardcoded transcription for demo/testing purposes.
+    Allows the frontend to work without any API keys or audio files.
+
+    With copy=False the shared module-level result is returned; callers
+    must then treat it as read-only.
+    """
+    logger.info(f"Generating demo transcription (id={demo_id})")
+    return _DEMO_RESULT.model_copy(deep=True) if copy else _DEMO_RESULT
 
 
 def _split_text_into_segments(
@@ -349,8 +824,7 @@ def _split_text_into_segments(
     """
     Split plain text into approximate segments (for non-diarized fallback).
     """
-    import re
-    sentences = re.split(r'(?<=[.!?])\s+', text)
+    sentences = _SENT_RE.split(text)
 
     segments = []
     current_time = 0.0
@@ -364,7 +838,7 @@ def _split_text_into_segments(
         word_count = len(sentence.split())
         duration = max(1.0, (word_count / 150) * 60)
 
-        segments.append(TranscriptionSegment(
+        segments.append(TranscriptionSegment.model_construct(
             speaker="SPEAKER_00",
             text=sentence,
             start=round(current_time, 2),
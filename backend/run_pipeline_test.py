@@ -13,28 +13,26 @@ import sys
 import asyncio
 import logging
 import time
-import json
+import uuid
+from collections import Counter
+from operator import attrgetter
 from pathlib import Path
 
 # Load .env from project root
 from dotenv import load_dotenv
 load_dotenv(Path(__file__).parent.parent / ".env")
 
-# Configure rich logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
-    datefmt="%H:%M:%S",
-    handlers=[
-        logging.StreamHandler(sys.stdout),
-        logging.FileHandler(Path(__file__).parent.parent / "logs" / "pipeline_test.log", mode="w", encoding="utf-8"),
-    ]
-)
-logger = logging.getLogger("pipeline_test")
+# Repeat runs over the demo audio reuse its transcription from the on-disk cache
+os.environ.setdefault("STT_CACHE", "default")
 
-# Ensure logs dir exists
+# Ensure logs dir exists (before the FileHandler below opens its file)
 (Path(__file__).parent.parent / "logs").mkdir(exist_ok=True)
 
+# Configure logging (console + batched file writes)
+from config.logging_config import setup_script_logging
+setup_script_logging(Path(__file__).parent.parent / "logs" / "pipeline_test.log", mode="w")
+logger = logging.getLogger("pipeline_test")
+
 
 async def main():
     logger.info("=" * 70)
@@ -72,16 +70,17 @@ async def main():
     # ── Initialize DB ──────────────────────────────────────────────────────
     logger.info("\n[0/5] Initializing PostgreSQL...")
     try:
-        from db.database import init_db, create_job, update_job_status, save_snapshot, get_job, list_jobs
+        from db.database import (
+            init_db, create_job, update_job_status, save_snapshot, snapshot_stats, get_job, list_jobs,
+        )
         init_db()
         logger.info("  ✓ PostgreSQL tables ready")
     except Exception as e:
         logger.error(f"  ✗ DB init failed: {e}")
         logger.warning("  Continuing without DB persistence...")
-        init_db = create_job = update_job_status = save_snapshot = get_job = list_jobs = None
+        init_db = create_job = update_job_status = save_snapshot = snapshot_stats = get_job = list_jobs = None
 
     # ── Create job ─────────────────────────────────────────────────────────
-    import uuid
     job_id = str(uuid.uuid4())
     logger.info(f"\n  Job ID: {job_id}")
 
@@ -98,8 +97,8 @@ async def main():
         update_job_status(job_id, "transcribing", progress=0.1)
 
     try:
-        from pipeline.transcription import transcribe_audio
-        transcription = await asyncio.to_thread(transcribe_audio, str(demo_audio))
+        from pipeline.transcription import transcribe_audio_async
+        transcription = await transcribe_audio_async(str(demo_audio))
         t_transcription = time.time() - t_start
 
         logger.info(f"  ✓ Transcription complete in {t_transcription:.1f}s")
@@ -113,7 +112,6 @@ async def main():
             logger.info(f"    [{seg.start:.1f}s-{seg.end:.1f}s] {seg.speaker}: {seg.text[:80]}")
 
         # Log speaker distribution
-        from collections import Counter
         speaker_counts = Counter(seg.speaker for seg in transcription.segments)
         logger.info(f"\n  Speaker distribution: {dict(speaker_counts)}")
 
@@ -144,8 +142,8 @@ async def main():
         logger.info(f"\n  ✓ Analysis complete in {t_analysis:.1f}s")
         logger.info(f"    Nodes (claims):    {len(snapshot.nodes)}")
         logger.info(f"    Edges (relations): {len(snapshot.edges)}")
-        logger.info(f"    Fallacies:         {sum(len(n.fallacies) for n in snapshot.nodes)}")
-        logger.info(f"    Fact-checked:      {len([n for n in snapshot.nodes if n.factcheck_verdict.value != 'pending'])}")
+        logger.info(f"    Fallacies:         {graph_store.num_fallacies}")
+        logger.info(f"    Fact-checked:      {graph_store.num_factchecks}")
         logger.info(f"    Cycles detected:   {len(snapshot.cycles_detected)}")
 
     except Exception as e:
@@ -158,9 +156,12 @@ async def main():
     logger.info("\n[3/5] PERSISTING TO POSTGRESQL...")
     if save_snapshot:
         try:
-            snapshot_dict = snapshot.model_dump(mode="json")
-            transcription_dict = transcription.model_dump(mode="json")
-            snapshot_id = save_snapshot(job_id, snapshot_dict, transcription_dict)
+            snapshot_id = save_snapshot(
+                job_id,
+                snapshot.model_dump_json(),
+                transcription.model_dump_json(),
+                stats=snapshot_stats(snapshot),
+            )
             update_job_status(job_id, "complete", progress=1.0)
             logger.info(f"  ✓ Snapshot saved: {snapshot_id}")
         except Exception as e:
@@ -172,83 +173,95 @@ async def main():
     logger.info("\n[4/5] DETAILED RESULTS")
     logger.info("=" * 70)
 
+    # Each section is collected and logged as one multi-line record
     # Rigor scores
-    logger.info("\n  RIGOR SCORES:")
-    for score in sorted(snapshot.rigor_scores, key=lambda s: s.overall_score, reverse=True):
-        logger.info(f"    {score.speaker}: {score.overall_score:.2%}")
-        logger.info(f"      supported_ratio={score.supported_ratio:.2%}, "
-                    f"fallacy_count={score.fallacy_count}, "
-                    f"fallacy_penalty={score.fallacy_penalty:.2%}")
-        logger.info(f"      factcheck_rate={score.factcheck_positive_rate:.2%}, "
-                    f"consistency={score.internal_consistency:.2%}, "
-                    f"response_rate={score.direct_response_rate:.2%}")
+    lines = ["\n  RIGOR SCORES:"]
+    for score in sorted(snapshot.rigor_scores, key=attrgetter("overall_score"), reverse=True):
+        lines.append(f"    {score.speaker}: {score.overall_score:.2%}")
+        lines.append(f"      supported_ratio={score.supported_ratio:.2%}, "
+                     f"fallacy_count={score.fallacy_count}, "
+                     f"fallacy_penalty={score.fallacy_penalty:.2%}")
+        lines.append(f"      factcheck_rate={score.factcheck_positive_rate:.2%}, "
+                     f"consistency={score.internal_consistency:.2%}, "
+                     f"response_rate={score.direct_response_rate:.2%}")
+    logger.info("\n".join(lines))
+
+    # Single pass over nodes for every per-node breakdown
+    all_fallacies = []
+    factchecked = []
+    fallacy_types = Counter()
+    verdicts = Counter()
+    claim_types = Counter()
+    node_by_id = {}
+    for n in snapshot.nodes:
+        node_by_id[n.id] = n
+        claim_types[n.claim_type.value] += 1
+        verdict = n.factcheck_verdict.value
+        if verdict != "pending":
+            factchecked.append(n)
+            verdicts[verdict] += 1
+        if n.fallacies:
+            all_fallacies.extend(n.fallacies)
+            fallacy_types.update(f.fallacy_type.value for f in n.fallacies)
 
     # Fallacy breakdown
-    all_fallacies = [f for n in snapshot.nodes for f in n.fallacies]
     if all_fallacies:
-        from collections import Counter
-        fallacy_types = Counter(f.fallacy_type.value for f in all_fallacies)
-        logger.info(f"\n  FALLACIES ({len(all_fallacies)} total):")
-        for ftype, count in fallacy_types.most_common():
-            logger.info(f"    {ftype}: {count}")
-
-        logger.info("\n  TOP 5 FALLACIES (by severity):")
-        top_fallacies = sorted(all_fallacies, key=lambda f: f.severity, reverse=True)[:5]
+        lines = [f"\n  FALLACIES ({len(all_fallacies)} total):"]
+        lines.extend(f"    {ftype}: {count}" for ftype, count in fallacy_types.most_common())
+
+        lines.append("\n  TOP 5 FALLACIES (by severity):")
+        top_fallacies = sorted(all_fallacies, key=attrgetter("severity"), reverse=True)[:5]
         for f in top_fallacies:
-            node = next((n for n in snapshot.nodes if n.id == f.claim_id), None)
+            node = node_by_id.get(f.claim_id)
             speaker = node.speaker if node else "?"
-            logger.info(f"    [{speaker}] {f.fallacy_type.value} (severity={f.severity:.2f})")
-            logger.info(f"      Claim: {(node.label if node else '?')[:70]}")
-            logger.info(f"      Q: {f.socratic_question[:80]}")
+            lines.append(f"    [{speaker}] {f.fallacy_type.value} (severity={f.severity:.2f})")
+            lines.append(f"      Claim: {(node.label if node else '?')[:70]}")
+            lines.append(f"      Q: {f.socratic_question[:80]}")
+        logger.info("\n".join(lines))
 
     # Fact-check breakdown
-    factchecked = [n for n in snapshot.nodes if n.factcheck_verdict.value != "pending"]
     if factchecked:
-        from collections import Counter
-        verdicts = Counter(n.factcheck_verdict.value for n in factchecked)
-        logger.info(f"\n  FACT-CHECKS ({len(factchecked)} total):")
-        for verdict, count in verdicts.most_common():
-            logger.info(f"    {verdict}: {count}")
+        lines = [f"\n  FACT-CHECKS ({len(factchecked)} total):"]
+        lines.extend(f"    {verdict}: {count}" for verdict, count in verdicts.most_common())
+        logger.info("\n".join(lines))
 
     # Edge type breakdown
-    from collections import Counter
     edge_types = Counter(e.relation_type.value for e in snapshot.edges)
-    logger.info(f"\n  EDGE TYPES:")
-    for etype, count in edge_types.most_common():
-        logger.info(f"    {etype}: {count}")
+    lines = ["\n  EDGE TYPES:"]
+    lines.extend(f"    {etype}: {count}" for etype, count in edge_types.most_common())
 
     # Claim type breakdown
-    claim_types = Counter(n.claim_type.value for n in snapshot.nodes)
-    logger.info(f"\n  CLAIM TYPES:")
-    for ctype, count in claim_types.most_common():
-        logger.info(f"    {ctype}: {count}")
+    lines.append("\n  CLAIM TYPES:")
+    lines.extend(f"    {ctype}: {count}" for ctype, count in claim_types.most_common())
+    logger.info("\n".join(lines))
 
     # ── Step 5: Save JSON snapshot ─────────────────────────────────────────
     logger.info("\n[5/5] SAVING JSON SNAPSHOT...")
     snapshot_path = Path(__file__).parent.parent / "logs" / "e2e_test_snapshot.json"
     try:
-        with open(snapshot_path, "w", encoding="utf-8") as f:
-            json.dump(snapshot.model_dump(mode="json"), f, indent=2, ensure_ascii=False)
+        snapshot_path.write_bytes(snapshot.model_dump_json(indent=2).encode("utf-8"))
         logger.info(f"  ✓ Snapshot saved to: {snapshot_path}")
     except Exception as e:
         logger.error(f"  ✗ Failed to save JSON: {e}")
 
     # ── Summary ────────────────────────────────────────────────────────────
     total_time = time.time() - t_start
-    logger.info("\n" + "=" * 70)
-    logger.info("  PIPELINE TEST COMPLETE")
-    logger.info("=" * 70)
-    logger.info(f"  Total time:        {total_time:.1f}s ({total_time/60:.1f} min)")
-    logger.info(f"  Transcription:     {t_transcription:.1f}s")
-    logger.info(f"  Analysis:          {t_analysis:.1f}s")
-    logger.info(f"  Job ID:            {job_id}")
-    logger.info(f"  Nodes:             {len(snapshot.nodes)}")
-    logger.info(f"  Edges:             {len(snapshot.edges)}")
-    logger.info(f"  Fallacies:         {len(all_fallacies)}")
-    logger.info(f"  Fact-checks:       {len(factchecked)}")
-    logger.info(f"  DB viewer:         http://localhost:8010/db")
-    logger.info(f"  Snapshot detail:   http://localhost:8010/db/snapshot/{job_id}")
-    logger.info("=" * 70)
+    logger.info("\n".join([
+        "\n" + "=" * 70,
+        "  PIPELINE TEST COMPLETE",
+        "=" * 70,
+        f"  Total time:        {total_time:.1f}s ({total_time/60:.1f} min)",
+        f"  Transcription:     {t_transcription:.1f}s",
+        f"  Analysis:          {t_analysis:.1f}s",
+        f"  Job ID:            {job_id}",
+        f"  Nodes:             {len(snapshot.nodes)}",
+        f"  Edges:             {len(snapshot.edges)}",
+        f"  Fallacies:         {len(all_fallacies)}",
+        f"  Fact-checks:       {len(factchecked)}",
+        f"  DB viewer:         http://localhost:8010/db",
+        f"  Snapshot detail:   http://localhost:8010/db/snapshot/{job_id}",
+        "=" * 70,
+    ]))
 
     # ── DB verification ────────────────────────────────────────────────────
     if list_jobs:
@@ -6,28 +6,22 @@ Logs everything to logs/run_test_<timestamp>.log
 
 import os
 import sys
-import json
 import time
 import logging
-import requests
+import httpx
 from datetime import datetime
 from pathlib import Path
 
+from config.logging_config import setup_script_logging
+from utils.json_utils import dumps_pretty
+
 # ─── Setup logging ───────────────────────────────────────────
 log_dir = Path(__file__).parent.parent / "logs"
 log_dir.mkdir(exist_ok=True)
 ts = datetime.now().strftime("%Y%m%d_%H%M%S")
 log_file = log_dir / f"run_test_{ts}.log"
 
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s [%(levelname)s] %(message)s",
-    datefmt="%H:%M:%S",
-    handlers=[
-        logging.StreamHandler(sys.stdout),
-        logging.FileHandler(log_file, encoding="utf-8"),
-    ],
-)
+setup_script_logging(log_file, fmt="%(asctime)s [%(levelname)s] %(message)s")
 log = logging.getLogger("test")
 
 BASE_URL = "http://localhost:8010"
@@ -41,9 +35,16 @@ def main():
     log.info(f"Log:   {log_file}")
     log.info("=" * 60)
 
+    # One client for every call: keeps the connection to the API alive
+    # across the status polls instead of reconnecting for each request.
+    with httpx.Client(base_url=BASE_URL, timeout=60.0) as client:
+        run_test(client)
+
+
+def run_test(client: httpx.Client):
     # ── 1. Health check ──────────────────────────────────────
     log.info("[1/5] Health check...")
-    r = requests.get(f"{BASE_URL}/api/health")
+    r = client.get("/api/health")
     health = r.json()
     log.info(f"  Status: {health['status']}")
     log.info(f"  Anthropic: {health['anthropic_configured']}")
@@ -55,8 +56,8 @@ def main():
     log.info(f"[2/5] Uploading {AUDIO_FILE.name} ({AUDIO_FILE.stat().st_size / 1e6:.1f} MB)...")
     t0 = time.time()
     with open(AUDIO_FILE, "rb") as f:
-        r = requests.post(
-            f"{BASE_URL}/api/upload",
+        r = client.post(
+            "/api/upload",
             files={"file": (AUDIO_FILE.name, f, "audio/mpeg")},
             timeout=60,
         )
@@ -75,7 +76,7 @@ def main():
     while True:
         time.sleep(5)
         try:
-            r = requests.get(f"{BASE_URL}/api/status/{job_id}", timeout=10)
+            r = client.get(f"/api/status/{job_id}", timeout=10)
             status_data = r.json()
         except Exception as e:
             log.warning(f"  Poll error: {e}")
@@ -102,7 +103,7 @@ def main():
 
     # ── 4. Verify snapshot from DB ───────────────────────────
     log.info("[4/5] Loading snapshot from DB...")
-    r = requests.get(f"{BASE_URL}/api/snapshot/{job_id}", timeout=10)
+    r = client.get(f"/api/snapshot/{job_id}", timeout=10)
     r.raise_for_status()
     snap_resp = r.json()
 
@@ -168,7 +169,7 @@ def main():
 
     # ── 5. Verify jobs list ──────────────────────────────────
     log.info("[5/5] Verifying jobs list in DB...")
-    r = requests.get(f"{BASE_URL}/api/jobs", timeout=10)
+    r = client.get("/api/jobs", timeout=10)
     jobs = r.json()
     log.info(f"  Total jobs in DB: {len(jobs)}")
     our_job = next((j for j in jobs if j["id"] == job_id), None)
@@ -179,8 +180,7 @@ def main():
 
     # Save snapshot to file for reference
     out_file = log_dir / f"snapshot_{ts}.json"
-    with open(out_file, "w", encoding="utf-8") as f:
-        json.dump(snap_resp, f, indent=2, ensure_ascii=False)
+    out_file.write_bytes(dumps_pretty(snap_resp))
     log.info(f"  Snapshot saved to: {out_file}")
 
     total_time = time.time() - t0
@@ -26,40 +26,26 @@ def main():
         print("Check DATABASE_URL in .env and that PostgreSQL is running.")
         sys.exit(1)
     try:
+        # Server-side: delete everything but the newest job in one statement
+        # (served by idx_jobs_created); only the deleted rows come back
         with conn.cursor() as cur:
-            # List all jobs, newest first
             cur.execute(
                 """
-                SELECT id, status, audio_filename, created_at
-                FROM jobs
-                ORDER BY created_at DESC
+                DELETE FROM jobs
+                WHERE id NOT IN (SELECT id FROM jobs ORDER BY created_at DESC LIMIT 1)
+                RETURNING id, status, audio_filename, created_at
                 """
             )
             rows = cur.fetchall()
 
         if not rows:
-            print("No jobs in database.")
+            print("At most one job exists. Nothing to delete.")
             return
 
-        print(f"Found {len(rows)} jobs:")
-        for r in rows:
+        print(f"Deleted {len(rows)} jobs:")
+        for r in sorted(rows, key=lambda r: r[3], reverse=True):
             print(f"  {r[0][:8]}... | {r[1]:12} | {r[2] or '—'} | {r[3]}")
 
-        keep_id = rows[0][0]
-        to_delete = [r[0] for r in rows[1:]]
-
-        if not to_delete:
-            print("\nOnly one job exists. Nothing to delete.")
-            return
-
-        print(f"\nKeeping: {keep_id} ({rows[0][2]})")
-        print(f"Deleting {len(to_delete)} jobs: {[x[:8] + '...' for x in to_delete]}")
-
-        with conn.cursor() as cur:
-            for jid in to_delete:
-                cur.execute("DELETE FROM jobs WHERE id = %s", (jid,))
-                print(f"  Deleted {jid[:8]}...")
-
         conn.commit()
         print("\nDone.")
     finally:
@@ -2,14 +2,38 @@
 Structured session logger: one folder per session with organized JSONL files.
 Logs every LLM call (input/output), every node/edge created, fallacies, factchecks,
 and transcription chunks — all with timestamps.
+
+Records are buffered per file and written in batches (every _FLUSH_BATCH
+records or every _FLUSH_INTERVAL seconds) through one persistent handle per
+file, instead of an open/write/close per event.
 """
 
-import json
+import atexit
 import threading
 import uuid
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional
+from typing import BinaryIO, Optional
+
+from utils.json_utils import dumps, dumps_line, dumps_pretty
+
+_FLUSH_BATCH = 64
+_FLUSH_INTERVAL = 2.0
+
+# Every file the logger writes; locks and buffers are created up front
+_LOG_FILES = (
+    "llm_calls.jsonl",
+    "nodes.jsonl",
+    "edges.jsonl",
+    "fallacies.jsonl",
+    "factchecks.jsonl",
+    "transcription_chunks.jsonl",
+)
+
+
+def _now_iso() -> str:
+    """UTC timestamp for log records (millisecond resolution keeps it short)."""
+    return datetime.now(timezone.utc).isoformat(timespec="milliseconds")
 
 
 class SessionLogger:
@@ -21,31 +45,86 @@ class SessionLogger:
     def __init__(self, session_dir: str):
         self.session_dir = Path(session_dir)
         self.session_dir.mkdir(parents=True, exist_ok=True)
-        self._locks: dict[str, threading.Lock] = {}
+        self._locks: dict[str, threading.Lock] = {name: threading.Lock() for name in _LOG_FILES}
+        self._handles: dict[str, BinaryIO] = {}
+        self._buffers: dict[str, list[bytes]] = {name: [] for name in _LOG_FILES}
         self._call_counter = 0
-        self._started_at = datetime.now(timezone.utc).isoformat()
+        self._started_at = _now_iso()
         self._write_meta()
-
-    def _lock(self, name: str) -> threading.Lock:
-        if name not in self._locks:
-            self._locks[name] = threading.Lock()
-        return self._locks[name]
+        self._stop_flusher = threading.Event()
+        self._flusher = threading.Thread(
+            target=self._flush_loop, name=f"session-log-{self.session_dir.name}", daemon=True
+        )
+        self._flusher.start()
+        atexit.register(self._flush_all)
 
     def _append_jsonl(self, filename: str, obj: dict) -> None:
-        path = self.session_dir / filename
-        line = json.dumps(obj, ensure_ascii=False) + "\n"
-        with self._lock(filename):
-            with open(path, "a", encoding="utf-8") as f:
-                f.write(line)
+        self._append_line(filename, dumps_line(obj))
+
+    def _append_line(self, filename: str, line: bytes) -> None:
+        """Queue one already-encoded, newline-terminated JSONL record."""
+        with self._locks[filename]:
+            buf = self._buffers[filename]
+            buf.append(line)
+            if len(buf) >= _FLUSH_BATCH or self._stop_flusher.is_set():
+                self._flush_locked(filename, buf)
+
+    def _flush_locked(self, filename: str, buf: list[bytes]) -> None:
+        """Write buffered lines for filename. Caller holds the file's lock."""
+        if not buf:
+            return
+        if self._stop_flusher.is_set():
+            # Closed logger: late records are written through a short-lived handle
+            with open(self.session_dir / filename, "ab") as f:
+                f.writelines(buf)
+            buf.clear()
+            return
+        f = self._handles.get(filename)
+        if f is None:
+            f = open(self.session_dir / filename, "ab")
+            self._handles[filename] = f
+        f.writelines(buf)
+        f.flush()
+        buf.clear()
+
+    def _flush_all(self) -> None:
+        """Write every pending buffer to disk."""
+        for filename, buf in self._buffers.items():
+            with self._locks[filename]:
+                self._flush_locked(filename, buf)
+
+    def _flush_loop(self) -> None:
+        while not self._stop_flusher.wait(_FLUSH_INTERVAL):
+            try:
+                self._flush_all()
+            except OSError:
+                pass
+
+    def close(self) -> None:
+        """Flush pending records, stop the flusher thread and close the file handles."""
+        if self._stop_flusher.is_set():
+            return
+        self._stop_flusher.set()
+        for filename, buf in self._buffers.items():
+            with self._locks[filename]:
+                f = self._handles.pop(filename, None)
+                if f is not None:
+                    f.writelines(buf)
+                    f.close()
+                    buf.clear()
+                else:
+                    self._flush_locked(filename, buf)
+        self._flusher.join()
+        atexit.unregister(self._flush_all)
+
+    def __enter__(self) -> "SessionLogger":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
 
     def _write_meta(self) -> None:
-        meta = {
-            "session_dir": str(self.session_dir),
-            "started_at_utc": self._started_at,
-        }
-        path = self.session_dir / "meta.json"
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(meta, f, indent=2)
+        self._write_meta_json()
         readme = self.session_dir / "README.txt"
         readme.write_text(
             "Structured session logs. One JSON object per line in .jsonl files.\n"
@@ -58,17 +137,20 @@ class SessionLogger:
             encoding="utf-8",
         )
 
+    def _write_meta_json(self, ended_at: Optional[str] = None) -> None:
+        # The logger owns every field, so meta.json is always written whole from memory
+        meta = {
+            "session_dir": str(self.session_dir),
+            "started_at_utc": self._started_at,
+        }
+        if ended_at:
+            meta["ended_at_utc"] = ended_at
+        (self.session_dir / "meta.json").write_bytes(dumps_pretty(meta))
+
     def set_ended_at(self) -> None:
-        """Call when session ends to record end time in meta."""
-        path = self.session_dir / "meta.json"
-        try:
-            with open(path, "r", encoding="utf-8") as f:
-                meta = json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError):
-            meta = {}
-        meta["ended_at_utc"] = datetime.now(timezone.utc).isoformat()
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(meta, f, indent=2)
+        """Call when session ends to record end time in meta (also flushes and closes the logs)."""
+        self.close()
+        self._write_meta_json(ended_at=_now_iso())
 
     def log_llm_call(
         self,
@@ -87,7 +169,7 @@ class SessionLogger:
         """Log one LLM request/response with timestamp."""
         self._call_counter += 1
         record = {
-            "timestamp_utc": datetime.now(timezone.utc).isoformat(),
+            "timestamp_utc": _now_iso(),
             "call_id": call_id or f"llm_{self._call_counter:04d}_{uuid.uuid4().hex[:8]}",
             "provider": provider,
             "model": model,
@@ -113,7 +195,7 @@ class SessionLogger:
     ) -> None:
         """Log a graph node (claim) creation."""
         record = {
-            "timestamp_utc": datetime.now(timezone.utc).isoformat(),
+            "timestamp_utc": _now_iso(),
             "node_id": node_id,
             "claim": claim_data,
             "source": source,
@@ -131,7 +213,7 @@ class SessionLogger:
     ) -> None:
         """Log a graph edge (relation) creation."""
         record = {
-            "timestamp_utc": datetime.now(timezone.utc).isoformat(),
+            "timestamp_utc": _now_iso(),
             "source_id": source_id,
             "target_id": target_id,
             "relation_type": relation_type,
@@ -148,7 +230,7 @@ class SessionLogger:
     ) -> None:
         """Log a fallacy annotation added to the graph."""
         record = {
-            "timestamp_utc": datetime.now(timezone.utc).isoformat(),
+            "timestamp_utc": _now_iso(),
             "fallacy": fallacy_data,
             "source": source,
         }
@@ -162,7 +244,7 @@ class SessionLogger:
     ) -> None:
         """Log a fact-check result added to the graph."""
         record = {
-            "timestamp_utc": datetime.now(timezone.utc).isoformat(),
+            "timestamp_utc": _now_iso(),
             "factcheck": factcheck_data,
             "source": source,
         }
@@ -176,15 +258,24 @@ class SessionLogger:
         segments: list[dict],
         raw_response_preview: Optional[str] = None,
         duration_seconds: Optional[float] = None,
+        segments_json: Optional[bytes] = None,
     ) -> None:
-        """Log one transcription (STT) chunk output."""
+        """
+        Log one transcription (STT) chunk output.
+        segments_json, if given, is segments already encoded as JSON; it is
+        spliced into the line verbatim instead of being serialized again.
+        """
         record = {
-            "timestamp_utc": datetime.now(timezone.utc).isoformat(),
+            "timestamp_utc": _now_iso(),
             "chunk_index": chunk_index,
             "time_offset": time_offset,
             "segments_count": len(segments),
-            "segments": segments,
             "raw_response_preview": raw_response_preview[:2000] if raw_response_preview else None,
             "duration_seconds": duration_seconds,
         }
-        self._append_jsonl("transcription_chunks.jsonl", record)
+        if segments_json is None:
+            record["segments"] = segments
+            self._append_jsonl("transcription_chunks.jsonl", record)
+            return
+        line = dumps(record)[:-1] + b',"segments":' + segments_json + b"}\n"
+        self._append_line("transcription_chunks.jsonl", line)
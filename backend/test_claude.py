@@ -1,12 +1,11 @@
 """Test Claude API with different model names to find the correct one."""
 import os
+import asyncio
 from dotenv import load_dotenv
 load_dotenv(os.path.join(os.path.dirname(__file__), '..', '.env'))
 
 import anthropic
 
-client = anthropic.Anthropic()
-
 models_to_try = [
     "claude-haiku-4-5",  # primary
     "claude-3-5-haiku-latest",
@@ -15,13 +14,28 @@ models_to_try = [
     "claude-3-5-sonnet-latest",
 ]
 
-for model_name in models_to_try:
+
+async def probe(client: anthropic.AsyncAnthropic, model_name: str):
     try:
-        response = client.messages.create(
+        response = await client.messages.create(
             model=model_name,
             max_tokens=10,
             messages=[{"role": "user", "content": "Say hi"}],
         )
-        print(f"SUCCESS: {model_name} -> {response.model} -> {response.content[0].text}")
+        return model_name, True, response
     except Exception as e:
-        print(f"FAIL:    {model_name} -> {type(e).__name__}: {str(e)[:100]}")
+        return model_name, False, e
+
+
+async def main():
+    # Probes are independent: run them concurrently, print in list order
+    client = anthropic.AsyncAnthropic()
+    results = await asyncio.gather(*(probe(client, m) for m in models_to_try))
+    for model_name, ok, result in results:
+        if ok:
+            print(f"SUCCESS: {model_name} -> {result.model} -> {result.content[0].text}")
+        else:
+            print(f"FAIL:    {model_name} -> {type(result).__name__}: {str(result)[:100]}")
+
+
+asyncio.run(main())
@@ -9,18 +9,26 @@ Usage:
 
 import os
 import sys
-import json
 import time
 import asyncio
 import logging
+from collections import Counter
+from importlib import metadata
 from pathlib import Path
 
+import numpy as np
+
 # Ensure we can import from the backend package
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from dotenv import load_dotenv
 load_dotenv(os.path.join(os.path.dirname(__file__), '..', '.env'))
 
+# Repeat runs over the same audio reuse transcription and Claude/Tavily
+# responses from the on-disk caches
+os.environ.setdefault("STT_CACHE", "default")
+os.environ.setdefault("LLM_CACHE", "default")
+
 # Set up logging
 logging.basicConfig(
     level=logging.INFO,
@@ -67,18 +75,13 @@ def check_prerequisites():
         size_mb = os.path.getsize(audio_path) / (1024 * 1024)
         print(f"  ✓ Audio file: obama_romney_10min.mp3 ({size_mb:.1f} MB)")
     
-    # Check packages
-    try:
-        import openai
-        print(f"  ✓ openai: {openai.__version__}")
-    except ImportError:
-        issues.append("openai package not installed")
-    
-    try:
-        import anthropic
-        print(f"  ✓ anthropic: {anthropic.__version__}")
-    except ImportError:
-        issues.append("anthropic package not installed")
+    # Check packages (installed metadata only: importing the SDKs here would just
+    # front-load their import time before the first API call)
+    for package in ("openai", "anthropic"):
+        try:
+            print(f"  ✓ {package}: {metadata.version(package)}")
+        except metadata.PackageNotFoundError:
+            issues.append(f"{package} package not installed")
     
     print()
     
@@ -92,212 +95,203 @@ def check_prerequisites():
     return True
 
 
-def test_transcription(audio_path: str):
-    """Test OpenAI transcription with real audio."""
-    print("=" * 70)
-    print("  STEP 1: OpenAI Transcription (gpt-4o-transcribe)")
-    print("=" * 70)
-    
-    from pipeline.transcription import transcribe_audio
-    
-    t0 = time.time()
-    result = transcribe_audio(audio_path)
-    elapsed = time.time() - t0
-    
-    print(f"\n  Transcription completed in {elapsed:.1f}s")
-    print(f"  Segments: {len(result.segments)}")
-    print(f"  Speakers: {result.num_speakers}")
-    print(f"  Language: {result.language}")
-    
-    # Analyze segments
-    speakers = {}
-    total_words = 0
-    for seg in result.segments:
-        if seg.speaker not in speakers:
-            speakers[seg.speaker] = {"count": 0, "words": 0, "total_duration": 0.0}
-        speakers[seg.speaker]["count"] += 1
-        words = len(seg.text.split())
-        speakers[seg.speaker]["words"] += words
-        speakers[seg.speaker]["total_duration"] += (seg.end - seg.start)
-        total_words += words
-    
-    print(f"  Total words: {total_words}")
-    print(f"\n  Speaker breakdown:")
-    for spk, stats in sorted(speakers.items()):
-        print(f"    {spk}: {stats['count']} segments, {stats['words']} words, "
-              f"{stats['total_duration']:.1f}s speaking time")
+def report_transcription(result, elapsed: float):
+    """Print the OpenAI transcription results."""
+    # Collected and written in one go at the end
+    lines = []
+    out = lines.append
+    out("=" * 70)
+    out("  STEP 1: OpenAI Transcription (gpt-4o-transcribe)")
+    out("=" * 70)
+    
+    out(f"\n  Transcription completed in {elapsed:.1f}s")
+    out(f"  Segments: {len(result.segments)}")
+    out(f"  Speakers: {result.num_speakers}")
+    out(f"  Language: {result.language}")
+    
+    # Analyze segments: per-segment columns, then per-speaker sums
+    segments = result.segments
+    word_counts = np.fromiter((len(seg.text.split()) for seg in segments), dtype=np.int64, count=len(segments))
+    durations = np.fromiter((seg.end - seg.start for seg in segments), dtype=np.float64, count=len(segments))
+    speakers, speaker_idx = np.unique([seg.speaker for seg in segments], return_inverse=True)
+    seg_counts = np.bincount(speaker_idx, minlength=len(speakers))
+    words_by_speaker = np.bincount(speaker_idx, weights=word_counts, minlength=len(speakers))
+    time_by_speaker = np.bincount(speaker_idx, weights=durations, minlength=len(speakers))
+    
+    out(f"  Total words: {int(word_counts.sum())}")
+    out(f"\n  Speaker breakdown:")
+    for spk, count, words, duration in zip(speakers, seg_counts, words_by_speaker, time_by_speaker):
+        out(f"    {spk}: {count} segments, {int(words)} words, "
+              f"{duration:.1f}s speaking time")
     
     # Show first 10 segments
-    print(f"\n  First 10 segments:")
+    out(f"\n  First 10 segments:")
     for i, seg in enumerate(result.segments[:10]):
         text_preview = seg.text[:100] + ("..." if len(seg.text) > 100 else "")
-        print(f"    [{seg.start:.1f}s-{seg.end:.1f}s] {seg.speaker}: {text_preview}")
+        out(f"    [{seg.start:.1f}s-{seg.end:.1f}s] {seg.speaker}: {text_preview}")
     
     # Check for very long segments (potential issue for LLM processing)
-    long_segments = [s for s in result.segments if len(s.text.split()) > 100]
-    if long_segments:
-        print(f"\n  ⚠ WARNING: {len(long_segments)} segments have >100 words")
-        print(f"    These may need to be split for better claim extraction")
-        for seg in long_segments[:3]:
-            print(f"    - {seg.speaker} [{seg.start:.1f}s-{seg.end:.1f}s]: "
-                  f"{len(seg.text.split())} words")
-    
-    print()
-    return result
+    long_idx = np.flatnonzero(word_counts > 100)
+    if long_idx.size:
+        out(f"\n  ⚠ WARNING: {long_idx.size} segments have >100 words")
+        out(f"    These may need to be split for better claim extraction")
+        for i in long_idx[:3]:
+            seg = segments[i]
+            out(f"    - {seg.speaker} [{seg.start:.1f}s-{seg.end:.1f}s]: "
+                  f"{word_counts[i]} words")
+    
+    out("")
+    print("\n".join(lines))
 
 
-async def test_full_pipeline(transcription):
-    """Test the full analysis pipeline with real transcription."""
-    print("=" * 70)
-    print("  STEP 2: Full Analysis Pipeline")
-    print("=" * 70)
-    
-    from agents.orchestrator import run_analysis_pipeline
-    from graph.store import DebateGraphStore
-    
-    graph_store = DebateGraphStore()
-    
-    t0 = time.time()
-    snapshot = await run_analysis_pipeline(
-        transcription, graph_store, session_id="e2e_test"
-    )
-    elapsed = time.time() - t0
-    
-    print(f"\n  Pipeline completed in {elapsed:.1f}s")
-    print(f"  Nodes: {len(snapshot.nodes)}")
-    print(f"  Edges: {len(snapshot.edges)}")
-    print(f"  Cycles: {len(snapshot.cycles_detected)}")
+def report_pipeline(snapshot, elapsed: float):
+    """Print the analysis pipeline results and save the snapshot."""
+    lines = []
+    out = lines.append
+    out("=" * 70)
+    out("  STEP 2: Full Analysis Pipeline")
+    out("=" * 70)
+    
+    out(f"\n  Pipeline completed in {elapsed:.1f}s (overlapping transcription)")
+    out(f"  Nodes: {len(snapshot.nodes)}")
+    out(f"  Edges: {len(snapshot.edges)}")
+    out(f"  Cycles: {len(snapshot.cycles_detected)}")
     
     # Claims analysis
-    print(f"\n  ─── Claims ───")
-    claims_by_speaker = {}
-    claims_by_type = {}
-    factual_claims = []
+    out(f"\n  ─── Claims ───")
+    # One pass over the nodes for every per-node tally below
+    claims_by_speaker = Counter()
+    claims_by_type = Counter()
+    fallacy_types = Counter()
+    verdicts = Counter()
+    n_factual = 0
+    all_fallacies = []
+    factchecked = []
     
     for node in snapshot.nodes:
-        if node.speaker not in claims_by_speaker:
-            claims_by_speaker[node.speaker] = []
-        claims_by_speaker[node.speaker].append(node)
-        
-        ct = node.claim_type.value
-        claims_by_type[ct] = claims_by_type.get(ct, 0) + 1
-        
-        if node.is_factual:
-            factual_claims.append(node)
+        claims_by_speaker[node.speaker] += 1
+        claims_by_type[node.claim_type.value] += 1
+        n_factual += node.is_factual
+        for f in node.fallacies:
+            all_fallacies.append((node, f))
+            fallacy_types[f.fallacy_type.value] += 1
+        if node.factcheck:
+            factchecked.append(node)
+            verdicts[node.factcheck.verdict.value] += 1
     
-    for spk, claims in sorted(claims_by_speaker.items()):
-        print(f"    {spk}: {len(claims)} claims")
+    for spk, count in sorted(claims_by_speaker.items()):
+        out(f"    {spk}: {count} claims")
     
-    print(f"    Claim types: {claims_by_type}")
-    print(f"    Factual claims: {len(factual_claims)}")
+    out(f"    Claim types: {dict(claims_by_type)}")
+    out(f"    Factual claims: {n_factual}")
     
     # Show some claims
-    print(f"\n  Sample claims:")
+    out(f"\n  Sample claims:")
     for node in snapshot.nodes[:8]:
-        print(f"    [{node.id}] {node.speaker} ({node.claim_type.value}): "
+        out(f"    [{node.id}] {node.speaker} ({node.claim_type.value}): "
               f"{node.label}")
     
     # Edge analysis
-    print(f"\n  ─── Relations ───")
-    edge_types = {}
-    for edge in snapshot.edges:
-        et = edge.relation_type.value
-        edge_types[et] = edge_types.get(et, 0) + 1
-    print(f"    Edge types: {edge_types}")
+    out(f"\n  ─── Relations ───")
+    edge_types = Counter(edge.relation_type.value for edge in snapshot.edges)
+    out(f"    Edge types: {dict(edge_types)}")
     
     # Fallacy analysis
-    print(f"\n  ─── Fallacies ───")
-    all_fallacies = []
-    for node in snapshot.nodes:
-        for f in node.fallacies:
-            all_fallacies.append((node, f))
-    
+    out(f"\n  ─── Fallacies ───")
     if all_fallacies:
-        fallacy_types = {}
-        for node, f in all_fallacies:
-            ft = f.fallacy_type.value
-            fallacy_types[ft] = fallacy_types.get(ft, 0) + 1
-        
-        print(f"    Total fallacies: {len(all_fallacies)}")
-        print(f"    Types: {fallacy_types}")
+        out(f"    Total fallacies: {len(all_fallacies)}")
+        out(f"    Types: {dict(fallacy_types)}")
         
         for node, f in all_fallacies[:5]:
-            print(f"    [{node.id}] {f.fallacy_type.value} (severity={f.severity:.2f})")
-            print(f"      Explanation: {f.explanation[:120]}...")
+            out(f"    [{node.id}] {f.fallacy_type.value} (severity={f.severity:.2f})")
+            out(f"      Explanation: {f.explanation[:120]}...")
             if f.socratic_question:
-                print(f"      Socratic Q: {f.socratic_question[:120]}...")
+                out(f"      Socratic Q: {f.socratic_question[:120]}...")
     else:
-        print(f"    No fallacies detected")
+        out(f"    No fallacies detected")
     
     # Fact-check analysis
-    print(f"\n  ─── Fact-Checks ───")
-    factchecked = [n for n in snapshot.nodes if n.factcheck]
+    out(f"\n  ─── Fact-Checks ───")
     if factchecked:
-        verdicts = {}
-        for n in factchecked:
-            v = n.factcheck.verdict.value
-            verdicts[v] = verdicts.get(v, 0) + 1
-        
-        print(f"    Fact-checked claims: {len(factchecked)}")
-        print(f"    Verdicts: {verdicts}")
+        out(f"    Fact-checked claims: {len(factchecked)}")
+        out(f"    Verdicts: {dict(verdicts)}")
         
         for n in factchecked[:5]:
             fc = n.factcheck
-            print(f"    [{n.id}] {fc.verdict.value} (confidence={fc.confidence:.2f})")
-            print(f"      Claim: {n.label}")
-            print(f"      Explanation: {fc.explanation[:150]}...")
+            out(f"    [{n.id}] {fc.verdict.value} (confidence={fc.confidence:.2f})")
+            out(f"      Claim: {n.label}")
+            out(f"      Explanation: {fc.explanation[:150]}...")
             if fc.sources:
-                print(f"      Sources: {fc.sources[:2]}")
+                out(f"      Sources: {fc.sources[:2]}")
     else:
-        print(f"    No fact-checks performed")
+        out(f"    No fact-checks performed")
     
     # Rigor scores
-    print(f"\n  ─── Rigor Scores ───")
+    out(f"\n  ─── Rigor Scores ───")
     for score in snapshot.rigor_scores:
-        print(f"    {score.speaker}: {score.overall_score:.3f}")
-        print(f"      Supported ratio: {score.supported_ratio:.3f}")
-        print(f"      Fallacy count: {score.fallacy_count} (penalty: {score.fallacy_penalty:.3f})")
-        print(f"      Fact-check rate: {score.factcheck_positive_rate:.3f}")
-        print(f"      Consistency: {score.internal_consistency:.3f}")
-        print(f"      Response rate: {score.direct_response_rate:.3f}")
+        out(f"    {score.speaker}: {score.overall_score:.3f}")
+        out(f"      Supported ratio: {score.supported_ratio:.3f}")
+        out(f"      Fallacy count: {score.fallacy_count} (penalty: {score.fallacy_penalty:.3f})")
+        out(f"      Fact-check rate: {score.factcheck_positive_rate:.3f}")
+        out(f"      Consistency: {score.internal_consistency:.3f}")
+        out(f"      Response rate: {score.direct_response_rate:.3f}")
     
     # Save full snapshot to JSON for inspection
     output_path = os.path.join(os.path.dirname(__file__), '..', 'logs', 'e2e_test_snapshot.json')
     os.makedirs(os.path.dirname(output_path), exist_ok=True)
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(snapshot.model_dump(mode="json"), f, indent=2, ensure_ascii=False)
-    print(f"\n  Full snapshot saved to: {output_path}")
+    # Serialized by pydantic-core straight to JSON (no intermediate dict tree)
+    Path(output_path).write_bytes(snapshot.model_dump_json(indent=2).encode("utf-8"))
+    out(f"\n  Full snapshot saved to: {output_path}")
     
-    print()
-    return snapshot
+    out("")
+    print("\n".join(lines))
 
 
-def main():
-    if not check_prerequisites():
-        print("Fix the issues above and try again.")
-        sys.exit(1)
+async def run_all(audio_path: str):
+    """
+    Transcription and analysis in one coroutine: transcribed chunks are fed
+    to claim extraction as they arrive instead of after the whole file.
+    """
+    from pipeline.transcription import iter_transcribe_audio
+    from agents.orchestrator import run_streaming_analysis_pipeline
+    from graph.store import DebateGraphStore
     
-    audio_path = os.path.join(os.path.dirname(__file__), '..', 'demos', 'obama_romney_10min.mp3')
-    audio_path = os.path.abspath(audio_path)
+    t0 = time.time()
+    transcription_elapsed = 0.0
+    
+    async def timed_batches():
+        nonlocal transcription_elapsed
+        async for batch in iter_transcribe_audio(audio_path):
+            yield batch
+        transcription_elapsed = time.time() - t0
     
-    # Step 1: Transcription
     try:
-        transcription = test_transcription(audio_path)
+        transcription, snapshot = await run_streaming_analysis_pipeline(
+            timed_batches(), DebateGraphStore(), session_id="e2e_test"
+        )
     except Exception as e:
-        print(f"\n  ✗ TRANSCRIPTION FAILED: {e}")
+        stage = "PIPELINE" if transcription_elapsed else "TRANSCRIPTION"
+        print(f"\n  ✗ {stage} FAILED: {e}")
         import traceback
         traceback.print_exc()
         sys.exit(1)
     
-    # Step 2: Full pipeline
-    try:
-        snapshot = asyncio.run(test_full_pipeline(transcription))
-    except Exception as e:
-        print(f"\n  ✗ PIPELINE FAILED: {e}")
-        import traceback
-        traceback.print_exc()
+    report_transcription(transcription, transcription_elapsed)
+    report_pipeline(snapshot, time.time() - t0)
+    return snapshot
+
+
+def main():
+    if not check_prerequisites():
+        print("Fix the issues above and try again.")
         sys.exit(1)
     
+    audio_path = os.path.join(os.path.dirname(__file__), '..', 'demos', 'obama_romney_10min.mp3')
+    audio_path = os.path.abspath(audio_path)
+    
+    # Both steps share one event loop: analysis consumes transcribed chunks as they arrive
+    asyncio.run(run_all(audio_path))
+    
     print("=" * 70)
     print("  END-TO-END TEST COMPLETE ✓")
     print("=" * 70)
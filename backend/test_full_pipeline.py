@@ -32,6 +32,9 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 from dotenv import load_dotenv
 load_dotenv(os.path.join(os.path.dirname(__file__), '..', '.env'))
 
+# Repeat runs over the demo audio reuse its transcription from the on-disk cache
+os.environ.setdefault("STT_CACHE", "default")
+
 # ─── Logging Setup ──────────────────────────────────────────
 LOG_DIR = os.path.join(os.path.dirname(__file__), '..', 'logs')
 TEST_SESSION = f"test_full_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
@@ -197,15 +200,15 @@ def test_02_audio_validation():
 # TEST 3: OpenAI Transcription with Diarization
 # ═══════════════════════════════════════════════════════════════
 
-def test_03_transcription():
+async def test_03_transcription():
     """Test OpenAI transcription with speaker diarization."""
     logger.info("TEST 3: OpenAI Transcription with Diarization")
     
     try:
-        from pipeline.transcription import transcribe_audio
+        from pipeline.transcription import transcribe_audio_async
         
         t0 = time.time()
-        result = transcribe_audio(DEMO_AUDIO)
+        result = await transcribe_audio_async(DEMO_AUDIO)
         elapsed = time.time() - t0
         
         logger.info(f"  Transcription time: {elapsed:.1f}s")
@@ -865,7 +868,7 @@ async def run_all_tests():
     test_02_audio_validation()
     
     # Test 3: Transcription (REAL OpenAI API call)
-    transcription = test_03_transcription()
+    transcription = await test_03_transcription()
     
     # Save transcription to file for debugging
     if transcription:
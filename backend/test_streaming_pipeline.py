@@ -244,6 +244,7 @@ async def main():
     # -- Track all updates ----------------------------------------------------
     updates = []
     graph_snapshots = []
+    object_events: dict[str, int] = {}
     chunk_timings = []
 
     async def on_update(message: dict):
@@ -261,33 +262,42 @@ async def main():
 
         elif msg_type == "transcription_update":
             ci = message.get("chunk_index", "?")
-            n_segs = len(message.get("new_segments", []))
+            # Segments arrive pre-encoded (spliced verbatim into the websocket frame)
+            new_segments = json.loads(message.get("new_segments_json", "[]"))
             total = message.get("total_segments", 0)
-            logger.info(f"  >>> Transcription update: chunk {ci}, +{n_segs} segments (total: {total})")
+            logger.info(f"  >>> Transcription update: chunk {ci}, +{len(new_segments)} segments (total: {total})")
             # Log segment content
-            for seg in message.get("new_segments", [])[:3]:
+            for seg in new_segments[:3]:
                 speaker = seg.get("speaker", "?")
                 text = seg.get("text", "")[:80]
                 logger.info(f"      [{speaker}] {text}")
 
-        elif msg_type == "graph_update":
+        elif msg_type in ("node_added", "edge_added", "fallacy_added", "factcheck_added"):
+            object_events[msg_type] = object_events.get(msg_type, 0) + 1
+
+        elif msg_type == "stats":
             ci = message.get("chunk_index", "?")
             stats = message.get("stats", {})
             logger.info(
-                f"  >>> GRAPH UPDATE: chunk {ci} — "
+                f"  >>> GRAPH STATS: chunk {ci} — "
                 f"{stats.get('nodes', 0)} nodes, "
                 f"{stats.get('edges', 0)} edges, "
                 f"{stats.get('fallacies', 0)} fallacies, "
-                f"{stats.get('factchecks', 0)} factchecks"
+                f"{stats.get('factchecks', 0)} factchecks "
+                f"(events so far: {object_events})"
             )
-            graph_snapshots.append(message.get("graph"))
+            graph_snapshots.append(stats)
+
+        elif msg_type == "chunk_processed":
+            logger.info(f"  >>> Chunk {message.get('chunk_index', '?')} processed (graph unchanged)")
 
         elif msg_type == "finalizing":
             logger.info(f"  >>> Finalizing: {message.get('message', '')}")
 
         elif msg_type == "stream_complete":
-            nodes = len(message.get("graph", {}).get("nodes", []))
-            edges = len(message.get("graph", {}).get("edges", []))
+            graph = json.loads(message.get("graph_json", "{}"))
+            nodes = len(graph.get("nodes", []))
+            edges = len(graph.get("edges", []))
             logger.info(f"  >>> STREAM COMPLETE: {nodes} nodes, {edges} edges")
 
         elif msg_type == "error":
@@ -374,8 +384,8 @@ async def main():
     logger.info(f"\n  GRAPH GROWTH OVER TIME:")
     for idx, snap in enumerate(graph_snapshots):
         if snap:
-            nodes = len(snap.get("nodes", []))
-            edges = len(snap.get("edges", []))
+            nodes = snap.get("nodes", 0)
+            edges = snap.get("edges", 0)
             logger.info(f"    After chunk {idx}: {nodes} nodes, {edges} edges")
 
     # Speakers
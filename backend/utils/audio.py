@@ -3,13 +3,23 @@ Audio utilities — cropping, conversion, format detection.
 Uses imageio-ffmpeg bundled binary when system ffmpeg is not available.
 """
 
+import io
 import os
+import asyncio
+import wave
 import subprocess
 import sys
 import logging
+from typing import AsyncIterator, Optional
 
 logger = logging.getLogger("debategraph.transcription")
 
+try:
+    import webrtcvad
+    WEBRTCVAD_AVAILABLE = True
+except ImportError:
+    WEBRTCVAD_AVAILABLE = False
+
 
 def get_ffmpeg_path() -> str:
     """Get ffmpeg binary path — prefer imageio-ffmpeg (bundled), then system ffmpeg."""
@@ -144,6 +154,204 @@ def convert_to_wav(input_path: str, output_path: str = None) -> str:
     return output_path
 
 
+def find_silence_cut_points(
+    input_path: str,
+    target_seconds: float = 120.0,
+    search_seconds: float = 10.0,
+    min_silence_seconds: float = 0.1,
+    aggressiveness: int = 2,
+) -> Optional[list[float]]:
+    """
+    Pick chunk boundaries that fall in silence, so chunks don't cut words.
+
+    Every target_seconds after the previous cut, the nearest silent run of at
+    least min_silence_seconds within +/- search_seconds is used (its midpoint);
+    if there is none, the cut stays at the target. Audio is decoded to 16 kHz
+    mono PCM through an ffmpeg pipe and classified in 20 ms frames with
+    WebRTC VAD, without holding the PCM in memory.
+
+    Returns:
+        Cut times in seconds (excluding 0), or None if webrtcvad is not installed
+    """
+    if not WEBRTCVAD_AVAILABLE:
+        return None
+
+    sample_rate = 16000
+    frame_seconds = 0.02
+    frame_bytes = int(sample_rate * frame_seconds) * 2
+
+    cmd = [
+        get_ffmpeg_path(),
+        "-i", input_path,
+        "-vn",
+        "-ar", str(sample_rate),
+        "-ac", "1",
+        "-f", "s16le",
+        "pipe:1",
+    ]
+    vad = webrtcvad.Vad(aggressiveness)
+    # Silent runs as (start_frame, end_frame), end exclusive
+    silences: list[tuple[int, int]] = []
+    run_start = None
+    n_frames = 0
+
+    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+    try:
+        while True:
+            frame = proc.stdout.read(frame_bytes)
+            if len(frame) < frame_bytes:
+                break
+            if vad.is_speech(frame, sample_rate):
+                if run_start is not None:
+                    silences.append((run_start, n_frames))
+                    run_start = None
+            elif run_start is None:
+                run_start = n_frames
+            n_frames += 1
+    finally:
+        proc.stdout.close()
+        proc.wait()
+    if proc.returncode != 0:
+        raise RuntimeError(f"ffmpeg decode for VAD failed (exit {proc.returncode})")
+    if run_start is not None:
+        silences.append((run_start, n_frames))
+
+    min_frames = int(min_silence_seconds / frame_seconds)
+    midpoints = [
+        (start + end) / 2 * frame_seconds
+        for start, end in silences
+        if end - start >= min_frames
+    ]
+    duration = n_frames * frame_seconds
+
+    cuts: list[float] = []
+    snapped = 0
+    target = target_seconds
+    while target < duration:
+        nearby = [m for m in midpoints if abs(m - target) <= search_seconds]
+        if nearby:
+            cut = min(nearby, key=lambda m: abs(m - target))
+            snapped += 1
+        else:
+            cut = target
+        cuts.append(round(cut, 3))
+        target = cut + target_seconds
+
+    logger.info(
+        f"VAD cut points: {len(cuts)} cuts over {duration:.0f}s ({snapped} snapped to silence)"
+    )
+    return cuts
+
+
+async def iter_split_audio(
+    input_path: str,
+    output_dir: str,
+    segment_seconds: float = 120.0,
+    cut_points: Optional[list[float]] = None,
+    speedup: float = 1.0,
+) -> AsyncIterator[str]:
+    """
+    Split audio into MP3 chunks with one ffmpeg pass (segment muxer), yielding
+    each chunk path as soon as ffmpeg closes it (via -segment_list on stdout),
+    so callers can start on early chunks while later ones are still encoding.
+
+    Args:
+        input_path: Path to input audio/video file
+        output_dir: Directory for chunk_000.mp3, chunk_001.mp3, ...
+        segment_seconds: Fixed chunk length, used when cut_points is None
+        cut_points: Explicit chunk boundaries in seconds (e.g. from
+            find_silence_cut_points); chunk i starts at cut_points[i - 1]
+        speedup: Tempo factor applied to the chunks (atempo); boundaries are
+            given in original-audio seconds either way
+
+    Yields:
+        Chunk paths in playback order
+    """
+    ffmpeg = get_ffmpeg_path()
+    pattern = os.path.join(output_dir, "chunk_%03d.mp3")
+
+    # The segment muxer cuts on output timestamps, which atempo compresses
+    if cut_points is not None:
+        split_args = ["-segment_times", ",".join(f"{t / speedup:.3f}" for t in cut_points)]
+    else:
+        split_args = ["-segment_time", f"{segment_seconds / speedup:.3f}"]
+    if speedup != 1.0:
+        split_args = ["-filter:a", f"atempo={speedup}", *split_args]
+
+    cmd = [
+        ffmpeg,
+        "-i", input_path,
+        "-vn",
+        "-f", "segment",
+        *split_args,
+        "-reset_timestamps", "1",
+        "-segment_list", "pipe:1",
+        "-segment_list_type", "flat",
+        "-c:a", "libmp3lame",
+        "-b:a", "64k",
+        "-threads", "0",
+        "-y",
+        pattern,
+    ]
+
+    logger.info(f"Splitting audio into {segment_seconds:.0f}s chunks: {input_path}")
+    # Popen + worker threads rather than asyncio subprocesses, which the
+    # Windows selector loop (uvicorn --reload) doesn't implement
+    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    # Drain stderr alongside stdout so ffmpeg never blocks on a full pipe
+    stderr_task = asyncio.ensure_future(asyncio.to_thread(proc.stderr.read))
+    try:
+        # One line per finished chunk, so a thread hop per line is cheap
+        while line := await asyncio.to_thread(proc.stdout.readline):
+            name = line.decode(errors="replace").strip()
+            if name:
+                yield os.path.join(output_dir, os.path.basename(name))
+        await asyncio.to_thread(proc.wait)
+    finally:
+        if proc.returncode is None:
+            proc.kill()
+            await asyncio.to_thread(proc.wait)
+        stderr = await stderr_task
+        proc.stdout.close()
+        proc.stderr.close()
+
+    if proc.returncode != 0:
+        err_lines = stderr.decode(errors="replace").strip().split("\n")
+        err_tail = "\n".join(err_lines[-8:])
+        logger.error(f"ffmpeg split failed: {err_tail}")
+        raise RuntimeError(f"ffmpeg split failed: {err_tail}")
+
+
+def decode_to_wav_bytes(audio_bytes: bytes, sample_rate: int = 16000) -> bytes:
+    """
+    Decode an in-memory audio chunk to WAV 16kHz mono through an ffmpeg pipe.
+
+    ffmpeg writes raw PCM to stdout (a streamed WAV header has no valid sizes),
+    and the header is added here with the stdlib wave module.
+    """
+    cmd = [
+        get_ffmpeg_path(),
+        "-i", "pipe:0",
+        "-vn",
+        "-ar", str(sample_rate),
+        "-ac", "1",
+        "-f", "s16le",
+        "pipe:1",
+    ]
+    result = subprocess.run(cmd, input=audio_bytes, capture_output=True, timeout=60)
+    if result.returncode != 0 or not result.stdout:
+        err_tail = result.stderr.decode(errors="replace").strip()[-300:]
+        raise RuntimeError(f"ffmpeg decode failed: {err_tail}")
+
+    buf = io.BytesIO()
+    with wave.open(buf, "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(sample_rate)
+        wav.writeframes(result.stdout)
+    return buf.getvalue()
+
+
 def get_audio_duration(input_path: str) -> float:
     """Get duration of an audio file in seconds."""
     ffmpeg = get_ffmpeg_path()
@@ -0,0 +1,76 @@
+"""
+JSON serialization helpers.
+Uses orjson (C extension, emits UTF-8 bytes directly) when installed,
+falling back to the stdlib json module otherwise.
+"""
+
+import json
+import logging
+
+logger = logging.getLogger(__name__)
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    logger.info("orjson not installed. Using stdlib json (pip install orjson for faster serialization).")
+
+
+def dumps(obj) -> bytes:
+    """Serialize obj to compact UTF-8 JSON bytes (non-str dict keys are stringified)."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def dumps_line(obj) -> bytes:
+    """Serialize obj to one newline-terminated JSON line (for JSONL files)."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE)
+    return dumps(obj) + b"\n"
+
+
+def dumps_pretty(obj) -> bytes:
+    """Serialize obj to UTF-8 JSON bytes indented by two spaces (for files meant to be read)."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_INDENT_2)
+    return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
+
+
+def dumps_str(obj) -> str:
+    """Serialize obj to a compact JSON string (for text websocket frames)."""
+    return dumps(obj).decode("utf-8")
+
+
+def dumps_with_raw(obj: dict, raw: dict[str, str]) -> str:
+    """
+    Serialize obj and splice in already-serialized JSON values.
+    Each raw[key] must be a valid JSON document (e.g. from model_dump_json());
+    it is inserted verbatim under key, avoiding a parse/re-encode round trip.
+    """
+    text = dumps_str(obj)
+    if not raw:
+        return text
+    parts = [f'"{key}":{value}' for key, value in raw.items()]
+    sep = "," if len(text) > 2 else ""
+    return text[:-1] + sep + ",".join(parts) + "}"
+
+
+def json_array(items: list[str]) -> str:
+    """Join already-serialized JSON documents into a JSON array."""
+    return "[" + ",".join(items) + "]"
+
+
+def encode_message(message: dict) -> str:
+    """
+    Encode a pipeline update for the websocket.
+    Keys ending in "_json" carry pre-serialized JSON (e.g. from pydantic's
+    model_dump_json()) and are spliced in verbatim under the key without
+    the suffix: {"graph_json": "{...}"} is sent as {"graph": {...}}.
+    """
+    raw = {k[:-5]: v for k, v in message.items() if k.endswith("_json")}
+    if not raw:
+        return dumps_str(message)
+    rest = {k: v for k, v in message.items() if not k.endswith("_json")}
+    return dumps_with_raw(rest, raw)
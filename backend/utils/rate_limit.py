@@ -0,0 +1,95 @@
+"""
+Client-side rate limiting for external API calls.
+
+AsyncRateLimiter combines a token bucket (max_rate requests per time_period)
+with an optional concurrency cap, and is used as `async with limiter:`.
+call_with_backoff() retries rate-limited calls (HTTP 429 / "rate limit" /
+"quota" / "overloaded") with exponential backoff instead of failing the step.
+"""
+
+import time
+import random
+import asyncio
+import logging
+from contextlib import nullcontext
+from typing import Any, Awaitable, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+_RATE_LIMIT_MARKERS = ("rate limit", "rate_limit", "too many requests", "quota", "overloaded")
+
+
+class AsyncRateLimiter:
+    """Token bucket (max_rate per time_period) + optional max concurrent calls."""
+
+    def __init__(self, max_rate: float, time_period: float = 60.0, max_concurrent: int = 0):
+        self.max_rate = float(max_rate)
+        self.time_period = float(time_period)
+        self._tokens = self.max_rate
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+        self._sem = asyncio.Semaphore(max_concurrent) if max_concurrent > 0 else None
+
+    async def acquire(self) -> None:
+        """Wait until a request token is available, then consume it."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                refill = (now - self._updated) * self.max_rate / self.time_period
+                self._tokens = min(self.max_rate, self._tokens + refill)
+                self._updated = now
+                if self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    return
+                await asyncio.sleep((1.0 - self._tokens) * self.time_period / self.max_rate)
+
+    async def __aenter__(self):
+        if self._sem is not None:
+            await self._sem.acquire()
+        try:
+            await self.acquire()
+        except BaseException:
+            if self._sem is not None:
+                self._sem.release()
+            raise
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        if self._sem is not None:
+            self._sem.release()
+        return False
+
+
+def is_rate_limit_error(exc: BaseException) -> bool:
+    """True for 429/529 responses and provider rate-limit/quota/overload errors."""
+    status = getattr(exc, "status_code", None) or getattr(getattr(exc, "response", None), "status_code", None)
+    if status in (429, 529):
+        return True
+    text = f"{type(exc).__name__} {exc}".lower()
+    return any(marker in text for marker in _RATE_LIMIT_MARKERS)
+
+
+async def call_with_backoff(
+    limiter: Optional[AsyncRateLimiter],
+    func: Callable[..., Awaitable[Any]],
+    *args,
+    attempts: int = 3,
+    base_delay: float = 1.0,
+    **kwargs,
+) -> Any:
+    """
+    Await func(*args, **kwargs) under limiter (if any), retrying rate-limit
+    errors up to `attempts` times with exponential backoff + jitter.
+    Other exceptions propagate immediately. func is always called at least once.
+    """
+    attempts = max(1, attempts)
+    for attempt in range(attempts):
+        try:
+            async with (limiter if limiter is not None else nullcontext()):
+                return await func(*args, **kwargs)
+        except Exception as e:
+            if attempt == attempts - 1 or not is_rate_limit_error(e):
+                raise
+            delay = base_delay * (2 ** attempt) * (1.0 + random.random() * 0.25)
+            logger.warning(f"Rate limited ({e}); retry {attempt + 1}/{attempts - 1} in {delay:.1f}s")
+            await asyncio.sleep(delay)
@@ -1,5 +1,12 @@
 import { useRef, useState, useCallback, useEffect } from "react";
-import type { GraphSnapshot, TranscriptionResult } from "../types";
+import type {
+  FactCheckResult,
+  FallacyAnnotation,
+  GraphEdge,
+  GraphNode,
+  GraphSnapshot,
+  TranscriptionResult,
+} from "../types";
 
 export type LiveStreamStatus =
   | "idle"
@@ -28,6 +35,65 @@ interface UseLiveStreamOptions {
   onError?: (error: string) => void;
 }
 
+const EMPTY_GRAPH: GraphSnapshot = { nodes: [], edges: [], rigor_scores: [], cycles_detected: [] };
+
+/**
+ * Apply one streamed graph event (node_added / edge_added / fallacy_added /
+ * factcheck_added) to the current graph. Nodes are upserted by id and
+ * edges by (source, target), so a re-sent event never duplicates one; events
+ * for unknown claims are ignored. Rigor scores and cycles arrive on the
+ * "stats" tick that closes each batch.
+ */
+function applyGraphEvent(
+  prev: GraphSnapshot | null,
+  msg: Record<string, unknown>
+): GraphSnapshot {
+  const graph = prev ?? EMPTY_GRAPH;
+  switch (msg.type) {
+    case "node_added": {
+      const node = msg.node as GraphNode;
+      const idx = graph.nodes.findIndex((n) => n.id === node.id);
+      const nodes = idx === -1
+        ? [...graph.nodes, node]
+        : graph.nodes.map((n, i) => (i === idx ? node : n));
+      return { ...graph, nodes };
+    }
+    case "edge_added": {
+      // Edges are keyed by (source, target), as in the backend's DiGraph
+      const edge = msg.edge as GraphEdge;
+      const idx = graph.edges.findIndex(
+        (e) => e.source === edge.source && e.target === edge.target
+      );
+      const edges = idx === -1
+        ? [...graph.edges, edge]
+        : graph.edges.map((e, i) => (i === idx ? edge : e));
+      return { ...graph, edges };
+    }
+    case "fallacy_added": {
+      const fallacy = msg.fallacy as FallacyAnnotation;
+      return {
+        ...graph,
+        nodes: graph.nodes.map((n) =>
+          n.id === msg.claim_id ? { ...n, fallacies: [...n.fallacies, fallacy] } : n
+        ),
+      };
+    }
+    case "factcheck_added": {
+      const factcheck = msg.factcheck as FactCheckResult;
+      return {
+        ...graph,
+        nodes: graph.nodes.map((n) =>
+          n.id === msg.claim_id
+            ? { ...n, factcheck, factcheck_verdict: factcheck.verdict }
+            : n
+        ),
+      };
+    }
+    default:
+      return graph;
+  }
+}
+
 /**
  * Hook for managing a live streaming WebSocket session.
  *
@@ -60,6 +126,9 @@ export function useLiveStream(options: UseLiveStreamOptions = {}) {
   });
 
   const wsRef = useRef<WebSocket | null>(null);
+  // Latest graph/transcript, kept in refs so deltas merge synchronously
+  const graphRef = useRef<GraphSnapshot | null>(null);
+  const transcriptionRef = useRef<TranscriptionResult | null>(null);
   const sessionIdRef = useRef<string>(
     Math.random().toString(36).slice(2, 10)
   );
@@ -149,23 +218,47 @@ export function useLiveStream(options: UseLiveStreamOptions = {}) {
         case "transcription_update":
           // Partial transcription update — update transcript display
           if (msg.new_segments) {
-            setState((prev) => {
-              const existingSegs = prev.transcription?.segments ?? [];
-              const newSegs = msg.new_segments as TranscriptionResult["segments"];
-              const allSegs = [...existingSegs, ...newSegs];
-              return {
-                ...prev,
-                transcription: {
-                  segments: allSegs,
-                  language: "en",
-                  num_speakers: new Set(allSegs.map((s) => s.speaker)).size,
-                },
-                lastUpdate: Date.now(),
-              };
-            });
+            const existingSegs = transcriptionRef.current?.segments ?? [];
+            const newSegs = msg.new_segments as TranscriptionResult["segments"];
+            const allSegs = [...existingSegs, ...newSegs];
+            const transcription: TranscriptionResult = {
+              segments: allSegs,
+              language: "en",
+              num_speakers: new Set(allSegs.map((s) => s.speaker)).size,
+            };
+            transcriptionRef.current = transcription;
+            updateState({ transcription, lastUpdate: Date.now() });
           }
           break;
 
+        case "node_added":
+        case "edge_added":
+        case "fallacy_added":
+        case "factcheck_added":
+          // Object events are applied silently; the stats tick publishes them
+          graphRef.current = applyGraphEvent(graphRef.current, msg);
+          break;
+
+        case "stats": {
+          const graph: GraphSnapshot = {
+            ...(graphRef.current ?? EMPTY_GRAPH),
+            rigor_scores: (msg.rigor_scores as GraphSnapshot["rigor_scores"]) ?? [],
+            cycles_detected: (msg.cycles_detected as GraphSnapshot["cycles_detected"]) ?? [],
+          };
+          graphRef.current = graph;
+
+          setState((prev) => ({
+            ...prev,
+            graph,
+            nodeCount: graph.nodes.length,
+            status: "recording",
+            lastUpdate: Date.now(),
+          }));
+
+          onGraphUpdate?.(graph, transcriptionRef.current);
+          break;
+        }
+
         case "graph_update": {
           const graph = msg.graph as GraphSnapshot;
           const transcriptionData = msg.transcription as {
@@ -181,6 +274,9 @@ export function useLiveStream(options: UseLiveStreamOptions = {}) {
               }
             : null;
 
+          graphRef.current = graph;
+          if (transcription) transcriptionRef.current = transcription;
+
           setState((prev) => ({
             ...prev,
             graph,
@@ -194,6 +290,11 @@ export function useLiveStream(options: UseLiveStreamOptions = {}) {
           break;
         }
 
+        case "chunk_processed":
+          // Chunk added nothing to the graph — transcript already applied
+          updateState({ status: "recording", lastUpdate: Date.now() });
+          break;
+
         case "finalizing":
           updateState({ status: "finalizing" });
           break;
@@ -213,6 +314,9 @@ export function useLiveStream(options: UseLiveStreamOptions = {}) {
               }
             : null;
 
+          graphRef.current = graph;
+          if (transcription) transcriptionRef.current = transcription;
+
           setState((prev) => ({
             ...prev,
             status: "complete",
@@ -273,6 +377,8 @@ export function useLiveStream(options: UseLiveStreamOptions = {}) {
     wsRef.current?.close();
     wsRef.current = null;
     sessionIdRef.current = Math.random().toString(36).slice(2, 10);
+    graphRef.current = null;
+    transcriptionRef.current = null;
     setState({
       status: "idle",
       graph: null,